@@ -0,0 +1,4 @@
+"""Load tests that drive the real router over HTTP against a local mock upstream.
+
+Run ``python -m benchmarks`` (or ``make bench``); see ``benchmarks/__main__.py``.
+"""
@@ -0,0 +1,271 @@
+"""Benchmark the router against a local mock upstream and compare to a baseline.
+
+Starts the mock upstream and the real app under uvicorn as subprocesses, runs
+each scenario with a closed-loop load generator and prints one JSON report.
+With ``--baseline``, exits with status 1 when throughput, router overhead or
+time to first token regressed by more than ``--tolerance``.
+
+    python -m benchmarks --duration 10 --concurrency 50
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from benchmarks.load import (
+    PeakMemory,
+    generate_load,
+    histogram_quantile,
+    parse_histogram,
+    percentile,
+    rss_bytes,
+)
+from benchmarks.mock_upstream import Profile
+
+MODEL = "mock/bench"
+OVERHEAD_HISTOGRAM = "model_router_overhead_seconds"
+
+# Metrics compared against the baseline, and whether higher values are better
+COMPARED_METRICS = {
+    "rps": True,
+    "router_overhead_p50_ms": False,
+    "router_overhead_p99_ms": False,
+    "ttft_p99_ms": False,
+}
+
+
+@dataclass
+class Scenario:
+    name: str
+    profile: Profile
+    stream: bool = False
+
+
+SCENARIOS = [
+    Scenario("completion", Profile(latency="fixed:50", tokens_per_second=1e6)),
+    Scenario(
+        "stream",
+        Profile(latency="lognormal:50:0.5", completion_tokens=50),
+        stream=True,
+    ),
+    Scenario(
+        "errors", Profile(latency="fixed:50", tokens_per_second=1e6, error_rate=0.05)
+    ),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url: str, timeout_seconds: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1).raise_for_status()
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{url} did not become ready")
+
+
+def start_mock_upstream(port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.mock_upstream", "--port", str(port)]
+    )
+    wait_until_ready(f"http://127.0.0.1:{port}/_profile")
+    return process
+
+
+def start_router(port: int, upstream_port: int) -> subprocess.Popen:
+    """Run the app as deployed, with every request going to the mock upstream."""
+    provider = {
+        "name": "Mock",
+        "prefix": "mock",
+        "base_url": f"http://127.0.0.1:{upstream_port}/v1",
+        "models": ["bench"],
+    }
+    env = {
+        **os.environ,
+        "TESTING": "false",
+        "OPENAI_COMPATIBLE_PROVIDERS": json.dumps([provider]),
+        "MOCK_API_KEY": "bench",
+        "RESPONSE_CACHE_ENABLED": "false",
+        "SINGLE_FLIGHT_ENABLED": "false",
+        # Measure throughput rather than how much the pod sheds on a shared host
+        "ADMISSION_MAX_EVENT_LOOP_LAG_SECONDS": "0",
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "model_router.main:app",
+            "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    wait_until_ready(f"http://127.0.0.1:{port}/health")
+    return process
+
+
+def milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+async def run_scenario(
+    scenario: Scenario,
+    router_url: str,
+    upstream_url: str,
+    router_pid: int,
+    concurrency: int,
+    duration_seconds: float,
+    warmup_seconds: float,
+) -> dict:
+    body = {
+        "model": MODEL,
+        "messages": [{"role": "user", "content": "Benchmark prompt"}],
+        "stream": scenario.stream,
+    }
+    async with httpx.AsyncClient() as client:
+        await client.put(f"{upstream_url}/_profile", json=asdict(scenario.profile))
+        # Open upstream connections and settle caches before measuring
+        if warmup_seconds > 0:
+            await generate_load(router_url, body, concurrency, warmup_seconds)
+        before = parse_histogram(
+            (await client.get(f"{router_url}/metrics")).text, OVERHEAD_HISTOGRAM
+        )
+
+        idle_rss = rss_bytes(router_pid)
+        async with PeakMemory(router_pid) as memory:
+            result = await generate_load(
+                router_url, body, concurrency, duration_seconds
+            )
+
+        after = parse_histogram(
+            (await client.get(f"{router_url}/metrics")).text, OVERHEAD_HISTOGRAM
+        )
+
+    total = result.succeeded + result.failed
+    memory_per_request = None
+    if idle_rss is not None:
+        memory_per_request = max(memory.peak - idle_rss, 0) / concurrency / 1024
+    return {
+        "requests": total,
+        "rps": round(result.succeeded / result.elapsed, 1),
+        "error_rate": round(result.failed / total, 4) if total else None,
+        "latency_p50_ms": milliseconds(percentile(result.latencies, 0.5)),
+        "latency_p99_ms": milliseconds(percentile(result.latencies, 0.99)),
+        "router_overhead_p50_ms": milliseconds(
+            histogram_quantile(before, after, 0.5)
+        ),
+        "router_overhead_p99_ms": milliseconds(
+            histogram_quantile(before, after, 0.99)
+        ),
+        "ttft_p50_ms": milliseconds(percentile(result.times_to_first_token, 0.5)),
+        "ttft_p99_ms": milliseconds(percentile(result.times_to_first_token, 0.99)),
+        "memory_per_in_flight_kb": (
+            round(memory_per_request, 1) if memory_per_request is not None else None
+        ),
+    }
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float
+) -> list[str]:
+    """Describe every compared metric that is worse than the baseline allows."""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            current = metrics.get(metric)
+            expected = baseline.get(name, {}).get(metric)
+            if current is None or not expected:
+                continue
+            change = (current - expected) / expected
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    f"{name}.{metric}: {current} vs baseline {expected} "
+                    f"({change:+.1%})"
+                )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict]:
+    upstream_port, router_port = free_port(), free_port()
+    upstream = start_mock_upstream(upstream_port)
+    try:
+        router = start_router(router_port, upstream_port)
+        try:
+            results = {}
+            for scenario in SCENARIOS:
+                if args.scenario and scenario.name not in args.scenario:
+                    continue
+                results[scenario.name] = await run_scenario(
+                    scenario,
+                    f"http://127.0.0.1:{router_port}",
+                    f"http://127.0.0.1:{upstream_port}",
+                    router.pid,
+                    args.concurrency,
+                    args.duration,
+                    args.warmup,
+                )
+            return results
+        finally:
+            router.terminate()
+            router.wait()
+    finally:
+        upstream.terminate()
+        upstream.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Run only this scenario; may be repeated",
+    )
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare to")
+    parser.add_argument("--save-baseline", type=Path, help="Write results here")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed relative regression before failing (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
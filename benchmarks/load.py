@@ -0,0 +1,158 @@
+"""Closed-loop load generator and the statistics reported from a run."""
+
+import asyncio
+import math
+import re
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+
+@dataclass
+class LoadResult:
+    """Outcome of every request sent during one run."""
+
+    elapsed: float = 0.0
+    succeeded: int = 0
+    failed: int = 0
+    latencies: list[float] = field(default_factory=list)
+    times_to_first_token: list[float] = field(default_factory=list)
+
+
+async def _send(
+    client: httpx.AsyncClient, body: dict, result: LoadResult
+) -> None:
+    started = time.perf_counter()
+    first_token = None
+    async with client.stream("POST", "/v1/chat/completions", json=body) as response:
+        async for line in response.aiter_lines():
+            if first_token is None and line.startswith("data:"):
+                first_token = time.perf_counter()
+    ended = time.perf_counter()
+
+    if response.status_code != 200:
+        result.failed += 1
+        return
+    result.succeeded += 1
+    result.latencies.append(ended - started)
+    if body.get("stream") and first_token is not None:
+        result.times_to_first_token.append(first_token - started)
+
+
+async def generate_load(
+    base_url: str,
+    body: dict,
+    concurrency: int,
+    duration_seconds: float,
+    api_key: str = "test-key",
+) -> LoadResult:
+    """Keep ``concurrency`` requests in flight for ``duration_seconds``.
+
+    Each worker sends its next request as soon as the previous one finished, so
+    the throughput measured is what the router sustains at that concurrency.
+    """
+    result = LoadResult()
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {api_key}"},
+        limits=limits,
+        timeout=60,
+    ) as client:
+        started = time.perf_counter()
+        stop_at = started + duration_seconds
+
+        async def worker() -> None:
+            while time.perf_counter() < stop_at:
+                try:
+                    await _send(client, body, result)
+                except httpx.HTTPError:
+                    result.failed += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        result.elapsed = time.perf_counter() - started
+    return result
+
+
+def percentile(values: list[float], quantile: float) -> float | None:
+    """Nearest-rank percentile, or None without samples."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(quantile * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def parse_histogram(metrics: str, name: str) -> dict[float, float]:
+    """Cumulative bucket counts of a Prometheus histogram, summed over labels."""
+    buckets: dict[float, float] = {}
+    pattern = re.compile(
+        rf'^{re.escape(name)}_bucket{{.*?le="([^"]+)".*?}} (\S+)$', re.MULTILINE
+    )
+    for le, count in pattern.findall(metrics):
+        bound = math.inf if le == "+Inf" else float(le)
+        buckets[bound] = buckets.get(bound, 0.0) + float(count)
+    return buckets
+
+
+def histogram_quantile(
+    before: dict[float, float], after: dict[float, float], quantile: float
+) -> float | None:
+    """Quantile of the observations made between two scrapes of a histogram.
+
+    Interpolates linearly within the bucket, as Prometheus' histogram_quantile
+    does; observations in the +Inf bucket report the largest finite bound.
+    """
+    bounds = sorted(after)
+    counts = [after[bound] - before.get(bound, 0.0) for bound in bounds]
+    if not counts or counts[-1] <= 0:
+        return None
+    rank = quantile * counts[-1]
+    lower, below = 0.0, 0.0
+    for bound, cumulative in zip(bounds, counts, strict=True):
+        if cumulative >= rank:
+            if bound == math.inf:
+                return lower
+            in_bucket = cumulative - below
+            share = (rank - below) / in_bucket if in_bucket else 1.0
+            return lower + (bound - lower) * share
+        lower, below = bound, cumulative
+    return lower
+
+
+def rss_bytes(pid: int) -> int | None:
+    """Resident memory of a process, where ``/proc`` is available."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class PeakMemory:
+    """Samples the peak resident memory of a process in the background."""
+
+    def __init__(self, pid: int, interval_seconds: float = 0.05):
+        self._pid = pid
+        self._interval_seconds = interval_seconds
+        self.peak = rss_bytes(pid) or 0
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "PeakMemory":
+        self._task = asyncio.create_task(self._sample())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._task.cancel()
+
+    async def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, rss_bytes(self._pid) or 0)
+            await asyncio.sleep(self._interval_seconds)
+
@@ -0,0 +1,287 @@
+"""Microbenchmarks for each piece of per-request work on the router's hot path.
+
+Every benchmark is timed in-process with ``timeit``. The report ranks them by
+their share of one typical request's CPU time, so the pieces that dominate the
+router's budget stand out. Each run is appended to a history file and compared
+with the previous one.
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter request_validation --repeat 7
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import time
+import timeit
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_HISTORY = Path(__file__).parent / "results" / "micro.jsonl"
+
+
+@dataclass
+class Benchmark:
+    """One piece of per-request work.
+
+    ``per_request`` is how many times a typical request does it; variants that
+    a typical request does not hit have 0 and are reported but not ranked.
+    """
+
+    name: str
+    run: Callable[[], object]
+    per_request: int = 1
+    is_async: bool = False
+
+
+def request_body(messages: int, chars: int) -> bytes:
+    return json.dumps({
+        "model": "openai/gpt-4o-mini",
+        "messages": [
+            {"role": "user" if index % 2 else "assistant", "content": "x" * chars}
+            for index in range(messages)
+        ],
+        "max_tokens": 256,
+    }).encode()
+
+
+def authorized_scope(token: str = "test-key") -> dict:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/v1/chat/completions",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    }
+
+
+def body_receiver(body: bytes) -> Callable[[], Awaitable[dict]]:
+    async def receive() -> dict:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return receive
+
+
+def create_benchmarks() -> list[Benchmark]:
+    """Set up the app's services as the server does and bind each benchmark."""
+    # Mock adapters only, as the benchmarks never call an upstream
+    os.environ.setdefault("TESTING", "true")
+
+    import inject
+    from starlette.requests import Request
+
+    import model_router.logger as logger_module
+    from model_router.api import routes
+    from model_router.domain.call_context import CallContext
+    from model_router.domain.models import ChatCompletionResponse
+    from model_router.main_configuration import (
+        initialize_sample_data,
+        main_configuration,
+    )
+    from model_router.services.request_metrics import instruments_for
+    from model_router.tracing import tracer
+
+    inject.configure_once(main_configuration)
+    asyncio.run(initialize_sample_data())
+
+    logger = logger_module.get_logger("benchmarks.micro")
+    # Keep formatting records on the listener thread, but drop the output
+    devnull = open(os.devnull, "w")  # noqa: SIM115
+    for handler in logger_module._listener.handlers:
+        handler.setStream(devnull)
+
+    def open_span() -> None:
+        with tracer.span("bench"):
+            pass
+
+    router_service = routes.router_service
+    adapter = router_service.get_provider_for_model("openai/gpt-4o-mini")
+    call_context = CallContext(user_id="user")
+    response = ChatCompletionResponse(
+        id="chatcmpl-bench",
+        object="chat.completion",
+        created=int(time.time()),
+        model="gpt-4o-mini",
+        choices=[{
+            "index": 0,
+            "message": {"role": "assistant", "content": "x" * 1000},
+            "finish_reason": "stop",
+        }],
+        usage={"prompt_tokens": 100, "completion_tokens": 250, "total_tokens": 350},
+    )
+    response_fields = response.model_dump()
+    instruments = instruments_for(CallContext(model="openai/gpt-4o-mini"))
+
+    benchmarks = [
+        Benchmark(
+            "get_call_context",
+            lambda: routes.get_call_context(Request(authorized_scope())),
+            is_async=True,
+        ),
+        Benchmark("call_context", CallContext),
+        Benchmark(
+            "get_provider_for_model",
+            lambda: router_service.get_provider_for_model("openai/gpt-4o-mini"),
+        ),
+        Benchmark(
+            "get_targets_for_model",
+            lambda: router_service.get_targets_for_model("openai/gpt-4o-mini"),
+        ),
+        Benchmark(
+            "extract_model_name",
+            lambda: adapter.extract_model_name("openai/gpt-4o-mini"),
+        ),
+        Benchmark(
+            "response_construction",
+            lambda: ChatCompletionResponse(**response_fields),
+        ),
+        Benchmark("response_serialization", response.model_dump_json),
+        Benchmark(
+            "request_metrics",
+            lambda: instruments.observe_request(200, 0.5, 0.1, 0.09, False),
+        ),
+        Benchmark("tracing_span", open_span),
+        # The route, router service, token and user services each log once
+        Benchmark(
+            "log_info_hot_path",
+            lambda: logger.info(
+                "Routing chat completion for model: %s",
+                "openai/gpt-4o-mini",
+                call_context=call_context,
+                hot_path=True,
+            ),
+            per_request=4,
+        ),
+        Benchmark(
+            "log_info",
+            lambda: logger.info("Chat completion done", call_context=call_context),
+            per_request=0,
+        ),
+        Benchmark(
+            "log_debug_disabled",
+            lambda: logger.debug("Not logged", call_context=call_context),
+            per_request=0,
+        ),
+    ]
+    for messages, chars in ((1, 100), (10, 100), (10, 2000), (100, 100)):
+        receiver = body_receiver(request_body(messages, chars))
+        benchmarks.append(Benchmark(
+            f"request_validation[messages={messages},chars={chars}]",
+            lambda receive=receiver: routes.parse_chat_request(
+                Request(authorized_scope(), receive)
+            ),
+            per_request=int((messages, chars) == (10, 100)),
+            is_async=True,
+        ))
+    return benchmarks
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int, min_seconds: float) -> float:
+    """Best time per call in nanoseconds over ``repeat`` rounds.
+
+    Each round runs enough calls to last at least ``min_seconds``; async work is
+    looped inside one coroutine so event loop start-up is not measured.
+    """
+    if benchmark.is_async:
+        loop = asyncio.new_event_loop()
+        make: Callable[[], Awaitable] = benchmark.run
+
+        async def batch(number: int) -> None:
+            for _ in range(number):
+                await make()
+
+        def run_batch(number: int) -> float:
+            started = time.perf_counter()
+            loop.run_until_complete(batch(number))
+            return time.perf_counter() - started
+
+        try:
+            number = 1
+            while run_batch(number) < min_seconds:
+                number *= 2
+            best = min(run_batch(number) for _ in range(repeat))
+        finally:
+            loop.close()
+        return best / number * 1e9
+
+    timer = timeit.Timer(benchmark.run)
+    number = 1
+    while timer.timeit(number) < min_seconds:
+        number *= 2
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def last_run(history: Path) -> dict[str, float]:
+    if not history.exists():
+        return {}
+    lines = history.read_text().splitlines()
+    return json.loads(lines[-1])["results"] if lines else {}
+
+
+def report(
+    benchmarks: list[Benchmark], results: dict[str, float], previous: dict[str, float]
+) -> str:
+    costs = {b.name: results[b.name] * b.per_request for b in benchmarks}
+    budget = sum(costs.values())
+    ranked = sorted(benchmarks, key=lambda b: (-costs[b.name], -results[b.name]))
+
+    lines = [f"{'benchmark':<48} {'ns/op':>10} {'share':>7} {'change':>8}"]
+    for benchmark in ranked:
+        name = benchmark.name
+        share = f"{costs[name] / budget:.1%}" if benchmark.per_request else "-"
+        change = "-"
+        if previous.get(name):
+            change = f"{results[name] / previous[name] - 1:+.1%}"
+        lines.append(f"{name:<48} {results[name]:>10.0f} {share:>7} {change:>8}")
+    lines.append(f"{'typical request':<48} {budget:>10.0f}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", help="Run only benchmarks whose name has this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-seconds", type=float, default=0.1)
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument(
+        "--no-history", action="store_true", help="Do not record this run"
+    )
+    args = parser.parse_args()
+
+    benchmarks = [
+        benchmark for benchmark in create_benchmarks()
+        if not args.filter or args.filter in benchmark.name
+    ]
+    results = {
+        benchmark.name: round(
+            time_benchmark(benchmark, args.repeat, args.min_seconds), 1
+        )
+        for benchmark in benchmarks
+    }
+    print(report(benchmarks, results, last_run(args.history)))
+
+    if not args.no_history:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"time": time.time(), "commit": git_commit(), "results": results}
+        with args.history.open("a") as history:
+            history.write(json.dumps(entry) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""OpenAI-compatible mock upstream with configurable latency, streaming and errors.
+
+The behaviour is a ``Profile`` that the benchmark runner replaces between
+scenarios with ``PUT /_profile``, so one server process serves every scenario.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import asdict, dataclass
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+
+def latency_sampler(spec: str) -> Callable[[], float]:
+    """Sampler of upstream latencies in seconds from a spec in milliseconds.
+
+    ``fixed:MS``, ``uniform:LOW:HIGH`` or ``lognormal:MEDIAN:SIGMA``.
+    """
+    kind, *args = spec.split(":")
+    values = [float(arg) for arg in args]
+    if kind == "fixed" and len(values) == 1:
+        return lambda: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda: random.uniform(*values) / 1000
+    if kind == "lognormal" and len(values) == 2:
+        mu = math.log(values[0])
+        return lambda: random.lognormvariate(mu, values[1]) / 1000
+    raise ValueError(f"Invalid latency spec: {spec}")
+
+
+@dataclass
+class Profile:
+    """How the mock answers: latency before the first byte, stream rate, errors."""
+
+    latency: str = "fixed:50"
+    completion_tokens: int = 50
+    tokens_per_second: float = 500.0
+    error_rate: float = 0.0
+    error_status: int = 500
+
+
+class MockUpstream:
+    """Serves ``/v1/chat/completions`` the way an OpenAI-compatible vendor does."""
+
+    def __init__(self, profile: Profile | None = None):
+        self.set_profile(profile or Profile())
+        self.app = Starlette(routes=[
+            Route("/v1/chat/completions", self.chat_completions, methods=["POST"]),
+            Route("/_profile", self.profile, methods=["GET", "PUT"]),
+        ])
+
+    def set_profile(self, profile: Profile) -> None:
+        self._profile = profile
+        self._latency = latency_sampler(profile.latency)
+
+    async def profile(self, request: Request) -> Response:
+        if request.method == "PUT":
+            self.set_profile(Profile(**await request.json()))
+        return JSONResponse(asdict(self._profile))
+
+    async def chat_completions(self, request: Request) -> Response:
+        body = await request.json()
+        profile = self._profile
+        await asyncio.sleep(self._latency())
+
+        if random.random() < profile.error_rate:
+            return JSONResponse(
+                {"error": {"message": "Injected error", "type": "server_error"}},
+                status_code=profile.error_status,
+            )
+
+        model = body["model"]
+        prompt_tokens = sum(
+            len(str(message.get("content", ""))) // 4 + 1
+            for message in body.get("messages", [])
+        )
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": profile.completion_tokens,
+            "total_tokens": prompt_tokens + profile.completion_tokens,
+        }
+        if body.get("stream"):
+            return StreamingResponse(
+                self._stream(model, usage, profile), media_type="text/event-stream"
+            )
+
+        await asyncio.sleep(profile.completion_tokens / profile.tokens_per_second)
+        return JSONResponse({
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": "x " * profile.completion_tokens,
+                },
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        })
+
+    async def _stream(
+        self, model: str, usage: dict, profile: Profile
+    ) -> AsyncGenerator[str]:
+        created = int(time.time())
+        interval = 1 / profile.tokens_per_second
+        for index in range(profile.completion_tokens):
+            if index:
+                await asyncio.sleep(interval)
+            chunk = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": {"content": "x "}, "finish_reason": None}
+                ],
+            }
+            yield f"data: {json.dumps(chunk)}\n\n"
+        last = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+        yield f"data: {json.dumps(last)}\n\n"
+        yield "data: [DONE]\n\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", default=Profile.latency)
+    parser.add_argument(
+        "--completion-tokens", type=int, default=Profile.completion_tokens
+    )
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=Profile.tokens_per_second
+    )
+    parser.add_argument("--error-rate", type=float, default=Profile.error_rate)
+    parser.add_argument("--error-status", type=int, default=Profile.error_status)
+    args = parser.parse_args()
+
+    upstream = MockUpstream(Profile(
+        latency=args.latency,
+        completion_tokens=args.completion_tokens,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    ))
+    uvicorn.run(upstream.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""ASGI middleware for the model router."""
+
+import json
+import math
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from model_router.services.admission_controller import AdmissionController
+from model_router.services.request_metrics import instruments_for
+from model_router.tracing import TRACEPARENT_HEADER, current_span, tracer
+
+
+class AdmissionMiddleware:
+    """Answers 503 to new requests on the given paths while the pod is saturated.
+
+    Admitted requests are counted until their response, streamed or not, has
+    been sent. Other paths, such as ``/health``, are never shed.
+    """
+
+    def __init__(
+        self, app: ASGIApp, controller: AdmissionController, paths: tuple[str, ...]
+    ):
+        self.app = app
+        self._controller = controller
+        self._paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self._paths:
+            await self.app(scope, receive, send)
+            return
+
+        reason = self._controller.try_admit()
+        if reason is not None:
+            await self._reject(send, reason)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._controller.release()
+
+    async def _reject(self, send: Send, reason: str) -> None:
+        body = json.dumps({
+            "detail": f"Service overloaded ({reason}), retry later"
+        }).encode()
+        retry_after = str(math.ceil(self._controller.retry_after_seconds))
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", retry_after.encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class RequestMetricsMiddleware:
+    """Records status, latency and time to first byte of requests on the given paths.
+
+    The route stores its CallContext in the request state, which tells which model
+    served the request and how long its upstream attempts took.
+    """
+
+    def __init__(self, app: ASGIApp, paths: tuple[str, ...]):
+        self.app = app
+        self._paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self._paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        first_byte = 0.0
+        streamed = False
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status, first_byte, streamed
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streamed = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message["headers"]
+                )
+            elif not first_byte and message.get("body"):
+                first_byte = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            ended = time.perf_counter()
+            call_context = scope.get("state", {}).get("call_context")
+            instruments = instruments_for(call_context)
+            instruments.observe_request(
+                status,
+                ended - started,
+                (first_byte or ended) - started,
+                call_context.upstream_seconds if call_context else 0.0,
+                streamed,
+            )
+            if call_context and call_context.error_type:
+                instruments.observe_error(call_context.error_type)
+
+
+class TracingMiddleware:
+    """Wraps requests on the given paths in a root span until their last byte.
+
+    The span joins the caller's trace when the request carries a W3C
+    ``traceparent`` header, and every span of the request becomes its child.
+    """
+
+    def __init__(self, app: ASGIApp, paths: tuple[str, ...]):
+        self.app = app
+        self._paths = paths
+        self._traceparent_header = TRACEPARENT_HEADER.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] not in self._paths
+            or not tracer.enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = next(
+            (
+                value.decode("latin-1")
+                for name, value in scope["headers"]
+                if name == self._traceparent_header
+            ),
+            None,
+        )
+        span = tracer.start_span(
+            f"{scope['method']} {scope['path']}", traceparent=traceparent
+        )
+        status = 500
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = current_span.set(span)
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            current_span.reset(token)
+            call_context = scope.get("state", {}).get("call_context")
+            if call_context is not None:
+                span.set_attribute("request_id", call_context.request_id)
+                span.set_attribute("user_id", call_context.user_id)
+                span.set_attribute("model", call_context.model)
+            span.set_attribute("status_code", status)
+            if status >= 500:
+                span.status = "error"
+            span.end()
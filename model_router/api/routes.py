@@ -1,35 +1,199 @@
 """API routes for model router."""
 
+import asyncio
+import hashlib
+import json
+import math
+from collections.abc import AsyncGenerator, Awaitable, Callable, Hashable
+from typing import NoReturn
 
+import anyio
+import inject
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 
 from model_router.config import config
 from model_router.domain.call_context import CallContext
 from model_router.domain.exceptions import (
     ModelNotSupportedError,
+    ModelRouterException,
     ProviderAPIError,
     ProviderNotConfiguredError,
     ProviderNotFoundError,
+    ProviderRateLimitError,
+    ProviderTimeoutError,
+    ProviderUnavailableError,
+    RateLimitExceededError,
 )
 from model_router.domain.models import (
     ChatCompletionRequest,
     ChatCompletionResponse,
     ProviderInfo,
+    RawChatCompletion,
 )
 from model_router.domain.providers import ProviderName
+from model_router.domain.user import User
 from model_router.logger import get_logger
+from model_router.metrics import CONTENT_TYPE, registry
 from model_router.services.adapters.anthropic import (
     AnthropicAdapter,
     MockAnthropicAdapter,
 )
-from model_router.services.adapters.deepseek import DeepSeekAdapter, MockDeepSeekAdapter
-from model_router.services.adapters.groq import GroqAdapter, MockGroqAdapter
+from model_router.services.adapters.base import ProviderAdapter
+from model_router.services.adapters.deepseek import (
+    DEEPSEEK_PROVIDER,
+    MockDeepSeekAdapter,
+)
+from model_router.services.adapters.groq import GROQ_PROVIDER, MockGroqAdapter
 from model_router.services.adapters.openai import MockOpenAIAdapter, OpenAIAdapter
-from model_router.services.model_router import ModelRouterService
-from model_router.main_configuration import get_user_token_service
-from model_router.services.user_token_service import UserTokenService
+from model_router.services.adapters.openai_compatible import OpenAICompatibleAdapter
+from model_router.services.admission_controller import AdmissionController
+from model_router.services.circuit_breaker import CircuitBreaker
+from model_router.services.fair_queue import FairQueue
+from model_router.services.http_pool import http_pool
+from model_router.services.latency_tracker import LatencyTracker
+from model_router.services.model_router import (
+    CACHE_STATUS_HEADER,
+    ModelRouterService,
+    estimate_prompt_tokens,
+)
+from model_router.services.rate_limiter import RateLimiter, RoleLimits
+from model_router.services.request_metrics import instruments_for, usage_from_chunk
+from model_router.services.response_cache_service import ResponseCacheService
+from model_router.services.routing_engine import RoutingEngine
+from model_router.services.single_flight import SingleFlight
 from model_router.services.user_service import UserService
-import inject
+from model_router.services.user_token_service import UserTokenService
+from model_router.storages.rate_limit_storage import (
+    InMemoryRateLimitStorage,
+    RedisRateLimitStorage,
+)
+from model_router.storages.response_cache_storage import (
+    FileResponseCacheStorage,
+    InMemoryResponseCacheStorage,
+)
+from model_router.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    SpanExporter,
+    tracer,
+)
+
+CACHE_OPT_IN_HEADER = "x-router-cache"
+CAPABILITY_HEADER = "x-router-capability"
+LATENCY_SLO_HEADER = "x-router-latency-slo"
+TIMEOUT_HEADER = "x-router-timeout"
+# Non-standard status logged for requests the client abandoned, as nginx does
+CLIENT_CLOSED_REQUEST = 499
+
+CLIENT_DISCONNECTS = registry.counter(
+    "model_router_client_disconnects_total",
+    "Requests whose upstream call was cancelled because the client went away",
+    ("phase",),
+)
+SAVED_TOKENS = registry.counter(
+    "model_router_disconnect_saved_tokens_total",
+    "Completion tokens of max_tokens not generated thanks to disconnect cancellation",
+    ("phase",),
+)
+
+
+def create_response_cache() -> ResponseCacheService | None:
+    """Create the response cache for the configured backend."""
+    if not config.response_cache_enabled:
+        return None
+
+    if config.response_cache_backend == "file":
+        storage = FileResponseCacheStorage(
+            config.response_cache_dir, config.response_cache_max_entries
+        )
+    else:
+        storage = InMemoryResponseCacheStorage(config.response_cache_max_entries)
+
+    return ResponseCacheService(storage, config.response_cache_ttl_seconds)
+
+
+def create_rate_limiter() -> RateLimiter:
+    """Create the per-user rate limiter for the configured backend."""
+    if config.rate_limit_backend == "redis":
+        storage = RedisRateLimitStorage(url=config.rate_limit_redis_url)
+    else:
+        storage = InMemoryRateLimitStorage()
+
+    limits = {role: RoleLimits(**values) for role, values in config.rate_limits.items()}
+    return RateLimiter(storage, limits, config.rate_limit_default_role)
+
+
+def create_admission_controller() -> AdmissionController:
+    """Create the admission controller from configuration."""
+    return AdmissionController(
+        max_event_loop_lag_seconds=config.admission_max_event_loop_lag_seconds,
+        max_in_flight=config.admission_max_in_flight,
+        probe_interval_seconds=config.admission_probe_interval_seconds,
+        retry_after_seconds=config.admission_retry_after_seconds,
+    )
+
+
+def create_span_exporter() -> SpanExporter | None:
+    """Create the span exporter for the configured backend, if tracing is on."""
+    if config.tracing_exporter == "file":
+        return FileSpanExporter(config.tracing_file_path)
+    if config.tracing_exporter == "memory":
+        return InMemorySpanExporter()
+    return None
+
+
+def create_circuit_breaker(name: str) -> CircuitBreaker:
+    """Create a circuit breaker for one provider from configuration."""
+    return CircuitBreaker(
+        name,
+        window_seconds=config.circuit_window_seconds,
+        min_requests=config.circuit_min_requests,
+        failure_rate_threshold=config.circuit_failure_rate,
+        slow_call_seconds=config.circuit_slow_call_seconds,
+        slow_call_rate_threshold=config.circuit_slow_call_rate,
+        open_seconds=config.circuit_open_seconds,
+        half_open_max_probes=config.circuit_half_open_probes,
+    )
+
+
+def create_fair_queue(prefix: str) -> FairQueue | None:
+    """Create the fair queue for a provider with a concurrency limit."""
+    max_concurrency = config.upstream_concurrency_limits.get(prefix)
+    if not max_concurrency:
+        return None
+    return FairQueue(
+        prefix,
+        max_concurrency,
+        max_depth=config.fair_queue_max_depth,
+        timeout_seconds=config.fair_queue_timeout_seconds,
+    )
+
+
+def create_compatible_adapters() -> dict[str, ProviderAdapter]:
+    """Create adapters for the built-in and configured OpenAI-compatible vendors."""
+    keys = {
+        GROQ_PROVIDER.prefix: config.groq_keys,
+        DEEPSEEK_PROVIDER.prefix: config.deepseek_keys,
+        **config.compatible_provider_keys,
+    }
+    built_in = [GROQ_PROVIDER, DEEPSEEK_PROVIDER]
+    vendors = {
+        provider.prefix: provider
+        for provider in [*built_in, *config.compatible_providers]
+    }
+    return {
+        provider.name: OpenAICompatibleAdapter(
+            provider,
+            keys[prefix],
+            passthrough=config.passthrough_mode,
+            key_strategy=config.key_pool_strategy,
+            key_cooldown_seconds=config.key_cooldown_seconds,
+        )
+        for prefix, provider in vendors.items()
+    }
 
 
 # Create router service instance
@@ -43,72 +207,442 @@ def create_router_service() -> ModelRouterService:
             ProviderName.DEEPSEEK: MockDeepSeekAdapter(),
         }
     else:
+        http_pool.configure(
+            max_connections=config.upstream_max_connections,
+            max_keepalive_connections=config.upstream_max_keepalive_connections,
+            keepalive_expiry=config.upstream_keepalive_expiry_seconds,
+            connect_timeout=config.upstream_connect_timeout_seconds,
+            http2=config.upstream_http2,
+            dns_ttl_seconds=config.upstream_dns_ttl_seconds,
+        )
         providers = {
-            ProviderName.OPENAI: OpenAIAdapter(config.openai_api_key),
-            ProviderName.ANTHROPIC: AnthropicAdapter(config.anthropic_api_key),
-            ProviderName.GROQ: GroqAdapter(config.groq_api_key),
-            ProviderName.DEEPSEEK: DeepSeekAdapter(config.deepseek_api_key),
+            ProviderName.OPENAI: OpenAIAdapter(
+                base_url=config.openai_base_url,
+                passthrough=config.passthrough_mode,
+                keys=config.openai_keys,
+                key_strategy=config.key_pool_strategy,
+                key_cooldown_seconds=config.key_cooldown_seconds,
+            ),
+            ProviderName.ANTHROPIC: AnthropicAdapter(
+                base_url=config.anthropic_base_url,
+                keys=config.anthropic_keys,
+                key_strategy=config.key_pool_strategy,
+                key_cooldown_seconds=config.key_cooldown_seconds,
+            ),
         }
+        providers.update(create_compatible_adapters())
 
-    return ModelRouterService(providers)
+    return ModelRouterService(
+        providers,
+        response_cache=create_response_cache(),
+        single_flight=SingleFlight() if config.single_flight_enabled else None,
+        model_fallbacks=config.model_fallbacks,
+        request_deadline_seconds=config.request_deadline_seconds,
+        upstream_timeout_seconds=config.upstream_timeout_seconds,
+        latency_tracker=LatencyTracker(),
+        adaptive_timeouts_enabled=config.adaptive_timeouts_enabled,
+        adaptive_timeout_quantile=config.adaptive_timeout_quantile,
+        adaptive_timeout_multiplier=config.adaptive_timeout_multiplier,
+        min_upstream_timeout_seconds=config.min_upstream_timeout_seconds,
+        hedging_enabled=config.hedging_enabled,
+        hedge_quantile=config.hedge_quantile,
+        hedge_default_delay_seconds=config.hedge_default_delay_seconds,
+        hedge_min_delay_seconds=config.hedge_min_delay_seconds,
+        circuit_breaker_factory=(
+            create_circuit_breaker if config.circuit_breaker_enabled else None
+        ),
+        model_aliases=config.model_aliases,
+        routing_engine=RoutingEngine(
+            strategy=config.routing_strategy,
+            alpha=config.routing_ewma_alpha,
+            latency_slo_seconds=config.routing_latency_slo_seconds,
+        ),
+        model_prices=config.model_prices,
+        model_capabilities=config.model_capabilities,
+        fair_queue_factory=create_fair_queue,
+        tenant_weights=config.tenant_weights,
+    )
 
 
 # Create single instance to use across all requests
 router_service = create_router_service()
+rate_limiter = create_rate_limiter()
+admission_controller = create_admission_controller()
+tracer.configure(
+    create_span_exporter(),
+    sample_rate=config.tracing_sample_rate,
+    max_batch_size=config.tracing_batch_size,
+    export_interval_seconds=config.tracing_export_interval_seconds,
+    max_queue_size=config.tracing_max_queue_size,
+)
 router = APIRouter()
 logger = get_logger(__name__)
 
 
 async def get_call_context(request: Request) -> CallContext:
     """Dependency to create CallContext from FastAPI request."""
-    # Validate authorization header is present
-    auth_header = request.headers.get("authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+    with tracer.span("auth"):
+        # Validate authorization header is present
+        auth_header = request.headers.get("authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            raise HTTPException(status_code=401, detail="Invalid or missing API key")
+
+        # Extract token from Bearer header
+        token = auth_header[7:]  # Remove "Bearer " prefix
+
+        # Get user UID from token service using inject
+        user_token_service = inject.instance(UserTokenService)
+        user_id = await user_token_service.get_user_uid_by_token(token)
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Invalid API key")
 
-    # Extract token from Bearer header
-    token = auth_header[7:]  # Remove "Bearer " prefix
-    
-    # Get user UID from token service using inject
-    user_token_service = inject.instance(UserTokenService)
-    user_id = await user_token_service.get_user_uid_by_token(token)
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid API key")
+        call_context = CallContext(user_id=user_id)
+        # Read back by the request metrics and tracing middleware
+        request.state.call_context = call_context
+        # The role selects rate limits and fair queue weights, so the user is
+        # only looked up when one of them is configured
+        if rate_limiter.enabled or config.upstream_concurrency_limits:
+            user = await get_user(call_context)
+            if user:
+                call_context.user_role = (user.additional_info or {}).get("role")
+        if rate_limiter.enabled:
+            try:
+                call_context.response_headers.update(
+                    await rate_limiter.check_request(user_id, call_context.user_role)
+                )
+            except RateLimitExceededError as e:
+                raise_rate_limited(e)
 
-    return CallContext(user_id=user_id)
+    return call_context
+
+
+async def get_user(call_context: CallContext) -> User | None:
+    """The caller's user record, looked up at most once per request."""
+    if call_context.user is None and call_context.user_id:
+        user_service = inject.instance(UserService)
+        call_context.user = await user_service.get_user_by_uid(
+            call_context.user_id, call_context
+        )
+    return call_context.user
+
+
+async def parse_chat_request(request: Request) -> ChatCompletionRequest:
+    """Validate the request straight from its JSON bytes.
+
+    Pydantic parses the body into the model in one pass, without first decoding
+    it into dicts the way a declared body parameter does, which matters for long
+    prompts. Errors are reported as FastAPI reports body errors.
+    """
+    body = await request.body()
+    try:
+        return ChatCompletionRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from None
+
+
+def raise_rate_limited(error: RateLimitExceededError) -> NoReturn:
+    """Reject a request that is over the user's quota."""
+    headers = {**error.headers, "Retry-After": str(math.ceil(error.retry_after))}
+    raise HTTPException(status_code=429, detail=str(error), headers=headers)
+
+
+async def cancel_on_disconnect[T](
+    request: Request, awaitable: Awaitable[T]
+) -> T | None:
+    """Await the upstream call, cancelling it if the client disconnects first.
+
+    Returns None when the call was cancelled.
+    """
+    async def wait_for_disconnect() -> None:
+        # The body has been read, so the next message only comes on disconnect
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
+
+    call = asyncio.ensure_future(awaitable)
+    disconnect = asyncio.ensure_future(wait_for_disconnect())
+    try:
+        await asyncio.wait({call, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect.cancel()
+        if not call.done():
+            call.cancel()
+            # Let the upstream call unwind and release its connection
+            await asyncio.wait({call})
+    if call.cancelled():
+        return None
+    return call.result()
 
 
-@router.post("/v1/chat/completions", response_model=ChatCompletionResponse)
+def record_disconnect(phase: str, max_tokens: int | None, generated: int = 0) -> None:
+    CLIENT_DISCONNECTS.labels(phase).inc()
+    if max_tokens:
+        SAVED_TOKENS.labels(phase).inc(max(max_tokens - generated, 0))
+
+
+async def stream_sse_events(
+    chunks: AsyncGenerator[str],
+    call_context: CallContext,
+    max_tokens: int | None = None,
+    estimated_tokens: int = 0,
+    include_usage: bool = False,
+) -> AsyncGenerator[str]:
+    """Frame provider chunks as server-sent events, flushing each one immediately.
+
+    Upstreams are always asked for a final usage chunk, which is passed on only
+    to clients that asked for it with ``stream_options``. If the client
+    disconnects, the server cancels this generator, and the upstream stream is
+    closed right away so its connection goes back to the pool.
+    """
+    sent = 0
+    usage = None
+    try:
+        async for chunk in chunks:
+            chunk_usage, usage_only = usage_from_chunk(chunk)
+            usage = chunk_usage or usage
+            if usage_only and not include_usage:
+                continue
+            yield f"data: {chunk}\n\n"
+            sent += 1
+    except ProviderAPIError as e:
+        call_context.error_type = type(e).__name__
+        logger.error(
+            "Provider API error mid-stream: %s", e, call_context=call_context
+        )
+        error = {"error": {"message": str(e), "type": "provider_api_error"}}
+        yield f"data: {json.dumps(error)}\n\n"
+        return
+    except Exception as e:
+        call_context.error_type = type(e).__name__
+        logger.error(
+            "Unexpected error mid-stream: %s", e, call_context=call_context, exc_info=e
+        )
+        error = {"error": {"message": "Internal server error", "type": "server_error"}}
+        yield f"data: {json.dumps(error)}\n\n"
+        return
+    except (asyncio.CancelledError, GeneratorExit):
+        logger.info("Client disconnected mid-stream", call_context=call_context)
+        # Content chunks carry about one token each
+        record_disconnect("streaming", max_tokens, sent)
+        raise
+    finally:
+        with anyio.CancelScope(shield=True):
+            await chunks.aclose()
+
+    if usage:
+        instruments_for(call_context).observe_usage(usage)
+        router_service.account_stream_cost(call_context.model, usage)
+        if rate_limiter.enabled:
+            # The headers are already sent, so only the bucket is charged
+            await rate_limiter.settle_tokens(
+                call_context.user_id, call_context.user_role, estimated_tokens, usage
+            )
+    yield "data: [DONE]\n\n"
+
+
+def raise_for_router_error(
+    error: ModelRouterException, call_context: CallContext
+) -> NoReturn:
+    """Answer a failed chat completion with the HTTP status for its error."""
+    headers = None
+    if isinstance(error, ProviderNotFoundError):
+        logger.error(f"Provider not found: {str(error)}", call_context=call_context)
+        status_code = 400
+    elif isinstance(error, ProviderNotConfiguredError):
+        logger.error(
+            f"Provider not configured: {str(error)}", call_context=call_context
+        )
+        status_code = 503
+    elif isinstance(error, ModelNotSupportedError):
+        logger.error(f"Model not supported: {str(error)}", call_context=call_context)
+        status_code = 404
+    elif isinstance(error, ProviderRateLimitError):
+        logger.error(f"Provider rate limited: {str(error)}", call_context=call_context)
+        if error.retry_after:
+            headers = {"Retry-After": str(math.ceil(error.retry_after))}
+        status_code = 429
+    elif isinstance(error, ProviderUnavailableError):
+        logger.error(f"Provider unavailable: {str(error)}", call_context=call_context)
+        status_code = 503
+    elif isinstance(error, ProviderTimeoutError):
+        logger.error(f"Provider timeout: {str(error)}", call_context=call_context)
+        status_code = 504
+    elif isinstance(error, ProviderAPIError):
+        logger.error(f"Provider API error: {str(error)}", call_context=call_context)
+        status_code = 502
+    else:
+        raise error
+    raise HTTPException(status_code=status_code, detail=str(error), headers=headers)
+
+
+@router.post(
+    "/v1/chat/completions",
+    response_model=ChatCompletionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": ChatCompletionRequest.model_json_schema()
+                }
+            },
+        }
+    },
+)
 async def create_chat_completion(
-    chat_request: ChatCompletionRequest,
-    call_context: CallContext = Depends(get_call_context)
-) -> ChatCompletionResponse:
+    request: Request,
+    call_context: CallContext = Depends(get_call_context),
+    chat_request: ChatCompletionRequest = Depends(parse_chat_request),
+) -> ChatCompletionResponse | Response:
     """Create a chat completion using the appropriate AI provider."""
-    logger.info(f"Chat completion request for model: {chat_request.model}", call_context=call_context)
+    logger.info(
+        "Chat completion request for model: %s",
+        chat_request.model,
+        call_context=call_context,
+        hot_path=True,
+    )
 
+    force_cache = request.headers.get(CACHE_OPT_IN_HEADER, "").lower() == "force"
     try:
-        return await router_service.create_chat_completion(chat_request, call_context)
-    except ProviderNotFoundError as e:
-        logger.error(f"Provider not found: {str(e)}", call_context=call_context)
-        raise HTTPException(status_code=400, detail=str(e))
-    except ProviderNotConfiguredError as e:
-        logger.error(f"Provider not configured: {str(e)}", call_context=call_context)
-        raise HTTPException(status_code=503, detail=str(e))
-    except ModelNotSupportedError as e:
-        logger.error(f"Model not supported: {str(e)}", call_context=call_context)
-        raise HTTPException(status_code=404, detail=str(e))
-    except ProviderAPIError as e:
-        logger.error(f"Provider API error: {str(e)}", call_context=call_context)
-        raise HTTPException(status_code=502, detail=str(e))
+        latency_slo = float(request.headers.get(LATENCY_SLO_HEADER, 0)) or None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"{LATENCY_SLO_HEADER} must be a number of seconds"
+        ) from e
+    try:
+        timeout = float(request.headers.get(TIMEOUT_HEADER, 0)) or chat_request.timeout
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"{TIMEOUT_HEADER} must be a number of seconds"
+        ) from e
+    if timeout:
+        call_context.deadline = asyncio.get_running_loop().time() + timeout
 
+    estimated_tokens = estimate_prompt_tokens(chat_request)
+    if rate_limiter.enabled:
+        try:
+            call_context.response_headers.update(
+                await rate_limiter.check_tokens(
+                    call_context.user_id, call_context.user_role, estimated_tokens
+                )
+            )
+        except RateLimitExceededError as e:
+            raise_rate_limited(e)
 
-@router.get("/v1/models")
-async def list_models(
-    call_context: CallContext = Depends(get_call_context)
-):
-    """List all available models grouped by provider."""
-    logger.info("Listing available models", call_context=call_context)
-    models_by_provider = await router_service.get_available_models(call_context)
+    try:
+        result = await cancel_on_disconnect(
+            request,
+            router_service.create_chat_completion(
+                chat_request,
+                call_context,
+                force_cache=force_cache,
+                capability=request.headers.get(CAPABILITY_HEADER),
+                latency_slo_seconds=latency_slo,
+            ),
+        )
+    except ModelRouterException as e:
+        call_context.error_type = type(e).__name__
+        raise_for_router_error(e, call_context)
+
+    if result is None:
+        logger.info(
+            "Client disconnected, upstream call cancelled", call_context=call_context
+        )
+        record_disconnect("waiting", chat_request.max_tokens)
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    # A cache hit spent no upstream tokens, so it is neither metered nor charged
+    cache_hit = call_context.response_headers.get(CACHE_STATUS_HEADER) == "HIT"
+    if (
+        isinstance(result, ChatCompletionResponse | RawChatCompletion)
+        and result.usage
+        and not cache_hit
+    ):
+        instruments_for(call_context).observe_usage(result.usage)
+        if rate_limiter.enabled:
+            call_context.response_headers.update(
+                await rate_limiter.settle_tokens(
+                    call_context.user_id,
+                    call_context.user_role,
+                    estimated_tokens,
+                    result.usage,
+                )
+            )
+
+    if isinstance(result, ChatCompletionResponse):
+        with tracer.span("serialize"):
+            content = result.model_dump_json()
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers=call_context.response_headers,
+        )
+
+    if isinstance(result, RawChatCompletion):
+        return Response(
+            content=result.body,
+            media_type="application/json",
+            headers=call_context.response_headers,
+        )
+
+    return StreamingResponse(
+        stream_sse_events(
+            result,
+            call_context,
+            chat_request.max_tokens,
+            estimated_tokens,
+            bool((chat_request.stream_options or {}).get("include_usage")),
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            **call_context.response_headers,
+        },
+    )
+
+
+# Serialized catalog responses: name -> (version, body, ETag)
+_precomputed: dict[str, tuple[Hashable, bytes, str]] = {}
+_provider_list = TypeAdapter(list[ProviderInfo])
+
+
+async def precomputed_json(
+    name: str, version: Hashable, build: Callable[[], Awaitable[bytes]]
+) -> tuple[bytes, str]:
+    """Body and ETag of a response, rebuilt only when its version changes."""
+    cached = _precomputed.get(name)
+    if cached is None or cached[0] != version:
+        body = await build()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        cached = _precomputed[name] = (version, body, etag)
+    return cached[1], cached[2]
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )
+
+
+def etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """Send the body, or 304 if the client already has this version of it."""
+    # Clients must revalidate, which costs them a 304 while nothing changed
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def build_models_body() -> bytes:
+    models_by_provider = await router_service.get_available_models()
 
     # Convert to OpenAI-compatible format for backward compatibility
     model_list = []
@@ -121,16 +655,37 @@ async def list_models(
                 "owned_by": provider_name.lower().replace(" (mock)", "")
             })
 
-    return {"object": "list", "data": model_list}
+    return json.dumps({"object": "list", "data": model_list}).encode()
+
+
+async def build_providers_body() -> bytes:
+    return _provider_list.dump_json(await router_service.get_provider_info())
+
+
+@router.get("/v1/models")
+async def list_models(
+    request: Request,
+    call_context: CallContext = Depends(get_call_context)
+) -> Response:
+    """List all available models grouped by provider."""
+    logger.info("Listing available models", call_context=call_context, hot_path=True)
+    body, etag = await precomputed_json(
+        "models", router_service.catalog_version, build_models_body
+    )
+    return etag_response(request, body, etag)
 
 
 @router.get("/v1/providers", response_model=list[ProviderInfo])
 async def list_providers(
+    request: Request,
     call_context: CallContext = Depends(get_call_context)
-) -> list[ProviderInfo]:
+) -> Response:
     """List all configured providers and their status."""
-    logger.info("Listing providers", call_context=call_context)
-    return await router_service.get_provider_info(call_context)
+    logger.info("Listing providers", call_context=call_context, hot_path=True)
+    # Circuit states are part of the listing, so a state change rebuilds it
+    version = (router_service.catalog_version, router_service.circuit_states())
+    body, etag = await precomputed_json("providers", version, build_providers_body)
+    return etag_response(request, body, etag)
 
 
 @router.get("/v1/user/me")
@@ -139,17 +694,15 @@ async def get_current_user(
 ):
     """Get current user information."""
     logger.info("Getting current user information", call_context=call_context)
-    
+
     if not call_context.user_id:
         raise HTTPException(status_code=401, detail="User not authenticated")
-    
-    # Get user service using inject
-    user_service = inject.instance(UserService)
-    user = await user_service.get_user_by_uid(call_context.user_id, call_context)
-    
+
+    user = await get_user(call_context)
+
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    
+
     return {
         "uid": user.uid,
         "email": user.email,
@@ -159,6 +712,12 @@ async def get_current_user(
     }
 
 
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics endpoint."""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -1,12 +1,54 @@
 """Application configuration."""
 
+import json
 import os
 
 from dotenv import load_dotenv
 
+from model_router.domain.providers import CompatibleProvider, ModelPrice, UpstreamKey
+
 load_dotenv()
 
 
+def load_key_pool(env_prefix: str, api_key: str | None) -> list[UpstreamKey]:
+    """Load a provider key pool.
+
+    Keys come from ``<PREFIX>_API_KEY``, the comma-separated ``<PREFIX>_API_KEYS``
+    and the JSON list ``<PREFIX>_KEY_POOL`` of ``{"api_key", "base_url", "weight"}``
+    objects for keys bound to their own base URL or weight.
+    """
+    keys = [UpstreamKey(api_key)] if api_key else []
+    for key in os.getenv(f"{env_prefix}_API_KEYS", "").split(","):
+        key = key.strip()
+        if key and key != api_key:
+            keys.append(UpstreamKey(key))
+    for entry in json.loads(os.getenv(f"{env_prefix}_KEY_POOL", "[]")):
+        keys.append(UpstreamKey(**entry))
+    return keys
+
+
+def load_compatible_providers() -> list[CompatibleProvider]:
+    """Load extra OpenAI-compatible vendors.
+
+    ``OPENAI_COMPATIBLE_PROVIDERS`` is a JSON list of ``{"name", "prefix",
+    "base_url", "models", "prices"}`` objects, with prices as ``[input, output]``
+    USD per 1K tokens. An entry whose prefix matches a built-in vendor replaces it.
+    """
+    return [
+        CompatibleProvider(
+            name=entry["name"],
+            prefix=entry["prefix"],
+            base_url=entry["base_url"],
+            models=tuple(entry["models"]),
+            prices={
+                model: ModelPrice(*price)
+                for model, price in entry.get("prices", {}).items()
+            },
+        )
+        for entry in json.loads(os.getenv("OPENAI_COMPATIBLE_PROVIDERS", "[]"))
+    ]
+
+
 class AppConfig:
     """Application configuration from environment variables."""
 
@@ -16,6 +58,187 @@ class AppConfig:
         self.anthropic_api_key: str | None = os.getenv("ANTHROPIC_API_KEY")
         self.groq_api_key: str | None = os.getenv("GROQ_API_KEY")
         self.deepseek_api_key: str | None = os.getenv("DEEPSEEK_API_KEY")
+        self.openai_keys = load_key_pool("OPENAI", self.openai_api_key)
+        self.anthropic_keys = load_key_pool("ANTHROPIC", self.anthropic_api_key)
+        self.groq_keys = load_key_pool("GROQ", self.groq_api_key)
+        self.deepseek_keys = load_key_pool("DEEPSEEK", self.deepseek_api_key)
+        self.compatible_providers = load_compatible_providers()
+        self.compatible_provider_keys: dict[str, list[UpstreamKey]] = {}
+        for provider in self.compatible_providers:
+            env_prefix = provider.prefix.upper().replace("-", "_")
+            self.compatible_provider_keys[provider.prefix] = load_key_pool(
+                env_prefix, os.getenv(f"{env_prefix}_API_KEY")
+            )
+        self.key_pool_strategy: str = os.getenv(
+            "KEY_POOL_STRATEGY", "least_outstanding"
+        )
+        self.key_cooldown_seconds: float = float(
+            os.getenv("KEY_COOLDOWN_SECONDS", "30")
+        )
+        self.openai_base_url: str = os.getenv(
+            "OPENAI_BASE_URL", "https://api.openai.com/v1"
+        )
+        self.anthropic_base_url: str = os.getenv(
+            "ANTHROPIC_BASE_URL", "https://api.anthropic.com/v1"
+        )
+        self.upstream_max_connections: int = int(
+            os.getenv("UPSTREAM_MAX_CONNECTIONS", "1000")
+        )
+        self.upstream_max_keepalive_connections: int = int(
+            os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "100")
+        )
+        self.upstream_keepalive_expiry_seconds: float = float(
+            os.getenv("UPSTREAM_KEEPALIVE_EXPIRY_SECONDS", "60")
+        )
+        self.upstream_connect_timeout_seconds: float = float(
+            os.getenv("UPSTREAM_CONNECT_TIMEOUT_SECONDS", "5")
+        )
+        self.upstream_http2: bool = (
+            os.getenv("UPSTREAM_HTTP2", "true").lower() == "true"
+        )
+        self.upstream_dns_ttl_seconds: float = float(
+            os.getenv("UPSTREAM_DNS_TTL_SECONDS", "300")
+        )
+        self.pool_warmup_connections: int = int(
+            os.getenv("POOL_WARMUP_CONNECTIONS", "2")
+        )
+        self.passthrough_mode: bool = (
+            os.getenv("PASSTHROUGH_MODE", "false").lower() == "true"
+        )
+        self.response_cache_enabled: bool = (
+            os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+        )
+        self.response_cache_backend: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+        self.response_cache_ttl_seconds: float = float(
+            os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300")
+        )
+        self.response_cache_max_entries: int = int(
+            os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000")
+        )
+        self.response_cache_dir: str = os.getenv(
+            "RESPONSE_CACHE_DIR", "/tmp/model-router-cache"
+        )
+        self.single_flight_enabled: bool = (
+            os.getenv("SINGLE_FLIGHT_ENABLED", "false").lower() == "true"
+        )
+        self.model_fallbacks: dict[str, list[str]] = json.loads(
+            os.getenv("MODEL_FALLBACKS", "{}")
+        )
+        self.model_aliases: dict[str, list[str]] = json.loads(
+            os.getenv("MODEL_ALIASES", "{}")
+        )
+        self.routing_strategy: str = os.getenv("ROUTING_STRATEGY", "p2c")
+        self.routing_ewma_alpha: float = float(os.getenv("ROUTING_EWMA_ALPHA", "0.3"))
+        self.routing_latency_slo_seconds: float | None = (
+            float(os.getenv("ROUTING_LATENCY_SLO_SECONDS", "0")) or None
+        )
+        self.model_prices: dict[str, ModelPrice] = {
+            model: ModelPrice(*price)
+            for model, price in json.loads(os.getenv("MODEL_PRICES", "{}")).items()
+        }
+        self.model_capabilities: dict[str, list[str]] = json.loads(
+            os.getenv("MODEL_CAPABILITIES", "{}")
+        )
+        self.rate_limit_backend: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+        self.rate_limit_redis_url: str = os.getenv(
+            "RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0"
+        )
+        self.rate_limits: dict[str, dict[str, float]] = json.loads(
+            os.getenv("RATE_LIMITS", "{}")
+        )
+        self.rate_limit_default_role: str = os.getenv(
+            "RATE_LIMIT_DEFAULT_ROLE", "user"
+        )
+        self.admission_max_event_loop_lag_seconds: float = float(
+            os.getenv("ADMISSION_MAX_EVENT_LOOP_LAG_SECONDS", "0.25")
+        )
+        self.admission_max_in_flight: int = int(
+            os.getenv("ADMISSION_MAX_IN_FLIGHT", "0")
+        )
+        self.admission_probe_interval_seconds: float = float(
+            os.getenv("ADMISSION_PROBE_INTERVAL_SECONDS", "0.05")
+        )
+        self.admission_retry_after_seconds: float = float(
+            os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1")
+        )
+        self.upstream_concurrency_limits: dict[str, int] = json.loads(
+            os.getenv("UPSTREAM_CONCURRENCY_LIMITS", "{}")
+        )
+        self.fair_queue_max_depth: int = int(os.getenv("FAIR_QUEUE_MAX_DEPTH", "1000"))
+        self.fair_queue_timeout_seconds: float = float(
+            os.getenv("FAIR_QUEUE_TIMEOUT_SECONDS", "10")
+        )
+        self.tenant_weights: dict[str, float] = json.loads(
+            os.getenv("TENANT_WEIGHTS", "{}")
+        )
+        self.log_hot_path_level: str = os.getenv("LOG_HOT_PATH_LEVEL", "INFO").upper()
+        self.log_hot_path_sample_rate: float = float(
+            os.getenv("LOG_HOT_PATH_SAMPLE_RATE", "1.0")
+        )
+        self.tracing_exporter: str = os.getenv("TRACING_EXPORTER", "none")
+        self.tracing_file_path: str = os.getenv(
+            "TRACING_FILE_PATH", "/tmp/model-router-spans.jsonl"
+        )
+        self.tracing_sample_rate: float = float(
+            os.getenv("TRACING_SAMPLE_RATE", "1.0")
+        )
+        self.tracing_batch_size: int = int(os.getenv("TRACING_BATCH_SIZE", "512"))
+        self.tracing_export_interval_seconds: float = float(
+            os.getenv("TRACING_EXPORT_INTERVAL_SECONDS", "1.0")
+        )
+        self.tracing_max_queue_size: int = int(
+            os.getenv("TRACING_MAX_QUEUE_SIZE", "10000")
+        )
+        self.request_deadline_seconds: float = float(
+            os.getenv("REQUEST_DEADLINE_SECONDS", "60")
+        )
+        self.upstream_timeout_seconds: float = float(
+            os.getenv("UPSTREAM_TIMEOUT_SECONDS", "30")
+        )
+        self.adaptive_timeouts_enabled: bool = (
+            os.getenv("ADAPTIVE_TIMEOUTS_ENABLED", "true").lower() == "true"
+        )
+        self.adaptive_timeout_quantile: float = float(
+            os.getenv("ADAPTIVE_TIMEOUT_QUANTILE", "0.99")
+        )
+        self.adaptive_timeout_multiplier: float = float(
+            os.getenv("ADAPTIVE_TIMEOUT_MULTIPLIER", "3")
+        )
+        self.min_upstream_timeout_seconds: float = float(
+            os.getenv("MIN_UPSTREAM_TIMEOUT_SECONDS", "5")
+        )
+        self.hedging_enabled: bool = (
+            os.getenv("HEDGING_ENABLED", "false").lower() == "true"
+        )
+        self.hedge_quantile: float = float(os.getenv("HEDGE_QUANTILE", "0.95"))
+        self.hedge_default_delay_seconds: float = float(
+            os.getenv("HEDGE_DEFAULT_DELAY_SECONDS", "1.0")
+        )
+        self.hedge_min_delay_seconds: float = float(
+            os.getenv("HEDGE_MIN_DELAY_SECONDS", "0.05")
+        )
+        self.circuit_breaker_enabled: bool = (
+            os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+        )
+        self.circuit_window_seconds: float = float(
+            os.getenv("CIRCUIT_WINDOW_SECONDS", "30")
+        )
+        self.circuit_min_requests: int = int(os.getenv("CIRCUIT_MIN_REQUESTS", "20"))
+        self.circuit_failure_rate: float = float(
+            os.getenv("CIRCUIT_FAILURE_RATE", "0.5")
+        )
+        self.circuit_slow_call_seconds: float | None = (
+            float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "0")) or None
+        )
+        self.circuit_slow_call_rate: float = float(
+            os.getenv("CIRCUIT_SLOW_CALL_RATE", "0.8")
+        )
+        self.circuit_open_seconds: float = float(
+            os.getenv("CIRCUIT_OPEN_SECONDS", "30")
+        )
+        self.circuit_half_open_probes: int = int(
+            os.getenv("CIRCUIT_HALF_OPEN_PROBES", "3")
+        )
 
     def validate_required_keys(self) -> None:
         """Validate that at least one API key is configured."""
@@ -23,10 +246,11 @@ class AppConfig:
             return
 
         api_keys = [
-            self.openai_api_key,
-            self.anthropic_api_key,
-            self.groq_api_key,
-            self.deepseek_api_key,
+            self.openai_keys,
+            self.anthropic_keys,
+            self.groq_keys,
+            self.deepseek_keys,
+            *self.compatible_provider_keys.values(),
         ]
 
         if not any(api_keys):
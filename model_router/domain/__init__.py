@@ -1,6 +1,23 @@
 from .base import BaseEntity, DataErrorResponse, Error
 from .call_context import CallContext
-from .providers import ProviderName, ProviderPrefix
+from .providers import (
+    CompatibleProvider,
+    ModelPrice,
+    ProviderName,
+    ProviderPrefix,
+    UpstreamKey,
+)
 from .user import User
 
-__all__ = ["ProviderName", "ProviderPrefix", "BaseEntity", "Error", "DataErrorResponse", "User", "CallContext"]
+__all__ = [
+    "CompatibleProvider",
+    "ModelPrice",
+    "ProviderName",
+    "ProviderPrefix",
+    "UpstreamKey",
+    "BaseEntity",
+    "Error",
+    "DataErrorResponse",
+    "User",
+    "CallContext",
+]
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 
 from model_router.domain.base import new_ksuid
+from model_router.domain.user import User
 
 
 @dataclass
@@ -10,7 +11,17 @@ class CallContext:
     """Context information for a request/call through the system."""
 
     user_id: str | None = None
+    user_role: str | None = None
+    # User record, once something in the request has looked it up
+    user: User | None = None
     request_id: str | None = field(default_factory=new_ksuid)
+    response_headers: dict[str, str] = field(default_factory=dict)
+    # Event loop time by which the client needs the answer
+    deadline: float | None = None
+    # Model that answered the request; unset until an upstream has answered
+    model: str | None = None
+    upstream_seconds: float = 0.0
+    error_type: str | None = None
 
     def __str__(self) -> str:
         return f"CallContext(user_id={self.user_id}, request_id={self.request_id})"
@@ -23,4 +23,40 @@ class ModelNotSupportedError(ModelRouterException):
 
 class ProviderAPIError(ModelRouterException):
     """Raised when a provider API returns an error."""
-    pass
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ProviderRateLimitError(ProviderAPIError):
+    """Raised when a provider rejects a request because of rate limits."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message, status_code=429)
+        self.retry_after = retry_after
+
+
+class ProviderTimeoutError(ProviderAPIError):
+    """Raised when a provider does not answer within the allowed time."""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=504)
+
+
+class ProviderUnavailableError(ProviderAPIError):
+    """Raised when a provider is taken out of rotation by its circuit breaker."""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=503)
+
+
+class RateLimitExceededError(ModelRouterException):
+    """Raised when a user has used up their request or token quota."""
+
+    def __init__(
+        self, message: str, retry_after: float, headers: dict[str, str] | None = None
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.headers = headers or {}
@@ -1,8 +1,11 @@
 """Domain models for model router."""
 
+import json
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ChatMessage(BaseModel):
@@ -16,6 +19,9 @@ class ChatCompletionRequest(BaseModel):
     temperature: float | None = None
     max_tokens: int | None = None
     stream: bool | None = False
+    stream_options: dict[str, Any] | None = None
+    # Router extension: seconds the client will wait; never sent upstream
+    timeout: float | None = Field(default=None, gt=0, exclude=True)
 
 
 class ChatCompletionResponse(BaseModel):
@@ -24,11 +30,43 @@ class ChatCompletionResponse(BaseModel):
     created: int
     model: str
     choices: list[dict[str, Any]]
-    usage: dict[str, int] | None = None
+    usage: dict[str, Any] | None = None
+
+
+class ChatCompletionChunk(BaseModel):
+    id: str
+    object: str = "chat.completion.chunk"
+    created: int
+    model: str
+    choices: list[dict[str, Any]]
+    usage: dict[str, Any] | None = None
+
+
+@dataclass
+class RawChatCompletion:
+    """Upstream chat completion body forwarded to the client without re-encoding."""
+
+    body: bytes
+
+    @cached_property
+    def usage(self) -> dict[str, Any] | None:
+        """Usage block, decoded from the tail of the body only when accessed."""
+        start = self.body.rfind(b'"usage"')
+        if start == -1:
+            return None
+        colon = self.body.find(b":", start)
+        try:
+            usage, _ = json.JSONDecoder().raw_decode(
+                self.body[colon + 1:].decode().lstrip()
+            )
+        except ValueError:
+            usage = json.loads(self.body).get("usage")
+        return usage
 
 
 class ProviderInfo(BaseModel):
     name: str
     prefix: str
     configured: bool
+    circuit_state: str | None = None
     available_models: list[str]
@@ -1,5 +1,7 @@
 """Provider constants and enums."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -17,3 +19,37 @@ class ProviderPrefix(str, Enum):
     ANTHROPIC = "anthropic"
     GROQ = "groq"
     DEEPSEEK = "deepseek"
+
+
+@dataclass(frozen=True)
+class UpstreamKey:
+    """One API key of a provider key pool, optionally bound to its own base URL."""
+    api_key: str
+    base_url: str | None = None
+    weight: int = 1
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """Upstream list price of a model, in USD per 1K tokens."""
+    input_per_1k: float
+    output_per_1k: float
+
+    def cost(self, usage: dict) -> float:
+        """Cost of a call from its reported token usage."""
+        return (
+            usage.get("prompt_tokens", 0) * self.input_per_1k
+            + usage.get("completion_tokens", 0) * self.output_per_1k
+        ) / 1000
+
+
+@dataclass(frozen=True)
+class CompatibleProvider:
+    """Declaration of a vendor that serves the OpenAI chat completions API."""
+    name: str
+    prefix: str
+    base_url: str
+    models: tuple[str, ...]
+    prices: Mapping[str, ModelPrice] = field(default_factory=dict)
+    # Vendor name used in error messages; defaults to name
+    label: str = ""
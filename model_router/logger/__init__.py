@@ -1,12 +1,17 @@
 """Logging system with CallContext support."""
 
+import atexit
 import contextvars
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import re
 import sys
-from typing import Optional
 
+from model_router.config import config
 from model_router.domain.call_context import CallContext
 
 current_context: contextvars.ContextVar[CallContext | None] = contextvars.ContextVar(
@@ -14,6 +19,14 @@ current_context: contextvars.ContextVar[CallContext | None] = contextvars.Contex
     default=None
 )
 
+# "pretty" for colored development output, "json" for one compact object per line
+LOG_FORMAT = os.getenv("LOG_FORMAT", "pretty").lower()
+LOG_LEVEL = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+# Per-request messages, logged with hot_path=True, are gated and sampled separately.
+# A queued record costs around 10µs, so deployments may keep only a share of them.
+HOT_PATH_LOG_LEVEL = logging.getLevelName(config.log_hot_path_level)
+HOT_PATH_SAMPLE_RATE = config.log_hot_path_sample_rate
+
 
 def get_system_call_context(name: str = 'system') -> CallContext:
     """Get system call context."""
@@ -54,11 +67,27 @@ GRAY = "\033[90m"
 
 
 class ContextualLoggingAdapter(logging.LoggerAdapter):
-    """Logging adapter that supports CallContext."""
+    """Logging adapter that supports CallContext.
+
+    Pass ``hot_path=True`` for messages logged on every request: they are
+    dropped below ``LOG_HOT_PATH_LEVEL`` and sampled at
+    ``LOG_HOT_PATH_SAMPLE_RATE`` before a log record is even created.
+    """
 
     def __init__(self, logger: logging.Logger):
         super().__init__(logger, extra={})
 
+    def log(self, level, msg, *args, hot_path: bool = False, **kwargs):
+        if hot_path and (
+            level < HOT_PATH_LOG_LEVEL or random.random() >= HOT_PATH_SAMPLE_RATE
+        ):
+            # Dropped, but later records still belong to the caller's context
+            self.process(msg, kwargs)
+            return
+        # Skip this frame too, so records name the function that logged them
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        super().log(level, msg, *args, **kwargs)
+
     def process(self, msg, kwargs):
         # If caller passed `call_context=some_CallContext`, override the ContextVar
         ctx_override: CallContext | None = kwargs.pop("call_context", None)
@@ -96,29 +125,85 @@ class ColoredFormatter(logging.Formatter):
                     pass  # Leave message as-is if parsing fails
 
         record.msg = message
+        record.args = None
         return super().format(record)
 
 
+class JsonFormatter(logging.Formatter):
+    """Compact one-line JSON for production, without prettifying messages."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "func": record.funcName,
+            "user_id": getattr(record, "user_id", "N/A"),
+            "request_id": getattr(record, "request_id", "null"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves all formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _create_listener() -> logging.handlers.QueueListener:
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setLevel(LOG_LEVEL)
+    if LOG_FORMAT == "json":
+        stdout_handler.setFormatter(JsonFormatter())
+    else:
+        # Use colored formatter for development
+        stdout_handler.setFormatter(ColoredFormatter(
+            "%(levelname)s - [%(funcName)s] "
+            "|user_id: %(user_id)s|req_id: %(request_id)s| %(message)s"
+        ))
+
+    listener = logging.handlers.QueueListener(
+        queue.SimpleQueue(), stdout_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
 def get_logger(name: str) -> logging.LoggerAdapter:
-    """Get a logger with CallContext support."""
+    """Get a logger with CallContext support.
+
+    Records are put on a queue and written to stdout by a background thread, so
+    logging never blocks the event loop on formatting or I/O.
+    """
+    global _listener
+    if _listener is None:
+        _listener = _create_listener()
+
     root = logging.getLogger(name)
-    root.setLevel(logging.INFO)
+    root.setLevel(LOG_LEVEL)
 
     # Clear existing handlers to avoid duplication
     if root.handlers:
         root.handlers.clear()
 
-    stdout_handler = logging.StreamHandler(sys.stdout)
-    stdout_handler.setLevel(logging.INFO)
-
-    # Use colored formatter for development
-    formatter = ColoredFormatter(
-        '%(levelname)s - [%(funcName)s] |user_id: %(user_id)s|req_id: %(request_id)s| %(message)s'
-    )
-    stdout_handler.setFormatter(formatter)
-
-    root.addHandler(stdout_handler)
+    root.addHandler(NonBlockingQueueHandler(_listener.queue))
     root.addFilter(CallContextFilter())
 
     adapter = ContextualLoggingAdapter(root)
     return adapter
+
+
+def flush_logs() -> None:
+    """Write out every queued record, then keep the pipeline running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
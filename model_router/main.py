@@ -5,9 +5,17 @@ import inject
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
-from model_router.api.routes import router
+from model_router.api.middleware import (
+    AdmissionMiddleware,
+    RequestMetricsMiddleware,
+    TracingMiddleware,
+)
+from model_router.api.routes import admission_controller, router
 from model_router.config import config
+from model_router.logger import flush_logs
 from model_router.main_configuration import main_configuration, initialize_sample_data
+from model_router.services.http_pool import http_pool
+from model_router.tracing import tracer
 
 
 @asynccontextmanager
@@ -18,9 +26,20 @@ async def lifespan(app: FastAPI):
     
     # Initialize sample data
     await initialize_sample_data()
+
+    # Open upstream connections before the first request needs them
+    if config.pool_warmup_connections > 0:
+        await http_pool.warm_up(config.pool_warmup_connections)
+
+    # Measure event loop lag for admission control
+    admission_controller.start()
     yield
-    # Shutdown
-    pass
+    # Shutdown - stop the lag probe, close pooled upstream connections and
+    # write out queued log records and spans
+    await admission_controller.stop()
+    await http_pool.aclose()
+    flush_logs()
+    tracer.force_flush()
 
 
 # Validate configuration
@@ -34,6 +53,17 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Shed new completions while the pod is saturated
+app.add_middleware(
+    AdmissionMiddleware,
+    controller=admission_controller,
+    paths=("/v1/chat/completions",),
+)
+# Added last so that shed requests are measured too
+app.add_middleware(RequestMetricsMiddleware, paths=("/v1/chat/completions",))
+# Outermost, so that the root span covers everything else
+app.add_middleware(TracingMiddleware, paths=("/v1/chat/completions",))
+
 # Include routes
 app.include_router(router)
 
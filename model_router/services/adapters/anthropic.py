@@ -1,19 +1,270 @@
 """Anthropic provider adapter."""
 
+import json
 import time
+from collections.abc import AsyncGenerator, Callable, Mapping
+from typing import Any
 
-from model_router.domain.exceptions import ProviderNotConfiguredError
+import httpx
+
+from model_router.domain.exceptions import (
+    ModelNotSupportedError,
+    ProviderAPIError,
+    ProviderRateLimitError,
+)
 from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
-from model_router.domain.providers import ProviderName, ProviderPrefix
+from model_router.domain.providers import (
+    ModelPrice,
+    ProviderName,
+    ProviderPrefix,
+    UpstreamKey,
+)
+from model_router.services.http_pool import http_pool
+from model_router.services.key_pool import (
+    LEAST_OUTSTANDING,
+    KeyPool,
+    RateLimitHeadroom,
+    parse_retry_after,
+)
 
 from .base import ProviderAdapter
 
+ANTHROPIC_BASE_URL = "https://api.anthropic.com/v1"
+ANTHROPIC_VERSION = "2023-06-01"
+# The Messages API requires max_tokens; used when the client sends none
+DEFAULT_MAX_TOKENS = 4096
+
+ANTHROPIC_MODEL_PRICES = {
+    "claude-3-5-sonnet-20241022": ModelPrice(0.003, 0.015),
+    "claude-3-5-haiku-20241022": ModelPrice(0.0008, 0.004),
+    "claude-3-opus-20240229": ModelPrice(0.015, 0.075),
+}
+
+# Pieces of an OpenAI chunk that follow the per-stream envelope
+_ROLE_DELTA = (
+    ',"choices":[{"index":0,"delta":{"role":"assistant","content":""},'
+    '"finish_reason":null}]}'
+)
+_CONTENT_DELTA = ',"choices":[{"index":0,"delta":{"content":'
+_DELTA_END = '},"finish_reason":null}]}'
+_FINISH = ',"choices":[{"index":0,"delta":{},"finish_reason":'
+
+_FINISH_REASONS = {
+    "end_turn": "stop",
+    "stop_sequence": "stop",
+    "max_tokens": "length",
+    "tool_use": "tool_calls",
+}
+
+
+def to_messages_payload(request: ChatCompletionRequest, model_name: str) -> bytes:
+    """Translate an OpenAI-style request into a Messages API body.
+
+    System messages are lifted into the top-level ``system`` field; the rest
+    keep their order.
+    """
+    system = [msg.content for msg in request.messages if msg.role == "system"]
+    payload: dict[str, Any] = {
+        "model": model_name,
+        "messages": [
+            {"role": msg.role, "content": msg.content}
+            for msg in request.messages
+            if msg.role != "system"
+        ],
+        "max_tokens": request.max_tokens or DEFAULT_MAX_TOKENS,
+    }
+    if system:
+        payload["system"] = "\n\n".join(system)
+    if request.temperature is not None:
+        payload["temperature"] = request.temperature
+    if request.stream:
+        payload["stream"] = True
+    return json.dumps(payload).encode()
+
+
+def to_openai_usage(usage: dict[str, Any]) -> dict[str, int]:
+    prompt_tokens = usage.get("input_tokens", 0)
+    completion_tokens = usage.get("output_tokens", 0)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def to_chat_completion(
+    message: dict[str, Any], model_name: str
+) -> ChatCompletionResponse:
+    """Translate a Messages API response into an OpenAI-shaped completion."""
+    content = "".join(
+        block["text"] for block in message.get("content", ())
+        if block.get("type") == "text"
+    )
+    # Built from fields of our own choosing, so there is nothing to validate
+    return ChatCompletionResponse.model_construct(
+        id=message["id"],
+        object="chat.completion",
+        created=int(time.time()),
+        model=model_name,
+        choices=[{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": _FINISH_REASONS.get(message.get("stop_reason"), "stop"),
+        }],
+        usage=to_openai_usage(message.get("usage", {})),
+    )
+
+
+class AnthropicClient:
+    """Calls the Anthropic Messages API with one API key over a shared pool."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        on_headers: Callable[[str, Mapping[str, str]], None] | None = None,
+    ):
+        self._url = f"{base_url.rstrip('/')}/messages"
+        self._headers = {
+            "x-api-key": api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+        self._http_client = http_client
+        self._on_headers = on_headers
+
+    async def create_chat_completion(
+        self, request: ChatCompletionRequest, model_name: str
+    ) -> ChatCompletionResponse | AsyncGenerator[str]:
+        upstream_request = self._http_client.build_request(
+            "POST",
+            self._url,
+            content=to_messages_payload(request, model_name),
+            headers=self._headers,
+        )
+        try:
+            response = await self._http_client.send(
+                upstream_request, stream=bool(request.stream)
+            )
+        except httpx.HTTPError as e:
+            raise ProviderAPIError(f"Anthropic API error: {str(e)}") from e
+
+        if response.status_code >= 400:
+            body = await response.aread()
+            await response.aclose()
+            message = (
+                f"Anthropic API error: "
+                f"{response.status_code} {body.decode(errors='replace')}"
+            )
+            if response.status_code == 429:
+                raise ProviderRateLimitError(
+                    message, retry_after=parse_retry_after(response.headers)
+                )
+            raise ProviderAPIError(message, status_code=response.status_code)
+
+        if self._on_headers:
+            self._on_headers(model_name, response.headers)
+
+        if request.stream:
+            return self._iter_chunks(response, model_name)
+        try:
+            return to_chat_completion(response.json(), model_name)
+        except (ValueError, KeyError, TypeError) as e:
+            raise ProviderAPIError(
+                f"Anthropic API error: malformed response: {e!r}"
+            ) from e
+
+    async def _iter_chunks(
+        self, response: httpx.Response, model_name: str
+    ) -> AsyncGenerator[str]:
+        """Translate Messages API stream events into OpenAI chunk JSON.
+
+        The chunk envelope is encoded once per stream, so a text delta costs one
+        event decode, one string encode and a concatenation.
+        """
+        envelope = ""
+        usage: dict[str, Any] = {}
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[5:])
+                event_type = event.get("type")
+
+                if event_type == "content_block_delta":
+                    if text := event["delta"].get("text"):
+                        content = json.dumps(text)
+                        yield f"{envelope}{_CONTENT_DELTA}{content}{_DELTA_END}"
+                elif event_type == "message_start":
+                    message = event["message"]
+                    usage.update(message.get("usage", {}))
+                    # '{"id":...,"model":...' without the closing brace
+                    envelope = json.dumps(
+                        {
+                            "id": message["id"],
+                            "object": "chat.completion.chunk",
+                            "created": int(time.time()),
+                            "model": model_name,
+                        },
+                        separators=(",", ":"),
+                    )[:-1]
+                    yield f"{envelope}{_ROLE_DELTA}"
+                elif event_type == "message_delta":
+                    usage.update(event.get("usage", {}))
+                    finish_reason = _FINISH_REASONS.get(
+                        event.get("delta", {}).get("stop_reason"), "stop"
+                    )
+                    yield (
+                        f'{envelope}{_FINISH}{json.dumps(finish_reason)}}}],'
+                        f'"usage":{json.dumps(to_openai_usage(usage))}}}'
+                    )
+                elif event_type == "message_stop":
+                    break
+                elif event_type == "error":
+                    error = event.get("error", {})
+                    raise ProviderAPIError(
+                        f"Anthropic API error: {error.get('message', error)}"
+                    )
+            else:
+                raise ProviderAPIError(
+                    "Anthropic API error: stream ended before message_stop"
+                )
+        except httpx.HTTPError as e:
+            raise ProviderAPIError(f"Anthropic API error: {str(e)}") from e
+        except (ValueError, KeyError, TypeError) as e:
+            raise ProviderAPIError(
+                f"Anthropic API error: malformed stream event: {e!r}"
+            ) from e
+        finally:
+            await response.aclose()
+
 
 class AnthropicAdapter(ProviderAdapter):
-    """Anthropic provider adapter."""
+    """Anthropic provider adapter on the native Messages API."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = ANTHROPIC_BASE_URL,
+        http_client: httpx.AsyncClient | None = None,
+        keys: list[UpstreamKey] | None = None,
+        key_strategy: str = LEAST_OUTSTANDING,
+        key_cooldown_seconds: float = 30.0,
+    ):
+        if keys is None:
+            keys = [UpstreamKey(api_key)] if api_key else []
+        self._http_client = http_client
+        self._headroom = RateLimitHeadroom()
+        self._key_pool = KeyPool(
+            keys, base_url, self._create_client, key_strategy, key_cooldown_seconds
+        )
 
-    def __init__(self, api_key: str | None = None):
-        self._api_key = api_key
+    def _create_client(self, api_key: str, base_url: str) -> AnthropicClient:
+        http_client = self._http_client or http_pool.get_client(base_url)
+        return AnthropicClient(
+            base_url, api_key, http_client, on_headers=self._headroom.observe
+        )
 
     @property
     def provider_name(self) -> str:
@@ -24,7 +275,7 @@ class AnthropicAdapter(ProviderAdapter):
         return ProviderPrefix.ANTHROPIC
 
     def is_configured(self) -> bool:
-        return self._api_key is not None
+        return len(self._key_pool) > 0
 
     async def get_available_models(self) -> list[str]:
         return [
@@ -33,13 +284,28 @@ class AnthropicAdapter(ProviderAdapter):
             "claude-3-opus-20240229",
         ]
 
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        return ANTHROPIC_MODEL_PRICES
+
+    def rate_limit_headroom(self, model: str) -> float | None:
+        return self._headroom.get(self.extract_model_name(model))
+
     async def create_chat_completion(
         self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse:
+    ) -> ChatCompletionResponse | AsyncGenerator[str]:
         if not self.is_configured():
-            raise ProviderNotConfiguredError("Anthropic API key not configured")
+            raise ProviderAPIError("Anthropic client not configured")
+
+        model_name = self.extract_model_name(request.model)
+        if model_name not in await self.get_available_models():
+            raise ModelNotSupportedError(
+                f"Model {model_name} not supported by Anthropic"
+            )
 
-        raise NotImplementedError("Anthropic integration not yet implemented")
+        return await self._key_pool.call(
+            lambda member: member.client.create_chat_completion(request, model_name),
+            "Anthropic",
+        )
 
 
 class MockAnthropicAdapter(ProviderAdapter):
@@ -59,6 +325,9 @@ class MockAnthropicAdapter(ProviderAdapter):
     async def get_available_models(self) -> list[str]:
         return ["claude-3-5-sonnet-20241022", "claude-3-5-haiku-20241022"]
 
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        return ANTHROPIC_MODEL_PRICES
+
     async def create_chat_completion(
         self, request: ChatCompletionRequest
     ) -> ChatCompletionResponse:
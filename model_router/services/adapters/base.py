@@ -3,7 +3,12 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 
-from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
+from model_router.domain.models import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    RawChatCompletion,
+)
+from model_router.domain.providers import ModelPrice
 
 
 class ProviderAdapter(ABC):
@@ -31,13 +36,21 @@ class ProviderAdapter(ABC):
         """Get list of available models from the provider."""
         pass
 
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        """Get list prices of the provider's models, keyed by model name."""
+        return {}
+
     @abstractmethod
     async def create_chat_completion(
         self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse | AsyncGenerator[str]:
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
         """Create a chat completion using the provider's API."""
         pass
 
+    def rate_limit_headroom(self, model: str) -> float | None:
+        """Share of the upstream rate limit left at the model's last answer."""
+        return None
+
     def extract_model_name(self, full_model: str) -> str:
         """Extract the actual model name from the prefixed model string."""
         prefix_str = self.prefix.value if hasattr(self.prefix, 'value') else str(self.prefix)
@@ -1,44 +1,33 @@
-"""DeepSeek provider adapter."""
+"""DeepSeek provider declaration and mock adapter."""
 
 import time
 
-from model_router.domain.exceptions import ProviderNotConfiguredError
 from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
-from model_router.domain.providers import ProviderName, ProviderPrefix
+from model_router.domain.providers import (
+    CompatibleProvider,
+    ModelPrice,
+    ProviderName,
+    ProviderPrefix,
+)
 
 from .base import ProviderAdapter
 
+DEEPSEEK_MODEL_PRICES = {
+    "deepseek-chat": ModelPrice(0.00027, 0.0011),
+    "deepseek-coder": ModelPrice(0.00027, 0.0011),
+}
 
-class DeepSeekAdapter(ProviderAdapter):
-    """DeepSeek provider adapter."""
-
-    def __init__(self, api_key: str | None = None):
-        self._api_key = api_key
-
-    @property
-    def provider_name(self) -> str:
-        return ProviderName.DEEPSEEK
-
-    @property
-    def prefix(self) -> str:
-        return ProviderPrefix.DEEPSEEK
-
-    def is_configured(self) -> bool:
-        return self._api_key is not None
-
-    async def get_available_models(self) -> list[str]:
-        return [
-            "deepseek-chat",
-            "deepseek-coder",
-        ]
-
-    async def create_chat_completion(
-        self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse:
-        if not self.is_configured():
-            raise ProviderNotConfiguredError("DeepSeek API key not configured")
-
-        raise NotImplementedError("DeepSeek integration not yet implemented")
+DEEPSEEK_PROVIDER = CompatibleProvider(
+    name=ProviderName.DEEPSEEK,
+    prefix=ProviderPrefix.DEEPSEEK,
+    base_url="https://api.deepseek.com/v1",
+    models=(
+        "deepseek-chat",
+        "deepseek-coder",
+    ),
+    prices=DEEPSEEK_MODEL_PRICES,
+    label="DeepSeek",
+)
 
 
 class MockDeepSeekAdapter(ProviderAdapter):
@@ -58,6 +47,9 @@ class MockDeepSeekAdapter(ProviderAdapter):
     async def get_available_models(self) -> list[str]:
         return ["deepseek-chat", "deepseek-coder"]
 
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        return DEEPSEEK_MODEL_PRICES
+
     async def create_chat_completion(
         self, request: ChatCompletionRequest
     ) -> ChatCompletionResponse:
@@ -1,46 +1,36 @@
-"""Groq provider adapter."""
+"""Groq provider declaration and mock adapter."""
 
 import time
 
-from model_router.domain.exceptions import ProviderNotConfiguredError
 from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
-from model_router.domain.providers import ProviderName, ProviderPrefix
+from model_router.domain.providers import (
+    CompatibleProvider,
+    ModelPrice,
+    ProviderName,
+    ProviderPrefix,
+)
 
 from .base import ProviderAdapter
 
-
-class GroqAdapter(ProviderAdapter):
-    """Groq provider adapter."""
-
-    def __init__(self, api_key: str | None = None):
-        self._api_key = api_key
-
-    @property
-    def provider_name(self) -> str:
-        return ProviderName.GROQ
-
-    @property
-    def prefix(self) -> str:
-        return ProviderPrefix.GROQ
-
-    def is_configured(self) -> bool:
-        return self._api_key is not None
-
-    async def get_available_models(self) -> list[str]:
-        return [
-            "llama-3.1-405b-reasoning",
-            "llama-3.1-70b-versatile",
-            "llama-3.1-8b-instant",
-            "mixtral-8x7b-32768",
-        ]
-
-    async def create_chat_completion(
-        self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse:
-        if not self.is_configured():
-            raise ProviderNotConfiguredError("Groq API key not configured")
-
-        raise NotImplementedError("Groq integration not yet implemented")
+GROQ_MODEL_PRICES = {
+    "llama-3.1-70b-versatile": ModelPrice(0.00059, 0.00079),
+    "llama-3.1-8b-instant": ModelPrice(0.00005, 0.00008),
+    "mixtral-8x7b-32768": ModelPrice(0.00024, 0.00024),
+}
+
+GROQ_PROVIDER = CompatibleProvider(
+    name=ProviderName.GROQ,
+    prefix=ProviderPrefix.GROQ,
+    base_url="https://api.groq.com/openai/v1",
+    models=(
+        "llama-3.1-405b-reasoning",
+        "llama-3.1-70b-versatile",
+        "llama-3.1-8b-instant",
+        "mixtral-8x7b-32768",
+    ),
+    prices=GROQ_MODEL_PRICES,
+    label="Groq",
+)
 
 
 class MockGroqAdapter(ProviderAdapter):
@@ -60,6 +50,9 @@ class MockGroqAdapter(ProviderAdapter):
     async def get_available_models(self) -> list[str]:
         return ["llama-3.1-70b-versatile", "llama-3.1-8b-instant"]
 
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        return GROQ_MODEL_PRICES
+
     async def create_chat_completion(
         self, request: ChatCompletionRequest
     ) -> ChatCompletionResponse:
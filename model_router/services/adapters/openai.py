@@ -2,83 +2,76 @@
 
 import time
 from collections.abc import AsyncGenerator
-
-from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion
-
-from model_router.domain.exceptions import ModelNotSupportedError, ProviderAPIError
-from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
-from model_router.domain.providers import ProviderName, ProviderPrefix
+from dataclasses import replace
+
+import httpx
+
+from model_router.domain.models import (
+    ChatCompletionChunk,
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+)
+from model_router.domain.providers import (
+    CompatibleProvider,
+    ModelPrice,
+    ProviderName,
+    ProviderPrefix,
+    UpstreamKey,
+)
+from model_router.services.key_pool import LEAST_OUTSTANDING
 
 from .base import ProviderAdapter
-
-
-class OpenAIAdapter(ProviderAdapter):
+from .openai_compatible import OpenAICompatibleAdapter
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+OPENAI_MODEL_PRICES = {
+    "gpt-3.5-turbo": ModelPrice(0.0005, 0.0015),
+    "gpt-4": ModelPrice(0.03, 0.06),
+    "gpt-4-turbo": ModelPrice(0.01, 0.03),
+    "gpt-4o": ModelPrice(0.0025, 0.01),
+    "gpt-4o-mini": ModelPrice(0.00015, 0.0006),
+}
+
+OPENAI_PROVIDER = CompatibleProvider(
+    name=ProviderName.OPENAI,
+    prefix=ProviderPrefix.OPENAI,
+    base_url=OPENAI_BASE_URL,
+    models=(
+        "gpt-3.5-turbo",
+        "gpt-4",
+        "gpt-4-turbo",
+        "gpt-4o",
+        "gpt-4o-mini",
+    ),
+    prices=OPENAI_MODEL_PRICES,
+    label="OpenAI",
+)
+
+
+class OpenAIAdapter(OpenAICompatibleAdapter):
     """OpenAI provider adapter."""
 
-    def __init__(self, api_key: str | None = None):
-        self._api_key = api_key
-        self._client = AsyncOpenAI(api_key=api_key) if api_key else None
-
-    @property
-    def provider_name(self) -> str:
-        return ProviderName.OPENAI
-
-    @property
-    def prefix(self) -> str:
-        return ProviderPrefix.OPENAI
-
-    def is_configured(self) -> bool:
-        return self._api_key is not None
-
-    async def get_available_models(self) -> list[str]:
-        return [
-            "gpt-3.5-turbo",
-            "gpt-4",
-            "gpt-4-turbo",
-            "gpt-4o",
-            "gpt-4o-mini",
-        ]
-
-    async def create_chat_completion(
-        self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse | AsyncGenerator[str]:
-        if not self._client:
-            raise ProviderAPIError("OpenAI client not configured")
-
-        model_name = self.extract_model_name(request.model)
-        available_models = await self.get_available_models()
-
-        if model_name not in available_models:
-            raise ModelNotSupportedError(f"Model {model_name} not supported by OpenAI")
-
-        try:
-            # Convert domain models to OpenAI format
-            openai_messages = [
-                {"role": msg.role, "content": msg.content}
-                for msg in request.messages
-            ]
-
-            response: ChatCompletion = await self._client.chat.completions.create(
-                model=model_name,
-                messages=openai_messages,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-                stream=request.stream or False,
-            )
-
-            # Convert OpenAI response to domain model
-            return ChatCompletionResponse(
-                id=response.id,
-                object=response.object,
-                created=response.created,
-                model=response.model,
-                choices=[choice.model_dump() for choice in response.choices],
-                usage=response.usage.model_dump() if response.usage else None,
-            )
-
-        except Exception as e:
-            raise ProviderAPIError(f"OpenAI API error: {str(e)}")
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = OPENAI_BASE_URL,
+        passthrough: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        keys: list[UpstreamKey] | None = None,
+        key_strategy: str = LEAST_OUTSTANDING,
+        key_cooldown_seconds: float = 30.0,
+    ):
+        if keys is None:
+            keys = [UpstreamKey(api_key)] if api_key else []
+        super().__init__(
+            replace(OPENAI_PROVIDER, base_url=base_url),
+            keys,
+            passthrough=passthrough,
+            http_client=http_client,
+            key_strategy=key_strategy,
+            key_cooldown_seconds=key_cooldown_seconds,
+        )
 
 
 class MockOpenAIAdapter(ProviderAdapter):
@@ -98,10 +91,16 @@ class MockOpenAIAdapter(ProviderAdapter):
     async def get_available_models(self) -> list[str]:
         return ["gpt-3.5-turbo", "gpt-4", "gpt-4o"]
 
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        return OPENAI_MODEL_PRICES
+
     async def create_chat_completion(
         self, request: ChatCompletionRequest
-    ) -> ChatCompletionResponse:
+    ) -> ChatCompletionResponse | AsyncGenerator[str]:
         model_name = self.extract_model_name(request.model)
+        if request.stream:
+            return self._iter_chunks(model_name)
+
         return ChatCompletionResponse(
             id="chatcmpl-mock",
             object="chat.completion",
@@ -117,3 +116,34 @@ class MockOpenAIAdapter(ProviderAdapter):
             }],
             usage={"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20}
         )
+
+    async def _iter_chunks(self, model_name: str) -> AsyncGenerator[str]:
+        created = int(time.time())
+        deltas = [
+            {"role": "assistant", "content": ""},
+            {"content": "This is a mock response "},
+            {"content": "from OpenAI adapter."},
+        ]
+        for delta in deltas:
+            yield ChatCompletionChunk(
+                id="chatcmpl-mock",
+                created=created,
+                model=model_name,
+                choices=[{"index": 0, "delta": delta, "finish_reason": None}],
+            ).model_dump_json()
+
+        yield ChatCompletionChunk(
+            id="chatcmpl-mock",
+            created=created,
+            model=model_name,
+            choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        ).model_dump_json()
+
+        # The usage chunk the router asks upstreams for with stream_options
+        yield ChatCompletionChunk(
+            id="chatcmpl-mock",
+            created=created,
+            model=model_name,
+            choices=[],
+            usage={"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+        ).model_dump_json()
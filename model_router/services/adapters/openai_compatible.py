@@ -0,0 +1,206 @@
+"""Adapter engine for vendors that serve the OpenAI chat completions API."""
+
+from collections.abc import AsyncGenerator
+
+import httpx
+import openai
+from openai import AsyncOpenAI, AsyncStream
+from openai.types.chat import ChatCompletion
+from openai.types.chat import ChatCompletionChunk as OpenAIChatCompletionChunk
+
+from model_router.domain.exceptions import (
+    ModelNotSupportedError,
+    ProviderAPIError,
+    ProviderRateLimitError,
+)
+from model_router.domain.models import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    RawChatCompletion,
+)
+from model_router.domain.providers import CompatibleProvider, ModelPrice, UpstreamKey
+from model_router.services.http_pool import http_pool
+from model_router.services.key_pool import (
+    LEAST_OUTSTANDING,
+    KeyPool,
+    RateLimitHeadroom,
+    parse_retry_after,
+)
+
+from .base import ProviderAdapter
+from .passthrough import PassthroughClient, upstream_stream_options
+
+
+class _PooledOpenAI(AsyncOpenAI):
+    """SDK client that leaves 429s to the key pool instead of retrying them.
+
+    Connection errors and 5xx are still retried on the same key; a rate limit
+    is raised at once so the pool can park the key and try the next one.
+    """
+
+    def _should_retry(self, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            return False
+        return super()._should_retry(response)
+
+
+class OpenAICompatibleAdapter(ProviderAdapter):
+    """Adapter for any OpenAI-compatible vendor, declared by a CompatibleProvider.
+
+    Every key of the vendor's pool gets a client on the shared connection pool
+    of its upstream host, so adding a vendor costs no client setup of its own.
+    """
+
+    def __init__(
+        self,
+        provider: CompatibleProvider,
+        keys: list[UpstreamKey] | None = None,
+        passthrough: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        key_strategy: str = LEAST_OUTSTANDING,
+        key_cooldown_seconds: float = 30.0,
+    ):
+        keys = keys or []
+        self._provider = provider
+        self._label = provider.label or provider.name
+        self._models = set(provider.models)
+        self._passthrough = passthrough
+        self._http_client = http_client
+        self._headroom = RateLimitHeadroom()
+        # A pool moves to the next key on 429 instead of retrying the same one
+        self._client_class = AsyncOpenAI if len(keys) <= 1 else _PooledOpenAI
+        self._key_pool = KeyPool(
+            keys,
+            provider.base_url,
+            self._create_client,
+            key_strategy,
+            key_cooldown_seconds,
+        )
+
+    def _create_client(
+        self, api_key: str, base_url: str
+    ) -> AsyncOpenAI | PassthroughClient:
+        http_client = self._http_client or http_pool.get_client(base_url)
+        if self._passthrough:
+            return PassthroughClient(
+                self._label,
+                base_url,
+                api_key,
+                http_client,
+                on_headers=self._headroom.observe,
+            )
+        return self._client_class(
+            api_key=api_key, base_url=base_url, http_client=http_client
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.name
+
+    @property
+    def prefix(self) -> str:
+        return self._provider.prefix
+
+    def is_configured(self) -> bool:
+        return len(self._key_pool) > 0
+
+    async def get_available_models(self) -> list[str]:
+        return list(self._provider.models)
+
+    def get_model_prices(self) -> dict[str, ModelPrice]:
+        return dict(self._provider.prices)
+
+    def rate_limit_headroom(self, model: str) -> float | None:
+        return self._headroom.get(self.extract_model_name(model))
+
+    async def create_chat_completion(
+        self, request: ChatCompletionRequest
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
+        label = self._label
+        if not self.is_configured():
+            raise ProviderAPIError(f"{label} client not configured")
+
+        model_name = self.extract_model_name(request.model)
+        if model_name not in self._models:
+            raise ModelNotSupportedError(
+                f"Model {model_name} not supported by {label}"
+            )
+
+        return await self._key_pool.call(
+            lambda member: self._send(member.client, request, model_name), label
+        )
+
+    async def _send(
+        self,
+        client: AsyncOpenAI | PassthroughClient,
+        request: ChatCompletionRequest,
+        model_name: str,
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
+        if isinstance(client, PassthroughClient):
+            return await client.create_chat_completion(request, model_name)
+
+        label = self._label
+        try:
+            # Convert domain models to OpenAI format
+            openai_messages = [
+                {"role": msg.role, "content": msg.content}
+                for msg in request.messages
+            ]
+
+            # The raw response exposes the upstream's rate-limit headers
+            completions = client.chat.completions.with_raw_response
+            if request.stream:
+                raw_stream = await completions.create(
+                    model=model_name,
+                    messages=openai_messages,
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens,
+                    stream=True,
+                    stream_options=upstream_stream_options(request),
+                )
+                self._headroom.observe(model_name, raw_stream.headers)
+                stream: AsyncStream[OpenAIChatCompletionChunk] = raw_stream.parse()
+                return self._iter_chunks(stream)
+
+            raw_response = await completions.create(
+                model=model_name,
+                messages=openai_messages,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+            )
+            self._headroom.observe(model_name, raw_response.headers)
+            response: ChatCompletion = raw_response.parse()
+
+            # Convert OpenAI response to domain model; the SDK already validated it
+            return ChatCompletionResponse.model_construct(
+                id=response.id,
+                object=response.object,
+                created=response.created,
+                model=response.model,
+                choices=[choice.model_dump() for choice in response.choices],
+                usage=response.usage.model_dump() if response.usage else None,
+            )
+
+        except openai.RateLimitError as e:
+            raise ProviderRateLimitError(
+                f"{label} API error: {str(e)}",
+                retry_after=parse_retry_after(e.response.headers),
+            ) from e
+        except openai.APIStatusError as e:
+            raise ProviderAPIError(
+                f"{label} API error: {str(e)}", status_code=e.status_code
+            ) from e
+        except Exception as e:
+            raise ProviderAPIError(f"{label} API error: {str(e)}") from e
+
+    async def _iter_chunks(
+        self, stream: AsyncStream[OpenAIChatCompletionChunk]
+    ) -> AsyncGenerator[str]:
+        """Yield upstream chunks as JSON strings as soon as they arrive."""
+        try:
+            async for chunk in stream:
+                yield chunk.model_dump_json(exclude_unset=True)
+        except Exception as e:
+            raise ProviderAPIError(f"{self._label} API error: {str(e)}") from e
+        finally:
+            await stream.close()
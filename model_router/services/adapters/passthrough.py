@@ -0,0 +1,115 @@
+"""Raw passthrough transport for OpenAI-compatible upstreams."""
+
+import json
+import re
+from collections.abc import AsyncGenerator, Callable, Mapping
+from typing import Any
+
+import httpx
+
+from model_router.domain.exceptions import ProviderAPIError, ProviderRateLimitError
+from model_router.domain.models import ChatCompletionRequest, RawChatCompletion
+from model_router.services.key_pool import parse_retry_after
+
+_MODEL_FIELD = re.compile(rb'"model"\s*:\s*"(?:[^"\\]|\\.)*"')
+_MODEL_FIELD_STR = re.compile(r'"model"\s*:\s*"(?:[^"\\]|\\.)*"')
+
+
+def upstream_stream_options(request: ChatCompletionRequest) -> dict[str, Any]:
+    """Stream options that make the upstream report usage in a final chunk."""
+    return {**(request.stream_options or {}), "include_usage": True}
+
+
+class PassthroughClient:
+    """Forwards chat completions to an OpenAI-compatible API without decoding them.
+
+    The request is serialized once, the upstream response bytes are returned as-is
+    apart from the top-level ``model`` field, which is rewritten to the routed
+    model name.
+    """
+
+    def __init__(
+        self,
+        provider_label: str,
+        base_url: str,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        on_headers: Callable[[str, Mapping[str, str]], None] | None = None,
+    ):
+        self._provider_label = provider_label
+        self._url = f"{base_url.rstrip('/')}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._http_client = http_client
+        self._on_headers = on_headers
+
+    async def create_chat_completion(
+        self, request: ChatCompletionRequest, model_name: str
+    ) -> RawChatCompletion | AsyncGenerator[str]:
+        update: dict[str, Any] = {"model": model_name}
+        if request.stream:
+            update["stream_options"] = upstream_stream_options(request)
+        payload = request.model_copy(update=update).model_dump_json(exclude_none=True)
+        model_field = f'"model":{json.dumps(model_name)}'
+        upstream_request = self._http_client.build_request(
+            "POST", self._url, content=payload, headers=self._headers
+        )
+
+        try:
+            response = await self._http_client.send(
+                upstream_request, stream=bool(request.stream)
+            )
+        except httpx.HTTPError as e:
+            raise ProviderAPIError(
+                f"{self._provider_label} API error: {str(e)}"
+            ) from e
+
+        if response.status_code >= 400:
+            body = await response.aread()
+            await response.aclose()
+            message = (
+                f"{self._provider_label} API error: "
+                f"{response.status_code} {body.decode(errors='replace')}"
+            )
+            if response.status_code == 429:
+                raise ProviderRateLimitError(
+                    message, retry_after=parse_retry_after(response.headers)
+                )
+            raise ProviderAPIError(message, status_code=response.status_code)
+
+        if self._on_headers:
+            self._on_headers(model_name, response.headers)
+        if request.stream:
+            return self._iter_chunks(response, model_field)
+
+        model_field_bytes = model_field.encode()
+        return RawChatCompletion(
+            body=_MODEL_FIELD.sub(
+                lambda _: model_field_bytes, response.content, count=1
+            )
+        )
+
+    async def _iter_chunks(
+        self, response: httpx.Response, model_field: str
+    ) -> AsyncGenerator[str]:
+        """Yield upstream SSE payloads with the model field rewritten."""
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                yield _MODEL_FIELD_STR.sub(lambda _: model_field, data, count=1)
+            else:
+                raise ProviderAPIError(
+                    f"{self._provider_label} API error: stream ended before [DONE]"
+                )
+        except httpx.HTTPError as e:
+            raise ProviderAPIError(
+                f"{self._provider_label} API error: {str(e)}"
+            ) from e
+        finally:
+            await response.aclose()
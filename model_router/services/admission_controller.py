@@ -0,0 +1,99 @@
+"""Admission control driven by event-loop lag and in-flight requests."""
+
+import asyncio
+import contextlib
+
+from model_router.metrics import registry
+
+EVENT_LOOP_LAG = registry.gauge(
+    "model_router_event_loop_lag_seconds",
+    "How late the event loop ran the last scheduled lag probe",
+)
+IN_FLIGHT = registry.gauge(
+    "model_router_admission_in_flight_requests",
+    "Admitted requests that have not finished, including open streams",
+)
+SHED_REQUESTS = registry.counter(
+    "model_router_requests_shed_total",
+    "Requests rejected with 503 by admission control",
+    ("reason",),
+)
+
+
+class AdmissionController:
+    """Sheds new work while the process is already saturated.
+
+    A probe task sleeps for ``probe_interval_seconds`` in a loop and records how
+    much later than scheduled it woke up. When that lag, or the number of
+    admitted requests still in flight, is over its limit, ``try_admit`` refuses
+    new requests so that the ones already running keep their latency. A limit
+    of 0 disables that check.
+    """
+
+    def __init__(
+        self,
+        max_event_loop_lag_seconds: float = 0.25,
+        max_in_flight: int = 0,
+        probe_interval_seconds: float = 0.05,
+        retry_after_seconds: float = 1.0,
+    ):
+        self._max_lag = max_event_loop_lag_seconds
+        self._max_in_flight = max_in_flight
+        self._probe_interval = probe_interval_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.in_flight = 0
+        self._lag = 0.0
+        self._probe_due: float | None = None
+        self._task: asyncio.Task | None = None
+        IN_FLIGHT.set_callback(lambda: [((), self.in_flight)])
+
+    def start(self) -> None:
+        """Start measuring event-loop lag on the running loop."""
+        if self._task is None and self._max_lag > 0:
+            self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Stop the lag probe."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._probe_due = None
+
+    @property
+    def event_loop_lag(self) -> float:
+        """Lag of the last probe, or how overdue the pending probe already is."""
+        if self._probe_due is None:
+            return self._lag
+        overdue = asyncio.get_running_loop().time() - self._probe_due
+        return max(self._lag, overdue)
+
+    def try_admit(self) -> str | None:
+        """Admit a request, or return the reason it is shed.
+
+        Every admitted request must be paired with a call to ``release``.
+        """
+        if self._max_in_flight and self.in_flight >= self._max_in_flight:
+            reason = "in_flight"
+        elif self._max_lag and self.event_loop_lag > self._max_lag:
+            reason = "event_loop_lag"
+        else:
+            self.in_flight += 1
+            return None
+
+        SHED_REQUESTS.labels(reason).inc()
+        return reason
+
+    def release(self) -> None:
+        """Mark an admitted request as finished."""
+        self.in_flight -= 1
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._probe_due = loop.time() + self._probe_interval
+            await asyncio.sleep(self._probe_interval)
+            self._lag = max(0.0, loop.time() - self._probe_due)
+            EVENT_LOOP_LAG.set(self._lag)
@@ -0,0 +1,151 @@
+"""Circuit breakers for upstream providers."""
+
+import time
+import weakref
+from collections import deque
+
+from model_router.metrics import registry
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+CIRCUIT_STATE = registry.gauge(
+    "model_router_circuit_state",
+    "Circuit breaker state per provider (0 closed, 1 half-open, 2 open)",
+    ("provider",),
+)
+CIRCUIT_REJECTIONS = registry.counter(
+    "model_router_circuit_rejections_total",
+    "Requests failed fast because the provider circuit was open",
+    ("provider",),
+)
+
+# Read at scrape time, so an open circuit shows as half-open once its
+# cooldown has passed even if no request has looked at it since. Held weakly,
+# so a breaker drops out of the gauge with the service that owned it
+_breakers: weakref.WeakValueDictionary[str, "CircuitBreaker"] = (
+    weakref.WeakValueDictionary()
+)
+CIRCUIT_STATE.set_callback(
+    lambda: [
+        ((name,), _STATE_VALUES[breaker.state]) for name, breaker in _breakers.items()
+    ]
+)
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker with half-open probing.
+
+    The breaker opens when, over the last ``window_seconds`` and at least
+    ``min_requests`` calls, the failure rate or the slow-call rate reaches its
+    threshold. After ``open_seconds`` it lets up to ``half_open_max_probes``
+    requests through; that many successes close it, any failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = 30.0,
+        min_requests: int = 20,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float | None = None,
+        slow_call_rate_threshold: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_max_probes: int = 3,
+    ):
+        self.name = name
+        self._window_seconds = window_seconds
+        self._min_requests = min_requests
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_seconds = open_seconds
+        self._half_open_max_probes = half_open_max_probes
+
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._failures = 0
+        self._slow_calls = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejections = CIRCUIT_REJECTIONS.labels(name)
+        _breakers[name] = self
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self._open_seconds
+        ):
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a request may go to the provider now."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes_in_flight < self._half_open_max_probes:
+            self._probes_in_flight += 1
+            return True
+        self._rejections.inc()
+        return False
+
+    def record_success(self, latency: float) -> None:
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            self._probe_successes += 1
+            if self._probe_successes >= self._half_open_max_probes:
+                self._transition(CLOSED)
+            return
+        self._record(failed=False, latency=latency)
+
+    def record_failure(self, latency: float) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self._record(failed=True, latency=latency)
+
+    def record_ignored(self) -> None:
+        """Release a probe slot for a call that ended without an outcome."""
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def _record(self, failed: bool, latency: float) -> None:
+        now = time.monotonic()
+        slow = (
+            self._slow_call_seconds is not None and latency >= self._slow_call_seconds
+        )
+        self._calls.append((now, failed, slow))
+        self._failures += failed
+        self._slow_calls += slow
+
+        horizon = now - self._window_seconds
+        while self._calls and self._calls[0][0] < horizon:
+            _, old_failed, old_slow = self._calls.popleft()
+            self._failures -= old_failed
+            self._slow_calls -= old_slow
+
+        total = len(self._calls)
+        if self._state != CLOSED or total < self._min_requests:
+            return
+        if (
+            self._failures / total >= self._failure_rate_threshold
+            or self._slow_calls / total >= self._slow_call_rate_threshold
+        ):
+            self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CLOSED:
+            self._calls.clear()
+            self._failures = 0
+            self._slow_calls = 0
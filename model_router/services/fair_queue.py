@@ -0,0 +1,125 @@
+"""Weighted fair queueing of tenants for a provider's concurrency budget."""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncGenerator
+
+from model_router.domain.exceptions import ProviderUnavailableError
+from model_router.metrics import registry
+
+QUEUE_WAIT = registry.histogram(
+    "model_router_fair_queue_wait_seconds",
+    "Time requests waited for a provider concurrency slot, by tenant role",
+    ("provider", "role"),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+QUEUE_REJECTED = registry.counter(
+    "model_router_fair_queue_rejected_total",
+    "Requests that got no provider concurrency slot (queue full or timed out)",
+    ("provider", "reason"),
+)
+QUEUE_DEPTH = registry.gauge(
+    "model_router_fair_queue_depth",
+    "Requests waiting for a provider concurrency slot",
+    ("provider",),
+)
+
+_queues: list["FairQueue"] = []
+QUEUE_DEPTH.set_callback(lambda: [((queue.name,), queue.waiting) for queue in _queues])
+
+
+class FairQueue:
+    """Concurrency limit for one provider that hands out slots fairly.
+
+    Below ``max_concurrency`` requests pass straight through. Beyond it they
+    wait, and each freed slot goes to the waiter with the smallest virtual
+    finish time: a tenant's requests are spaced ``1 / weight`` apart in virtual
+    time, so a tenant with a deep backlog only gets its weighted share of the
+    slots, and a tenant arriving later is served ahead of that backlog.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_depth: int = 1000,
+        timeout_seconds: float = 10.0,
+    ):
+        self.name = name
+        self._max_concurrency = max_concurrency
+        self._max_depth = max_depth
+        self._timeout_seconds = timeout_seconds
+        self.active = 0
+        self.waiting = 0
+        self._heap: list[tuple[float, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: dict[str, float] = {}
+        _queues.append(self)
+
+    async def acquire(
+        self, tenant: str | None, weight: float = 1.0, role: str | None = None
+    ) -> None:
+        """Wait for a slot; every acquired slot must be given back with release."""
+        if self.active < self._max_concurrency and not self.waiting:
+            self.active += 1
+            QUEUE_WAIT.labels(self.name, role or "").observe(0.0)
+            return
+
+        if self.waiting >= self._max_depth:
+            QUEUE_REJECTED.labels(self.name, "full").inc()
+            raise ProviderUnavailableError(f"Request queue for {self.name} is full")
+
+        tenant = tenant or ""
+        start = max(self._virtual_time, self._last_finish.get(tenant, 0.0))
+        finish = start + 1 / weight
+        self._last_finish[tenant] = finish
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        heapq.heappush(self._heap, (finish, next(self._sequence), start, waiter))
+        self.waiting += 1
+
+        enqueued = loop.time()
+        try:
+            async with asyncio.timeout(self._timeout_seconds):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Handed a slot while being cancelled: pass it on
+                self.release()
+            else:
+                # Left in the heap and skipped once it reaches the top
+                waiter.cancel()
+                self.waiting -= 1
+            if isinstance(e, TimeoutError):
+                QUEUE_REJECTED.labels(self.name, "timeout").inc()
+                raise ProviderUnavailableError(
+                    f"Timed out waiting for a {self.name} request slot"
+                ) from None
+            raise
+        QUEUE_WAIT.labels(self.name, role or "").observe(loop.time() - enqueued)
+
+    def release(self) -> None:
+        """Give a slot back, handing it straight to the next waiter if any."""
+        while self._heap:
+            _, _, start, waiter = heapq.heappop(self._heap)
+            if waiter.done():
+                continue
+            self.waiting -= 1
+            self._virtual_time = start
+            waiter.set_result(None)
+            return
+
+        self.active -= 1
+        # Every backlog is gone, so past finish times no longer matter
+        self._last_finish.clear()
+
+    async def release_after(self, chunks: AsyncGenerator[str]) -> AsyncGenerator[str]:
+        """Hold the slot until a stream is fully consumed."""
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            self.release()
@@ -0,0 +1,273 @@
+"""Shared upstream HTTP connection pools."""
+
+import asyncio
+import importlib.util
+import socket
+import ssl
+import time
+import typing
+
+import httpcore
+import httpx
+
+from model_router.logger import get_logger
+from model_router.metrics import registry
+from model_router.tracing import TRACEPARENT_HEADER, current_span, tracer
+
+# HTTP/2 needs h2, installed with httpx[http2]; fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+POOL_WAIT = registry.histogram(
+    "model_router_upstream_pool_wait_seconds",
+    "Time a request waited for a pooled upstream connection",
+    ("host",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+POOL_CONNECTS = registry.counter(
+    "model_router_upstream_connections_opened_total",
+    "New upstream connections, each one a TCP and TLS handshake",
+    ("host",),
+)
+POOL_CONNECTIONS = registry.gauge(
+    "model_router_upstream_pool_connections",
+    "Upstream connections per host by state (active or idle)",
+    ("host", "state"),
+)
+POOL_UTILIZATION = registry.gauge(
+    "model_router_upstream_pool_utilization",
+    "In-flight upstream requests per host as a share of max connections",
+    ("host",),
+)
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches resolved addresses for ``ttl_seconds``.
+
+    Connections go to the cached address; TLS still verifies and sends SNI for
+    the original host name, which the connection pool passes separately.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[float, str]] = {}
+
+    async def resolve(self, host: str, port: int) -> str:
+        """Address for host, from the cache while it is fresh."""
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        address = infos[0][4][0]
+        self._cache[(host, port)] = (time.monotonic() + self._ttl_seconds, address)
+        return address
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self.resolve(host, port) if self._ttl_seconds > 0 else host
+        try:
+            return await self._backend.connect_tcp(
+                address,
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+        except (httpcore.ConnectError, httpcore.ConnectTimeout):
+            # The host may have moved; resolve it again on the next attempt
+            self._cache.pop((host, port), None)
+            raise
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """Transport for one upstream host that reports pool wait and utilization.
+
+    Requests carry the current span as their ``traceparent``, and opening a new
+    connection is recorded as an ``upstream_connect`` span.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        limits: httpx.Limits,
+        http2: bool = False,
+        network_backend: httpcore.AsyncNetworkBackend | None = None,
+        verify: ssl.SSLContext | str | bool = True,
+    ):
+        # Built once, so a rebuilt pool keeps the certificates to verify against
+        ssl_context = httpx.create_ssl_context(verify=verify)
+        super().__init__(verify=ssl_context, limits=limits, http2=http2)
+        # Without a proxy, rebuild the pool on the given network backend
+        direct = type(self._pool) is httpcore.AsyncConnectionPool
+        if network_backend is not None and direct:
+            self._pool = httpcore.AsyncConnectionPool(
+                ssl_context=ssl_context,
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+                http2=http2,
+                network_backend=network_backend,
+            )
+        self.host = host
+        self.max_connections = limits.max_connections or 0
+        self.in_flight = 0
+        self._wait = POOL_WAIT.labels(host)
+        self._connects = POOL_CONNECTS.labels(host)
+
+    def connection_counts(self) -> tuple[int, int]:
+        """Number of (active, idle) connections in the pool."""
+        connections = getattr(self._pool, "connections", ())
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return len(connections) - idle, idle
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        waiting = True
+        outer_trace = request.extensions.get("trace")
+        parent = current_span.get()
+        if parent is not None and tracer.enabled:
+            request.headers[TRACEPARENT_HEADER] = parent.traceparent
+        connect_span = None
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal waiting, connect_span
+            # The first event fires once the pool has handed out a connection
+            if waiting:
+                waiting = False
+                self._wait.observe(time.perf_counter() - started)
+            if event_name == "connection.connect_tcp.started":
+                connect_span = tracer.start_span("upstream_connect", parent=parent)
+                connect_span.set_attribute("host", self.host)
+            elif event_name == "connection.connect_tcp.complete":
+                self._connects.inc()
+            elif connect_span is not None and not event_name.startswith(
+                "connection."
+            ):
+                # The handshakes are done once the request starts going out
+                connect_span.end()
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        self.in_flight += 1
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+            if connect_span is not None:
+                connect_span.end()
+
+
+class HttpPoolManager:
+    """Hands out one pooled async HTTP client per upstream host.
+
+    The manager owns the clients for the life of the process: ``warm_up`` opens
+    connections before traffic arrives, so the first requests after a deploy
+    skip the TCP and TLS handshakes, and ``aclose`` closes them on shutdown.
+    """
+
+    def __init__(self):
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, PooledTransport] = {}
+        self._logger = get_logger(__name__)
+        self.configure()
+        POOL_CONNECTIONS.set_callback(self._connection_samples)
+        POOL_UTILIZATION.set_callback(self._utilization_samples)
+
+    def configure(
+        self,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 60.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 600.0,
+        http2: bool = True,
+        dns_ttl_seconds: float = 300.0,
+    ) -> None:
+        """Set the per-host pool settings for clients created from now on."""
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._dns_backend = CachingDNSBackend(dns_ttl_seconds)
+
+    def get_client(self, base_url: str) -> httpx.AsyncClient:
+        """Get the shared client for the host of the given base URL."""
+        url = httpx.URL(base_url)
+        origin = f"{url.scheme}://{url.netloc.decode()}"
+
+        client = self._clients.get(origin)
+        if client is None:
+            transport = PooledTransport(
+                url.host, self._limits, self._http2, self._dns_backend
+            )
+            client = httpx.AsyncClient(timeout=self._timeout, transport=transport)
+            self._clients[origin] = client
+            self._transports[origin] = transport
+        return client
+
+    async def warm_up(self, connections_per_host: int = 1) -> None:
+        """Open connections to every known upstream host ahead of traffic."""
+
+        async def warm(origin: str, client: httpx.AsyncClient) -> None:
+            try:
+                # Any answer, even a 404, leaves an open connection in the pool
+                await client.head(origin, timeout=self._timeout.connect)
+            except httpx.HTTPError as e:
+                self._logger.warning(f"Could not pre-warm {origin}: {e}")
+
+        await asyncio.gather(*(
+            warm(origin, client)
+            for origin, client in self._clients.items()
+            for _ in range(connections_per_host)
+        ))
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._transports.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+    def _connection_samples(self):
+        for transport in self._transports.values():
+            active, idle = transport.connection_counts()
+            yield (transport.host, "active"), active
+            yield (transport.host, "idle"), idle
+
+    def _utilization_samples(self):
+        for transport in self._transports.values():
+            if transport.max_connections:
+                utilization = transport.in_flight / transport.max_connections
+                yield (transport.host,), utilization
+
+
+http_pool = HttpPoolManager()
@@ -0,0 +1,220 @@
+"""API key pools with load balancing and rate-limit cooldowns."""
+
+import math
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping
+from typing import Any
+
+from model_router.domain.exceptions import ProviderRateLimitError
+from model_router.domain.providers import UpstreamKey
+
+LEAST_OUTSTANDING = "least_outstanding"
+WEIGHTED_ROUND_ROBIN = "weighted_round_robin"
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Read the cooldown a provider asked for, in seconds."""
+    try:
+        if retry_after_ms := headers.get("retry-after-ms"):
+            return float(retry_after_ms) / 1000
+        if retry_after := headers.get("retry-after"):
+            return float(retry_after)
+    except ValueError:
+        pass
+    return None
+
+
+_RATE_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-limit-tokens"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-limit"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-limit"),
+)
+
+
+def parse_rate_limit_headroom(headers: Mapping[str, str]) -> float | None:
+    """Read the smallest share of a provider's rate limits still left, 0 to 1."""
+    headroom = None
+    for remaining_header, limit_header in _RATE_LIMIT_HEADERS:
+        remaining = headers.get(remaining_header)
+        limit = headers.get(limit_header)
+        if not remaining or not limit:
+            continue
+        try:
+            share = float(remaining) / float(limit)
+        except (ValueError, ZeroDivisionError):
+            continue
+        headroom = share if headroom is None else min(headroom, share)
+    return None if headroom is None else min(max(headroom, 0.0), 1.0)
+
+
+class RateLimitHeadroom:
+    """Rate-limit headroom an upstream reported with its last answer, per model."""
+
+    def __init__(self):
+        self._headroom: dict[str, float] = {}
+
+    def observe(self, model_name: str, headers: Mapping[str, str]) -> None:
+        headroom = parse_rate_limit_headroom(headers)
+        if headroom is not None:
+            self._headroom[model_name] = headroom
+
+    def get(self, model_name: str) -> float | None:
+        return self._headroom.get(model_name)
+
+
+class PoolMember:
+    """One key/base URL pair of a pool and the client bound to it."""
+
+    def __init__(self, key: UpstreamKey, base_url: str, client: Any):
+        self.api_key = key.api_key
+        self.base_url = base_url
+        self.weight = max(key.weight, 1)
+        self.client = client
+        self.outstanding = 0
+        self.cooldown_until = 0.0
+        self.current_weight = 0
+
+
+class KeyPool:
+    """Spreads requests over a provider's API keys and parks rate-limited ones."""
+
+    def __init__(
+        self,
+        keys: list[UpstreamKey],
+        default_base_url: str,
+        client_factory: Callable[[str, str], Any],
+        strategy: str = LEAST_OUTSTANDING,
+        cooldown_seconds: float = 30.0,
+    ):
+        self._members = [
+            PoolMember(
+                key,
+                key.base_url or default_base_url,
+                client_factory(key.api_key, key.base_url or default_base_url),
+            )
+            for key in keys
+        ]
+        self._strategy = strategy
+        self._cooldown_seconds = cooldown_seconds
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    @property
+    def members(self) -> list[PoolMember]:
+        return self._members
+
+    def acquire(self, exclude: set[int] | None = None) -> PoolMember | None:
+        """Pick a member not cooling down and not in exclude, or None."""
+        now = time.monotonic()
+        candidates = [
+            member for member in self._members
+            if member.cooldown_until <= now
+            and (not exclude or id(member) not in exclude)
+        ]
+        if not candidates:
+            return None
+
+        if self._strategy == WEIGHTED_ROUND_ROBIN:
+            member = self._pick_weighted_round_robin(candidates)
+        else:
+            member = self._pick_least_outstanding(candidates)
+
+        member.outstanding += 1
+        return member
+
+    def release(self, member: PoolMember) -> None:
+        """Mark a request on the member as finished."""
+        member.outstanding -= 1
+
+    def park(self, member: PoolMember, retry_after: float | None = None) -> None:
+        """Take a rate-limited member out of rotation for a cooldown period.
+
+        Without a Retry-After the last member in rotation is left in it, so a
+        single 429 cannot take the provider out for the whole default cooldown.
+        """
+        now = time.monotonic()
+        if retry_after is None:
+            if not any(
+                other is not member and other.cooldown_until <= now
+                for other in self._members
+            ):
+                return
+            retry_after = self._cooldown_seconds
+        member.cooldown_until = now + retry_after
+
+    def retry_after(self) -> float | None:
+        """Whole seconds until the first parked member is back in rotation."""
+        now = time.monotonic()
+        cooldowns = [
+            member.cooldown_until - now
+            for member in self._members
+            if member.cooldown_until > now
+        ]
+        return math.ceil(min(cooldowns)) if cooldowns else None
+
+    async def call[T](
+        self, send: Callable[[PoolMember], Awaitable[T]], label: str
+    ) -> T:
+        """Send a request with one member after another until one is not limited.
+
+        A rate-limited member is parked and the next one is tried. A stream holds
+        its member as outstanding until it is fully consumed.
+        """
+        tried: set[int] = set()
+        last_error: ProviderRateLimitError | None = None
+        while member := self.acquire(tried):
+            try:
+                result = await send(member)
+            except ProviderRateLimitError as e:
+                self.release(member)
+                self.park(member, e.retry_after)
+                tried.add(id(member))
+                last_error = e
+                continue
+            except BaseException:
+                self.release(member)
+                raise
+
+            if isinstance(result, AsyncGenerator):
+                return self.release_after(member, result)
+            self.release(member)
+            return result
+
+        retry_after = self.retry_after()
+        if last_error is not None and retry_after is None:
+            raise last_error
+        raise ProviderRateLimitError(
+            str(last_error) if last_error else
+            f"{label} API error: all API keys are cooling down",
+            retry_after=retry_after,
+        ) from last_error
+
+    async def release_after(
+        self, member: PoolMember, chunks: AsyncGenerator[str]
+    ) -> AsyncGenerator[str]:
+        """Hold the member as outstanding until a stream is fully consumed."""
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            self.release(member)
+
+    def _pick_least_outstanding(self, candidates: list[PoolMember]) -> PoolMember:
+        self._cursor = (self._cursor + 1) % len(candidates)
+        rotated = candidates[self._cursor:] + candidates[:self._cursor]
+        return min(rotated, key=lambda member: member.outstanding / member.weight)
+
+    def _pick_weighted_round_robin(self, candidates: list[PoolMember]) -> PoolMember:
+        total = 0
+        best = candidates[0]
+        for member in candidates:
+            member.current_weight += member.weight
+            total += member.weight
+            if member.current_weight > best.current_weight:
+                best = member
+        best.current_weight -= total
+        return best
@@ -0,0 +1,33 @@
+"""Recent upstream latency per model."""
+
+from collections import deque
+
+
+class LatencyTracker:
+    """Keeps a sliding window of recent upstream latencies for each model.
+
+    Streams answer once their first chunk or headers arrive, long before a full
+    completion would, so they are kept in a window of their own.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: dict[tuple[str, bool], deque[float]] = {}
+
+    def observe(self, model: str, seconds: float, streaming: bool = False) -> None:
+        """Record the latency of a successful upstream call."""
+        samples = self._samples.get((model, streaming))
+        if samples is None:
+            samples = self._samples[model, streaming] = deque(maxlen=self._window)
+        samples.append(seconds)
+
+    def percentile(
+        self, model: str, quantile: float, streaming: bool = False
+    ) -> float | None:
+        """Latency at the given quantile, or None until enough samples are seen."""
+        samples = self._samples.get((model, streaming))
+        if not samples or len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(quantile * len(ordered)), len(ordered) - 1)]
@@ -1,42 +1,249 @@
 """Model router service."""
 
+import asyncio
+import itertools
+import time
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import contextmanager
 
 from model_router.domain.call_context import CallContext
 from model_router.domain.exceptions import (
+    ModelNotSupportedError,
+    ModelRouterException,
+    ProviderAPIError,
     ProviderNotConfiguredError,
+    ProviderRateLimitError,
+    ProviderTimeoutError,
+    ProviderUnavailableError,
 )
 from model_router.domain.models import (
     ChatCompletionRequest,
     ChatCompletionResponse,
     ProviderInfo,
+    RawChatCompletion,
 )
+from model_router.domain.providers import ModelPrice
 from model_router.logger import get_logger
+from model_router.metrics import registry
 from model_router.services.adapters.base import ProviderAdapter
+from model_router.services.circuit_breaker import OPEN, CircuitBreaker
+from model_router.services.fair_queue import FairQueue
+from model_router.services.latency_tracker import LatencyTracker
+from model_router.services.response_cache_service import (
+    ResponseCacheService,
+    is_cacheable_request,
+    request_cache_key,
+)
+from model_router.services.routing_engine import RoutingEngine
+from model_router.services.single_flight import SingleFlight
+from model_router.tracing import Span, tracer
+
+CACHE_STATUS_HEADER = "X-Cache"
+ROUTED_MODEL_HEADER = "X-Routed-Model"
+REQUEST_COST_HEADER = "X-Request-Cost"
+
+UPSTREAM_COST = registry.counter(
+    "model_router_upstream_cost_usd_total",
+    "List-price cost of upstream calls, from reported token usage",
+    ("model",),
+)
+
+HEDGE_ELIGIBLE = registry.counter(
+    "model_router_hedge_eligible_total",
+    "Upstream attempts that could have been hedged",
+    ("model",),
+)
+HEDGES = registry.counter(
+    "model_router_hedged_requests_total",
+    "Upstream attempts for which a hedge request was launched",
+    ("model",),
+)
+HEDGE_WINS = registry.counter(
+    "model_router_hedge_wins_total",
+    "Hedged attempts won by the hedge request",
+    ("model",),
+)
+HEDGE_WASTED_TOKENS = registry.counter(
+    "model_router_hedge_wasted_tokens_total",
+    "Tokens spent on losing hedge requests (prompt estimate when cancelled)",
+    ("model",),
+)
+
+
+def estimate_prompt_tokens(request: ChatCompletionRequest) -> int:
+    """Rough prompt size, for accounting when no usage is reported."""
+    return sum(len(message.content) for message in request.messages) // 4
+
+
+async def _prepend_chunk(
+    first: str, chunks: AsyncGenerator[str]
+) -> AsyncGenerator[str]:
+    try:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+async def _trace_first_chunk(
+    chunks: AsyncGenerator[str], span: Span
+) -> AsyncGenerator[str]:
+    """Relay a stream, ending ``span`` when its first chunk arrives."""
+    try:
+        async for chunk in chunks:
+            span.end()
+            yield chunk
+    finally:
+        span.end()
+        await chunks.aclose()
+
+
+async def _stream_until(
+    chunks: AsyncGenerator[str], deadline: float, model: str
+) -> AsyncGenerator[str]:
+    """Relay a stream, cancelling the upstream read once the deadline passes."""
+    try:
+        while True:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    chunk = await anext(chunks)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                raise ProviderTimeoutError(
+                    f"Request deadline exceeded while streaming {model}"
+                ) from None
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+async def _empty_stream() -> AsyncGenerator[str]:
+    return
+    yield
+
+
+class _UpstreamClock:
+    """Wall time during which at least one upstream call of a request was running.
+
+    Hedged calls overlap, so adding up their durations would count time twice.
+    """
+
+    def __init__(self):
+        self._in_flight = 0
+        self._since = 0.0
+        self._seconds = 0.0
+
+    @property
+    def seconds(self) -> float:
+        if self._in_flight:
+            return self._seconds + time.perf_counter() - self._since
+        return self._seconds
+
+    @contextmanager
+    def running(self) -> Iterator[None]:
+        if not self._in_flight:
+            self._since = time.perf_counter()
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._seconds += time.perf_counter() - self._since
+
+
+# Unique across service instances, so a version never means two different catalogs
+_catalog_versions = itertools.count(1)
+
+
+def is_retryable_error(error: ProviderAPIError) -> bool:
+    """Whether another upstream might succeed where this one failed."""
+    status_code = error.status_code
+    return status_code is None or status_code == 429 or status_code >= 500
 
 
 class ModelRouterService:
     """Service for routing requests to appropriate AI providers."""
 
-    def __init__(self, providers: dict[str, ProviderAdapter]):
+    def __init__(
+        self,
+        providers: dict[str, ProviderAdapter],
+        response_cache: ResponseCacheService | None = None,
+        single_flight: SingleFlight | None = None,
+        model_fallbacks: dict[str, list[str]] | None = None,
+        request_deadline_seconds: float = 60.0,
+        upstream_timeout_seconds: float = 30.0,
+        latency_tracker: LatencyTracker | None = None,
+        adaptive_timeouts_enabled: bool = True,
+        adaptive_timeout_quantile: float = 0.99,
+        adaptive_timeout_multiplier: float = 3.0,
+        min_upstream_timeout_seconds: float = 5.0,
+        hedging_enabled: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_default_delay_seconds: float = 1.0,
+        hedge_min_delay_seconds: float = 0.05,
+        circuit_breaker_factory: Callable[[str], CircuitBreaker] | None = None,
+        model_aliases: dict[str, list[str]] | None = None,
+        routing_engine: RoutingEngine | None = None,
+        model_prices: dict[str, ModelPrice] | None = None,
+        model_capabilities: dict[str, list[str]] | None = None,
+        fair_queue_factory: Callable[[str], FairQueue | None] | None = None,
+        tenant_weights: dict[str, float] | None = None,
+    ):
         self._providers = providers
+        self._response_cache = response_cache
+        self._single_flight = single_flight
+        self._model_fallbacks = model_fallbacks or {}
+        self._request_deadline_seconds = request_deadline_seconds
+        self._upstream_timeout_seconds = upstream_timeout_seconds
+        self._latency_tracker = latency_tracker or LatencyTracker()
+        self._adaptive_timeouts_enabled = adaptive_timeouts_enabled
+        self._adaptive_timeout_quantile = adaptive_timeout_quantile
+        self._adaptive_timeout_multiplier = adaptive_timeout_multiplier
+        self._min_upstream_timeout_seconds = min_upstream_timeout_seconds
+        self._hedging_enabled = hedging_enabled
+        self._hedge_quantile = hedge_quantile
+        self._hedge_default_delay_seconds = hedge_default_delay_seconds
+        self._hedge_min_delay_seconds = hedge_min_delay_seconds
+        self._model_aliases = model_aliases or {}
+        self._routing_engine = routing_engine or RoutingEngine()
+        self._model_capabilities = model_capabilities or {}
         self._provider_by_prefix = {}
+        self._prices: dict[str, ModelPrice] = {}
         for provider in providers.values():
-            prefix_str = provider.prefix.value if hasattr(provider.prefix, 'value') else str(provider.prefix)
+            prefix_str = self._prefix_of(provider)
             self._provider_by_prefix[prefix_str] = provider
+            for model, price in provider.get_model_prices().items():
+                self._prices[f"{prefix_str}/{model}"] = price
+        self._prices.update(model_prices or {})
+        self._breakers: dict[str, CircuitBreaker] = {}
+        if circuit_breaker_factory:
+            self._breakers = {
+                prefix: circuit_breaker_factory(prefix)
+                for prefix in self._provider_by_prefix
+            }
+        self._fair_queues: dict[str, FairQueue] = {}
+        if fair_queue_factory:
+            for prefix in self._provider_by_prefix:
+                if queue := fair_queue_factory(prefix):
+                    self._fair_queues[prefix] = queue
+        self._tenant_weights = tenant_weights or {}
+        self._catalog: list[tuple[ProviderAdapter, str, list[str]]] | None = None
+        self.catalog_version = next(_catalog_versions)
         self._logger = get_logger(__name__)
 
     def get_provider_for_model(self, model: str) -> ProviderAdapter:
         """Get the appropriate provider for a given model."""
         if "/" not in model:
             # For backward compatibility, treat as "Model not found" (404)
-            from model_router.domain.exceptions import ModelNotSupportedError
             raise ModelNotSupportedError(f"Model {model} not found")
 
         prefix = model.split("/")[0]
 
         if prefix not in self._provider_by_prefix:
             # For backward compatibility, treat as "Model not found" (404)
-            from model_router.domain.exceptions import ModelNotSupportedError
             raise ModelNotSupportedError(f"Model {model} not found")
 
         provider = self._provider_by_prefix[prefix]
@@ -46,49 +253,578 @@ class ModelRouterService:
 
         return provider
 
+    def get_targets_for_model(
+        self,
+        model: str,
+        streaming: bool = False,
+        capability: str | None = None,
+        latency_slo_seconds: float | None = None,
+    ) -> list[tuple[str, ProviderAdapter]]:
+        """Get the model and its configured fallbacks, in the order to try them.
+
+        A model alias expands to the targets serving it, ranked by the routing
+        engine, with targets whose circuit is open moved to the end. With a
+        capability, only alias targets tagged with it are considered.
+        """
+        candidates = [model]
+        if aliased := self._model_aliases.get(model):
+            if capability:
+                aliased = [
+                    target for target in aliased
+                    if capability in self._model_capabilities.get(target, ())
+                ]
+                if not aliased:
+                    raise ModelNotSupportedError(
+                        f"No target for model {model} has capability {capability}"
+                    )
+            healthy = [target for target in aliased if not self._circuit_open(target)]
+            ranked = self._routing_engine.rank(
+                model, healthy, streaming, self._prices, latency_slo_seconds
+            )
+            candidates = [
+                *ranked, *(target for target in aliased if target not in healthy)
+            ]
+
+        targets = []
+        first_error: ModelRouterException | None = None
+        for target in [*candidates, *self._model_fallbacks.get(model, [])]:
+            try:
+                targets.append((target, self.get_provider_for_model(target)))
+            except (ModelNotSupportedError, ProviderNotConfiguredError) as e:
+                first_error = first_error or e
+
+        if not targets:
+            raise first_error
+        return targets
+
+    def _circuit_open(self, model: str) -> bool:
+        breaker = self._breakers.get(model.split("/", 1)[0])
+        return breaker is not None and breaker.state == OPEN
+
     async def create_chat_completion(
-        self, request: ChatCompletionRequest, call_context: CallContext | None = None
-    ) -> ChatCompletionResponse:
+        self,
+        request: ChatCompletionRequest,
+        call_context: CallContext | None = None,
+        force_cache: bool = False,
+        capability: str | None = None,
+        latency_slo_seconds: float | None = None,
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
         """Route chat completion request to appropriate provider."""
         self._logger.info(
-            f"Routing chat completion for model: {request.model}",
-            call_context=call_context
+            "Routing chat completion for model: %s",
+            request.model,
+            call_context=call_context,
+            hot_path=True,
+        )
+
+        with tracer.span("route", model=request.model):
+            targets = self.get_targets_for_model(
+                request.model, bool(request.stream), capability, latency_slo_seconds
+            )
+
+        cacheable = is_cacheable_request(request, force_cache)
+        if not cacheable or not (self._response_cache or self._single_flight):
+            return await self._complete_with_fallbacks(request, targets, call_context)
+
+        key = request_cache_key(request)
+        if self._response_cache:
+            cached = await self._response_cache.get(key)
+            if cached is not None:
+                if call_context:
+                    # Only answered requests are cached, so the model is a real one
+                    call_context.model = request.model
+                    call_context.response_headers[CACHE_STATUS_HEADER] = "HIT"
+                return cached
+
+        # The shared upstream call runs to the router's own deadline; each caller
+        # stops waiting for it at theirs
+        deadline = call_context.deadline if call_context else None
+        try:
+            async with asyncio.timeout_at(deadline):
+                if self._single_flight:
+                    response, upstream = await self._single_flight.do(
+                        key,
+                        lambda: self._fetch_cacheable(
+                            targets, request, key, call_context
+                        ),
+                    )
+                else:
+                    response, upstream = await self._fetch_cacheable(
+                        targets, request, key, call_context
+                    )
+        except TimeoutError:
+            raise ProviderTimeoutError(
+                f"Request deadline exceeded for model {request.model}"
+            ) from None
+
+        if call_context:
+            call_context.response_headers.update(upstream.response_headers)
+            call_context.model = upstream.model
+            call_context.upstream_seconds += upstream.upstream_seconds
+            if self._response_cache:
+                call_context.response_headers[CACHE_STATUS_HEADER] = "MISS"
+        return response
+
+    async def _fetch_cacheable(
+        self,
+        targets: list[tuple[str, ProviderAdapter]],
+        request: ChatCompletionRequest,
+        key: str,
+        call_context: CallContext | None = None,
+    ) -> tuple[ChatCompletionResponse | RawChatCompletion, CallContext]:
+        """Call the providers once for a cacheable request and store the result.
+
+        Returns the context of the upstream call with the response, as its headers
+        and timings are shared by every caller waiting on it. The upstream call is
+        queued as the tenant of the caller that started it.
+        """
+        upstream_context = CallContext(
+            user_id=call_context.user_id if call_context else None,
+            user_role=call_context.user_role if call_context else None,
+        )
+        response = await self._complete_with_fallbacks(
+            request, targets, upstream_context
         )
+        if self._response_cache:
+            await self._response_cache.set(key, response)
+        return response, upstream_context
+
+    async def _complete_with_fallbacks(
+        self,
+        request: ChatCompletionRequest,
+        targets: list[tuple[str, ProviderAdapter]],
+        call_context: CallContext | None = None,
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
+        """Try each target in order until one answers or the deadline passes.
+
+        The deadline is the client's, capped by the router's own, and bounds any
+        wait for a provider's queue. Once a slot is granted, each attempt is
+        cancelled after the upstream timeout, which adapts to the model's recent
+        latency when the client set no deadline. A stream is also cut off once a
+        client deadline passes.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._request_deadline_seconds
+        client_deadline = call_context.deadline if call_context else None
+        if client_deadline is not None:
+            deadline = min(deadline, client_deadline)
+        last_error: ProviderAPIError | None = None
+        clock = _UpstreamClock()
+        # Models already called, including any target a hedge went to
+        tried: set[str] = set()
+
+        try:
+            for index, (model, provider) in enumerate(targets):
+                if model in tried:
+                    continue
+                tried.add(model)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                if model != request.model:
+                    self._logger.warning(
+                        "Failing over from %s to %s: %s",
+                        request.model,
+                        model,
+                        last_error,
+                        call_context=call_context,
+                    )
+
+                try:
+                    async with asyncio.timeout(remaining):
+                        hedge = next(
+                            (
+                                target for target in targets[index + 1:]
+                                if target[0] not in tried
+                            ),
+                            None,
+                        )
+                        if self._hedging_enabled and hedge is not None:
+                            model, response = await self._attempt_hedged(
+                                request,
+                                (model, provider),
+                                hedge,
+                                clock,
+                                tried,
+                                call_context,
+                            )
+                        else:
+                            response = await self._attempt(
+                                request, model, provider, clock,
+                                call_context=call_context,
+                            )
+                except TimeoutError:
+                    # Running out of the request's deadline is not the upstream's
+                    # fault, so nothing is charged for it
+                    last_error = ProviderTimeoutError(f"Model {model} timed out")
+                    break
+                except ProviderAPIError as e:
+                    if not is_retryable_error(e):
+                        raise
+                    last_error = e
+                    continue
+
+                if call_context:
+                    call_context.model = model
+                    call_context.response_headers[ROUTED_MODEL_HEADER] = model
+                self._account_cost(model, response, call_context)
+                if client_deadline is not None and not isinstance(
+                    response, ChatCompletionResponse | RawChatCompletion
+                ):
+                    return _stream_until(response, client_deadline, model)
+                return response
+        finally:
+            self._add_upstream_time(call_context, clock.seconds)
+
+        raise last_error or ProviderTimeoutError(
+            f"Request deadline exceeded for model {request.model}"
+        )
+
+    async def _attempt(
+        self,
+        request: ChatCompletionRequest,
+        model: str,
+        provider: ProviderAdapter,
+        clock: _UpstreamClock,
+        until_first_chunk: bool = False,
+        call_context: CallContext | None = None,
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
+        """Call one upstream target and record how long it took to answer.
+
+        With a concurrency limit on the provider, the call first waits for a slot
+        in its fair queue and holds it until the response or stream is done.
+        """
+        prefix = model.split("/", 1)[0]
+        breaker = self._breakers.get(prefix)
+        if breaker and not breaker.allow_request():
+            raise ProviderUnavailableError(
+                f"Provider for model {model} is unavailable: circuit is open"
+            )
+        upstream_timeout = self._upstream_timeout(
+            model, call_context.deadline if call_context else None, bool(request.stream)
+        )
+
+        queue = self._fair_queues.get(prefix)
+        if queue is None:
+            return await self._call_upstream(
+                request, model, provider, breaker, until_first_chunk,
+                upstream_timeout, clock,
+            )
+
+        user_id = call_context.user_id if call_context else None
+        role = call_context.user_role if call_context else None
+        try:
+            with tracer.span("queue_wait", provider=prefix):
+                await queue.acquire(
+                    user_id, self._tenant_weights.get(role or "", 1.0), role
+                )
+        except BaseException:
+            # The provider was never called, so a half-open probe slot is unused
+            if breaker:
+                breaker.record_ignored()
+            raise
+        try:
+            response = await self._call_upstream(
+                request, model, provider, breaker, until_first_chunk,
+                upstream_timeout, clock,
+            )
+        except BaseException:
+            queue.release()
+            raise
+        if isinstance(response, ChatCompletionResponse | RawChatCompletion):
+            queue.release()
+            return response
+        return queue.release_after(response)
+
+    async def _call_upstream(
+        self,
+        request: ChatCompletionRequest,
+        model: str,
+        provider: ProviderAdapter,
+        breaker: CircuitBreaker | None,
+        until_first_chunk: bool,
+        upstream_timeout: float,
+        clock: _UpstreamClock,
+    ) -> ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]:
+        if model != request.model:
+            request = request.model_copy(update={"model": model})
+
+        started = time.perf_counter()
+        with clock.running(), tracer.span("upstream", model=model) as span:
+            try:
+                async with asyncio.timeout(upstream_timeout):
+                    response = await provider.create_chat_completion(request)
+                    if span.recording and not isinstance(
+                        response, ChatCompletionResponse | RawChatCompletion
+                    ):
+                        response = _trace_first_chunk(
+                            response,
+                            tracer.start_span(
+                                "first_token", parent=span, start_ns=span.start_ns
+                            ),
+                        )
+                    if until_first_chunk and not isinstance(
+                        response, ChatCompletionResponse | RawChatCompletion
+                    ):
+                        try:
+                            first = await anext(response)
+                        except StopAsyncIteration:
+                            response = _empty_stream()
+                        else:
+                            response = _prepend_chunk(first, response)
+            except TimeoutError:
+                self._routing_engine.record_failure(model)
+                if breaker:
+                    breaker.record_failure(time.perf_counter() - started)
+                raise ProviderTimeoutError(f"Model {model} timed out") from None
+            except ProviderAPIError as e:
+                if isinstance(e, ProviderRateLimitError):
+                    self._routing_engine.record_throttled(model, e.retry_after)
+                elif is_retryable_error(e):
+                    self._routing_engine.record_failure(model)
+                if breaker:
+                    latency = time.perf_counter() - started
+                    if is_retryable_error(e):
+                        breaker.record_failure(latency)
+                    else:
+                        breaker.record_success(latency)
+                raise
+            except BaseException:
+                if breaker:
+                    breaker.record_ignored()
+                raise
+
+            latency = time.perf_counter() - started
+            self._latency_tracker.observe(model, latency, bool(request.stream))
+            self._routing_engine.record_success(
+                model,
+                latency,
+                bool(request.stream),
+                provider.rate_limit_headroom(model),
+            )
+            if breaker:
+                breaker.record_success(latency)
+            return response
+
+    def _account_cost(
+        self,
+        model: str,
+        response: ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str],
+        call_context: CallContext | None,
+    ) -> None:
+        price = self._prices.get(model)
+        if price is None or not isinstance(
+            response, ChatCompletionResponse | RawChatCompletion
+        ):
+            return
+        if not response.usage:
+            return
+        cost = price.cost(response.usage)
+        UPSTREAM_COST.labels(model).inc(cost)
+        if call_context:
+            call_context.response_headers[REQUEST_COST_HEADER] = f"{cost:.6f}"
+
+    def account_stream_cost(self, model: str | None, usage: dict) -> None:
+        """Add a stream's cost to the counter once its final usage chunk is read.
+
+        The response headers are already sent by then, so a stream has no
+        ``X-Request-Cost``.
+        """
+        price = self._prices.get(model)
+        if price is not None:
+            UPSTREAM_COST.labels(model).inc(price.cost(usage))
 
-        provider = self.get_provider_for_model(request.model)
-        return await provider.create_chat_completion(request)
+    @staticmethod
+    def _add_upstream_time(call_context: CallContext | None, seconds: float) -> None:
+        if call_context:
+            call_context.upstream_seconds += seconds
 
-    async def get_provider_info(self, call_context: CallContext | None = None) -> list[ProviderInfo]:
+    def _upstream_timeout(
+        self, model: str, client_deadline: float | None, streaming: bool = False
+    ) -> float:
+        """Time one attempt may take before it is cancelled.
+
+        Without a client deadline it is a multiple of the model's recent tail
+        latency for the same kind of call, within the configured bounds, so a
+        stuck upstream is given up on long before the fixed timeout.
+        """
+        if client_deadline is not None or not self._adaptive_timeouts_enabled:
+            return self._upstream_timeout_seconds
+        tail = self._latency_tracker.percentile(
+            model, self._adaptive_timeout_quantile, streaming
+        )
+        if tail is None:
+            return self._upstream_timeout_seconds
+        return min(
+            max(
+                tail * self._adaptive_timeout_multiplier,
+                self._min_upstream_timeout_seconds,
+            ),
+            self._upstream_timeout_seconds,
+        )
+
+    def _hedge_delay(self, model: str, streaming: bool) -> float:
+        delay = self._latency_tracker.percentile(
+            model, self._hedge_quantile, streaming
+        )
+        if delay is None:
+            delay = self._hedge_default_delay_seconds
+        return max(delay, self._hedge_min_delay_seconds)
+
+    async def _attempt_hedged(
+        self,
+        request: ChatCompletionRequest,
+        primary: tuple[str, ProviderAdapter],
+        hedge: tuple[str, ProviderAdapter],
+        clock: _UpstreamClock,
+        tried: set[str],
+        call_context: CallContext | None = None,
+    ) -> tuple[str, ChatCompletionResponse | RawChatCompletion | AsyncGenerator[str]]:
+        """Call the primary target and, if it is slow, race a duplicate against it.
+
+        The hedge is launched once the primary has not answered (or produced its
+        first stream chunk) within the recent latency quantile for the model. The
+        first successful response wins and the other request is cancelled. A
+        launched hedge's model is added to ``tried`` so a failover does not call
+        it again.
+        """
+        model = primary[0]
+        HEDGE_ELIGIBLE.labels(model).inc()
+        tasks = {
+            asyncio.ensure_future(
+                self._attempt(
+                    request,
+                    *primary,
+                    clock,
+                    until_first_chunk=True,
+                    call_context=call_context,
+                )
+            ): primary[0]
+        }
+        primary_task = next(iter(tasks))
+
+        try:
+            done, pending = await asyncio.wait(
+                tasks, timeout=self._hedge_delay(model, bool(request.stream))
+            )
+            if not done:
+                HEDGES.labels(model).inc()
+                tried.add(hedge[0])
+                hedge_task = asyncio.ensure_future(
+                    self._attempt(
+                        request,
+                        *hedge,
+                        clock,
+                        until_first_chunk=True,
+                        call_context=call_context,
+                    )
+                )
+                tasks[hedge_task] = hedge[0]
+                pending = set(tasks)
+
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary_task:
+                            HEDGE_WINS.labels(model).inc()
+                        self._discard_hedge_losers(request, model, tasks, task)
+                        return tasks[task], task.result()
+                if not pending:
+                    raise primary_task.exception()
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _discard_hedge_losers(
+        self,
+        request: ChatCompletionRequest,
+        model: str,
+        tasks: dict[asyncio.Future, str],
+        winner: asyncio.Future,
+    ) -> None:
+        wasted = 0
+        for task in tasks:
+            if task is winner:
+                continue
+            if not task.done():
+                task.cancel()
+                wasted += estimate_prompt_tokens(request)
+            elif task.exception() is None:
+                response = task.result()
+                if isinstance(response, ChatCompletionResponse | RawChatCompletion):
+                    wasted += (response.usage or {}).get("total_tokens", 0)
+                else:
+                    asyncio.ensure_future(response.aclose())
+                    wasted += estimate_prompt_tokens(request)
+        if wasted:
+            HEDGE_WASTED_TOKENS.labels(model).inc(wasted)
+
+    def invalidate_catalog(self) -> None:
+        """Forget the cached model lists, e.g. after a provider changed its models."""
+        self._catalog = None
+        self.catalog_version = next(_catalog_versions)
+
+    def circuit_states(self) -> tuple[str, ...]:
+        """Current state of every circuit breaker, in provider order."""
+        return tuple(breaker.state for breaker in self._breakers.values())
+
+    async def _get_catalog(
+        self, call_context: CallContext | None = None
+    ) -> list[tuple[ProviderAdapter, str, list[str]]]:
+        """Each provider with its prefix and models, fetched concurrently once.
+
+        Provider configuration is fixed for the life of the service, so the lists
+        are kept until ``invalidate_catalog`` is called.
+        """
+        if self._catalog is None:
+            self._logger.info("Loading provider model lists", call_context=call_context)
+            providers = list(self._providers.values())
+            model_lists = await asyncio.gather(
+                *(provider.get_available_models() for provider in providers)
+            )
+            self._catalog = [
+                (provider, self._prefix_of(provider), models)
+                for provider, models in zip(providers, model_lists, strict=True)
+            ]
+        return self._catalog
+
+    @staticmethod
+    def _prefix_of(provider: ProviderAdapter) -> str:
+        prefix = provider.prefix
+        return prefix.value if hasattr(prefix, "value") else str(prefix)
+
+    async def get_provider_info(
+        self, call_context: CallContext | None = None
+    ) -> list[ProviderInfo]:
         """Get information about all configured providers."""
         self._logger.info("Getting provider information", call_context=call_context)
 
         provider_info = []
-
-        for provider in self._providers.values():
-            available_models = await provider.get_available_models()
-
-            prefix_str = provider.prefix.value if hasattr(provider.prefix, 'value') else str(provider.prefix)
+        for provider, prefix, models in await self._get_catalog(call_context):
+            breaker = self._breakers.get(prefix)
             provider_info.append(ProviderInfo(
                 name=provider.provider_name,
-                prefix=prefix_str,
+                prefix=prefix,
                 configured=provider.is_configured(),
-                available_models=available_models
+                circuit_state=breaker.state if breaker else None,
+                available_models=models
             ))
 
         return provider_info
 
-    async def get_available_models(self, call_context: CallContext | None = None) -> dict[str, list[str]]:
+    async def get_available_models(
+        self, call_context: CallContext | None = None
+    ) -> dict[str, list[str]]:
         """Get all available models grouped by provider."""
         self._logger.info("Getting available models", call_context=call_context)
 
-        models_by_provider = {}
-
-        for provider in self._providers.values():
-            if provider.is_configured():
-                models = await provider.get_available_models()
-                # Add prefix to model names
-                prefix_str = provider.prefix.value if hasattr(provider.prefix, 'value') else str(provider.prefix)
-                prefixed_models = [f"{prefix_str}/{model}" for model in models]
-                models_by_provider[provider.provider_name] = prefixed_models
-
-        return models_by_provider
+        return {
+            provider.provider_name: [f"{prefix}/{model}" for model in models]
+            for provider, prefix, models in await self._get_catalog(call_context)
+            if provider.is_configured()
+        }
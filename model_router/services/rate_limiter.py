@@ -0,0 +1,121 @@
+"""Per-user request and token rate limits."""
+
+from dataclasses import dataclass
+
+from model_router.domain.exceptions import RateLimitExceededError
+from model_router.metrics import registry
+from model_router.storages.rate_limit_storage import BucketState, RateLimitStorage
+
+RATE_LIMITED = registry.counter(
+    "model_router_rate_limited_total",
+    "Requests rejected by per-user rate limits",
+    ("role", "bucket"),
+)
+
+
+@dataclass(frozen=True)
+class RoleLimits:
+    """Quotas shared by every user of a role; 0 means unlimited."""
+
+    requests_per_second: float = 0.0
+    # Requests a user may send at once after being idle
+    burst: float = 0.0
+    tokens_per_minute: float = 0.0
+
+
+def _headers(kind: str, limit: float, state: BucketState) -> dict[str, str]:
+    """OpenAI-style ``x-ratelimit-*`` headers for one bucket."""
+    return {
+        f"x-ratelimit-limit-{kind}": str(int(limit)),
+        f"x-ratelimit-remaining-{kind}": str(int(state.remaining)),
+        f"x-ratelimit-reset-{kind}": f"{state.reset_seconds:.3f}s",
+    }
+
+
+class RateLimiter:
+    """Token buckets per user for requests per second and tokens per minute.
+
+    A request takes one token from the user's request bucket and its estimated
+    prompt tokens from the token bucket. Once the upstream reports usage, the
+    difference is settled, so a long completion can push the token bucket into
+    debt and hold back the user's next requests until it has refilled.
+    """
+
+    def __init__(
+        self,
+        storage: RateLimitStorage,
+        limits_by_role: dict[str, RoleLimits],
+        default_role: str = "user",
+    ):
+        self._storage = storage
+        self._limits_by_role = limits_by_role
+        self._default_role = default_role
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._limits_by_role)
+
+    def limits_for(self, role: str | None) -> RoleLimits | None:
+        """Limits of a role, falling back to the default role's."""
+        limits = self._limits_by_role.get(role or self._default_role)
+        if limits is None:
+            return self._limits_by_role.get(self._default_role)
+        return limits
+
+    async def check_request(self, user_id: str, role: str | None) -> dict[str, str]:
+        """Take one request from the user's bucket and return its headers."""
+        limits = self.limits_for(role)
+        if limits is None or not limits.requests_per_second:
+            return {}
+
+        capacity = max(limits.burst, limits.requests_per_second, 1.0)
+        state = await self._storage.take(
+            f"{user_id}:requests", capacity, limits.requests_per_second
+        )
+        headers = _headers("requests", capacity, state)
+        if not state.allowed:
+            RATE_LIMITED.labels(role or self._default_role, "requests").inc()
+            raise RateLimitExceededError(
+                "Rate limit exceeded: too many requests", state.retry_after, headers
+            )
+        return headers
+
+    async def check_tokens(
+        self, user_id: str, role: str | None, estimated_tokens: int
+    ) -> dict[str, str]:
+        """Take the estimated tokens of a request from the user's token bucket."""
+        limits = self.limits_for(role)
+        if limits is None or not limits.tokens_per_minute:
+            return {}
+
+        capacity = limits.tokens_per_minute
+        # A prompt larger than the whole bucket is let through once it is full
+        amount = min(estimated_tokens, capacity)
+        state = await self._storage.take(
+            f"{user_id}:tokens", capacity, capacity / 60, amount
+        )
+        headers = _headers("tokens", capacity, state)
+        if not state.allowed:
+            RATE_LIMITED.labels(role or self._default_role, "tokens").inc()
+            raise RateLimitExceededError(
+                "Rate limit exceeded: too many tokens", state.retry_after, headers
+            )
+        return headers
+
+    async def settle_tokens(
+        self, user_id: str, role: str | None, estimated_tokens: int, usage: dict
+    ) -> dict[str, str]:
+        """Charge the tokens a completion used beyond its estimate."""
+        limits = self.limits_for(role)
+        total_tokens = usage.get("total_tokens", 0)
+        if limits is None or not limits.tokens_per_minute or not total_tokens:
+            return {}
+
+        capacity = limits.tokens_per_minute
+        extra = total_tokens - min(estimated_tokens, capacity)
+        if extra <= 0:
+            return {}
+        state = await self._storage.take(
+            f"{user_id}:tokens", capacity, capacity / 60, extra, allow_debt=True
+        )
+        return _headers("tokens", capacity, state)
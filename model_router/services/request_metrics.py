@@ -0,0 +1,126 @@
+"""Per-request metrics for chat completions."""
+
+import json
+
+from model_router.domain.call_context import CallContext
+from model_router.metrics import registry
+
+# Label value for requests that never got as far as a known model
+UNKNOWN = "unknown"
+
+REQUESTS = registry.counter(
+    "model_router_requests_total",
+    "Chat completion requests by provider, model and HTTP status",
+    ("provider", "model", "status"),
+)
+REQUEST_DURATION = registry.histogram(
+    "model_router_request_duration_seconds",
+    "Chat completion time until the last byte was sent",
+    ("provider", "model", "status"),
+)
+UPSTREAM_DURATION = registry.histogram(
+    "model_router_upstream_duration_seconds",
+    "Time a request spent in upstream attempts, including failed ones",
+    ("provider", "model"),
+)
+ROUTER_OVERHEAD = registry.histogram(
+    "model_router_overhead_seconds",
+    "Time to the first response byte not spent in upstream attempts",
+    ("provider", "model"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+TIME_TO_FIRST_TOKEN = registry.histogram(
+    "model_router_time_to_first_token_seconds",
+    "Time until the first event of a streamed completion was sent",
+    ("provider", "model"),
+)
+TOKENS = registry.counter(
+    "model_router_tokens_total",
+    "Tokens reported by upstream usage, by direction (input or output)",
+    ("provider", "model", "direction"),
+)
+ERRORS = registry.counter(
+    "model_router_errors_total",
+    "Failed chat completions by exception class",
+    ("provider", "model", "error"),
+)
+
+
+class ModelInstruments:
+    """Metric children for one model, bound once and reused by every request."""
+
+    __slots__ = (
+        "provider",
+        "model",
+        "upstream",
+        "overhead",
+        "time_to_first_token",
+        "input_tokens",
+        "output_tokens",
+        "_by_status",
+    )
+
+    def __init__(self, model: str):
+        self.model = model
+        self.provider = model.split("/", 1)[0] if "/" in model else UNKNOWN
+        labels = (self.provider, model)
+        self.upstream = UPSTREAM_DURATION.labels(*labels)
+        self.overhead = ROUTER_OVERHEAD.labels(*labels)
+        self.time_to_first_token = TIME_TO_FIRST_TOKEN.labels(*labels)
+        self.input_tokens = TOKENS.labels(*labels, "input")
+        self.output_tokens = TOKENS.labels(*labels, "output")
+        self._by_status: dict[int, tuple] = {}
+
+    def observe_request(
+        self,
+        status: int,
+        seconds: float,
+        first_byte_seconds: float,
+        upstream_seconds: float,
+        streamed: bool,
+    ) -> None:
+        children = self._by_status.get(status)
+        if children is None:
+            labels = (self.provider, self.model, str(status))
+            children = self._by_status[status] = (
+                REQUESTS.labels(*labels),
+                REQUEST_DURATION.labels(*labels),
+            )
+        children[0].inc()
+        children[1].observe(seconds)
+        if upstream_seconds:
+            self.upstream.observe(upstream_seconds)
+        self.overhead.observe(max(first_byte_seconds - upstream_seconds, 0.0))
+        if streamed:
+            self.time_to_first_token.observe(first_byte_seconds)
+
+    def observe_usage(self, usage: dict) -> None:
+        self.input_tokens.inc(usage.get("prompt_tokens", 0))
+        self.output_tokens.inc(usage.get("completion_tokens", 0))
+
+    def observe_error(self, error_type: str) -> None:
+        ERRORS.labels(self.provider, self.model, error_type).inc()
+
+
+_instruments: dict[str, ModelInstruments] = {}
+
+
+def instruments_for(call_context: CallContext | None) -> ModelInstruments:
+    """Instruments for the model a request was routed to, if it got that far."""
+    model = (call_context.model if call_context else None) or UNKNOWN
+    instruments = _instruments.get(model)
+    if instruments is None:
+        instruments = _instruments[model] = ModelInstruments(model)
+    return instruments
+
+
+def usage_from_chunk(chunk: str) -> tuple[dict | None, bool]:
+    """Usage reported in a stream chunk, and whether that is all it carries.
+
+    Upstreams send usage in a last chunk without choices; chunks that do not
+    mention usage are not decoded.
+    """
+    if '"usage"' not in chunk:
+        return None, False
+    payload = json.loads(chunk)
+    return payload.get("usage"), not payload.get("choices")
@@ -0,0 +1,51 @@
+"""Exact-match response cache service."""
+
+import hashlib
+
+from model_router.domain.models import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    RawChatCompletion,
+)
+from model_router.storages.response_cache_storage import ResponseCacheStorage
+
+CACHE_KEY_FIELDS = {"model", "messages", "temperature", "max_tokens"}
+
+
+def request_cache_key(request: ChatCompletionRequest) -> str:
+    """Stable hash of the fields that determine a completion."""
+    # Serialized straight from the model, without copying long prompts into lists
+    encoded = request.model_dump_json(include=CACHE_KEY_FIELDS)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def is_cacheable_request(request: ChatCompletionRequest, force: bool = False) -> bool:
+    """Only deterministic or explicitly opted-in non-streaming requests are cached."""
+    if request.stream:
+        return False
+    return force or request.temperature == 0
+
+
+class ResponseCacheService:
+    """Caches serialized chat completion responses by request hash."""
+
+    def __init__(self, storage: ResponseCacheStorage, ttl_seconds: float = 300.0):
+        self._storage = storage
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> RawChatCompletion | None:
+        """Get a cached response, ready to be sent as-is."""
+        body = await self._storage.get(key)
+        if body is None:
+            return None
+        return RawChatCompletion(body=body)
+
+    async def set(
+        self, key: str, response: ChatCompletionResponse | RawChatCompletion
+    ) -> None:
+        """Store a response under the given key."""
+        if isinstance(response, RawChatCompletion):
+            body = response.body
+        else:
+            body = response.model_dump_json().encode()
+        await self._storage.set(key, body, self._ttl_seconds)
@@ -0,0 +1,182 @@
+"""Latency- and health-aware choice between targets serving the same model."""
+
+import random
+import time
+from collections.abc import Mapping, Sequence
+
+from model_router.domain.providers import ModelPrice
+from model_router.metrics import registry
+
+ORDERED = "ordered"
+LEAST_LATENCY = "least_latency"
+POWER_OF_TWO = "p2c"
+CHEAPEST = "cheapest"
+
+ROUTING_DECISIONS = registry.counter(
+    "model_router_routing_decisions_total",
+    "Targets chosen by the routing engine for a model alias",
+    ("alias", "model"),
+)
+
+
+class TargetStats:
+    """Exponentially weighted health of one upstream target."""
+
+    __slots__ = ("latency", "ttft", "error_rate", "throttled_until", "headroom")
+
+    def __init__(self):
+        self.latency: float | None = None
+        self.ttft: float | None = None
+        self.error_rate = 0.0
+        self.throttled_until = 0.0
+        self.headroom: float | None = None
+
+
+def _ewma(current: float | None, sample: float, alpha: float) -> float:
+    return sample if current is None else current + alpha * (sample - current)
+
+
+class RoutingEngine:
+    """Ranks the targets of a model alias by expected latency or price.
+
+    Each target keeps EWMAs of full-response latency, time to first token and
+    error rate. The expected latency of a target is its latency divided by its
+    success rate, the mean cost of retrying it until it answers. A target whose
+    ``x-ratelimit-remaining-*`` headers report less than ``low_headroom`` of its
+    quota left is penalized in proportion, so traffic moves off it before it
+    starts answering 429. A target that answered 429 scores as unavailable
+    until its Retry-After has passed, and a target with no samples yet scores
+    zero so that it is tried early.
+
+    ``strategy`` picks the primary: ``least_latency`` scans every candidate,
+    ``p2c`` (power of two choices) compares two random candidates, which keeps
+    the decision O(1) and spreads load instead of herding onto one target,
+    ``cheapest`` takes the lowest-priced target whose expected latency meets
+    the latency SLO (the fastest one if none does), and ``ordered`` keeps the
+    configured order. The remaining candidates follow in their configured order
+    as fallbacks.
+    """
+
+    def __init__(
+        self,
+        strategy: str = POWER_OF_TWO,
+        alpha: float = 0.3,
+        default_throttle_seconds: float = 5.0,
+        latency_slo_seconds: float | None = None,
+        low_headroom: float = 0.1,
+    ):
+        self._strategy = strategy
+        self._alpha = alpha
+        self._default_throttle_seconds = default_throttle_seconds
+        self._latency_slo_seconds = latency_slo_seconds
+        self._low_headroom = low_headroom
+        self._stats: dict[str, TargetStats] = {}
+
+    def stats(self, model: str) -> TargetStats:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = TargetStats()
+        return stats
+
+    def record_success(
+        self,
+        model: str,
+        latency: float,
+        streaming: bool = False,
+        headroom: float | None = None,
+    ) -> None:
+        """Record a target answering; for streams latency is time to first token.
+
+        ``headroom`` is the share of the target's rate limit left, if reported.
+        """
+        stats = self.stats(model)
+        if headroom is not None:
+            stats.headroom = headroom
+        if streaming:
+            stats.ttft = _ewma(stats.ttft, latency, self._alpha)
+        else:
+            stats.latency = _ewma(stats.latency, latency, self._alpha)
+        stats.error_rate = _ewma(stats.error_rate, 0.0, self._alpha)
+
+    def record_failure(self, model: str) -> None:
+        stats = self.stats(model)
+        stats.error_rate = _ewma(stats.error_rate, 1.0, self._alpha)
+
+    def record_throttled(self, model: str, retry_after: float | None = None) -> None:
+        """Take a rate-limited target out of first choice until it has headroom."""
+        self.record_failure(model)
+        cooldown = (
+            retry_after if retry_after is not None else self._default_throttle_seconds
+        )
+        self.stats(model).throttled_until = time.monotonic() + cooldown
+
+    def score(self, model: str, streaming: bool = False) -> float:
+        """Expected seconds until the target answers; lower is better."""
+        stats = self._stats.get(model)
+        if stats is None:
+            return 0.0
+        if stats.throttled_until > time.monotonic():
+            return float("inf")
+        latency = stats.ttft if streaming else stats.latency
+        if latency is None:
+            latency = stats.latency if streaming else stats.ttft
+        if latency is None:
+            return 0.0
+        expected = latency / max(1.0 - stats.error_rate, 0.05)
+        if stats.headroom is not None and stats.headroom < self._low_headroom:
+            expected /= max(stats.headroom / self._low_headroom, 0.05)
+        return expected
+
+    def rank(
+        self,
+        alias: str,
+        candidates: Sequence[str],
+        streaming: bool = False,
+        prices: Mapping[str, ModelPrice] | None = None,
+        latency_slo_seconds: float | None = None,
+    ) -> list[str]:
+        """Order candidates with the chosen primary first."""
+        if len(candidates) < 2 or self._strategy == ORDERED:
+            return list(candidates)
+
+        if self._strategy == CHEAPEST:
+            best = self._pick_cheapest(
+                candidates,
+                streaming,
+                prices or {},
+                latency_slo_seconds or self._latency_slo_seconds,
+            )
+        elif self._strategy == LEAST_LATENCY:
+            best = min(candidates, key=lambda model: self.score(model, streaming))
+        else:
+            first, second = random.sample(candidates, 2)
+            best = min(
+                (first, second), key=lambda model: self.score(model, streaming)
+            )
+
+        ROUTING_DECISIONS.labels(alias, best).inc()
+        return [best, *(model for model in candidates if model != best)]
+
+    def _pick_cheapest(
+        self,
+        candidates: Sequence[str],
+        streaming: bool,
+        prices: Mapping[str, ModelPrice],
+        latency_slo_seconds: float | None,
+    ) -> str:
+        scores = {model: self.score(model, streaming) for model in candidates}
+        eligible = [
+            model for model in candidates
+            if scores[model] != float("inf")
+            and (latency_slo_seconds is None or scores[model] <= latency_slo_seconds)
+        ]
+        if not eligible:
+            return min(candidates, key=scores.__getitem__)
+
+        def price(model: str) -> float:
+            model_price = prices.get(model)
+            if model_price is None:
+                return float("inf")
+            return model_price.input_per_1k + model_price.output_per_1k
+
+        return min(eligible, key=lambda model: (price(model), scores[model]))
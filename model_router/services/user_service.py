@@ -19,5 +19,7 @@ class UserService:
         self, uid: str, call_context: Optional[CallContext] = None
     ) -> Optional[User]:
         """Get user by UID."""
-        self._logger.info(f"Getting user by UID: {uid}", call_context=call_context)
+        self._logger.info(
+            "Getting user by UID: %s", uid, call_context=call_context, hot_path=True
+        )
         return await self._user_storage.get_by_uid(uid)
\ No newline at end of file
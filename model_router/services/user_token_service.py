@@ -22,7 +22,9 @@ class UserTokenService:
         self, token: str, call_context: Optional[CallContext] = None
     ) -> Optional[str]:
         """Get user UID by token."""
-        self._logger.info(f"Getting user UID by token", call_context=call_context)
+        self._logger.info(
+            "Getting user UID by token", call_context=call_context, hot_path=True
+        )
         return self._tokens.get(token)
 
     async def validate_token(
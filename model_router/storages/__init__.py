@@ -1,5 +1,23 @@
 """Storage implementations."""
 
+from .rate_limit_storage import (
+    InMemoryRateLimitStorage,
+    RateLimitStorage,
+    RedisRateLimitStorage,
+)
+from .response_cache_storage import (
+    FileResponseCacheStorage,
+    InMemoryResponseCacheStorage,
+    ResponseCacheStorage,
+)
 from .user_storage import InMemoryUserStorage
 
-__all__ = ["InMemoryUserStorage"]
\ No newline at end of file
+__all__ = [
+    "InMemoryUserStorage",
+    "ResponseCacheStorage",
+    "InMemoryResponseCacheStorage",
+    "FileResponseCacheStorage",
+    "RateLimitStorage",
+    "InMemoryRateLimitStorage",
+    "RedisRateLimitStorage",
+]
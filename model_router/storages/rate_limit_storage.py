@@ -0,0 +1,136 @@
+"""Token bucket storage implementations for rate limiting."""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BucketState:
+    """Outcome of taking from a token bucket."""
+
+    allowed: bool
+    remaining: float
+    # Seconds until the bucket is full again
+    reset_seconds: float
+    # Seconds until the requested amount would be available, when not allowed
+    retry_after: float = 0.0
+
+
+def _bucket_state(
+    allowed: bool, tokens: float, capacity: float, rate: float, amount: float
+) -> BucketState:
+    return BucketState(
+        allowed=allowed,
+        remaining=max(tokens, 0.0),
+        reset_seconds=(capacity - tokens) / rate,
+        retry_after=0.0 if allowed else (amount - tokens) / rate,
+    )
+
+
+class RateLimitStorage(ABC):
+    """Abstract storage of token buckets keyed by name."""
+
+    @abstractmethod
+    async def take(
+        self,
+        key: str,
+        capacity: float,
+        refill_per_second: float,
+        amount: float = 1.0,
+        allow_debt: bool = False,
+    ) -> BucketState:
+        """Refill the bucket for the elapsed time, then take amount from it.
+
+        Without enough tokens nothing is taken, unless ``allow_debt`` is set: then
+        the bucket goes negative and stays closed until it has refilled.
+        """
+        pass
+
+
+class InMemoryRateLimitStorage(RateLimitStorage):
+    """In-process token buckets, refilled lazily in O(1) on each access."""
+
+    def __init__(self):
+        self._buckets: dict[str, list[float]] = {}
+
+    async def take(
+        self,
+        key: str,
+        capacity: float,
+        refill_per_second: float,
+        amount: float = 1.0,
+        allow_debt: bool = False,
+    ) -> BucketState:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [capacity, now]
+
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+        allowed = tokens >= amount or allow_debt
+        if allowed:
+            tokens -= amount
+        bucket[0], bucket[1] = tokens, now
+        return _bucket_state(allowed, tokens, capacity, refill_per_second, amount)
+
+
+# Refill and take atomically on the server, using the server clock so that
+# replicas with skewed clocks agree on the bucket level.
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local amount = tonumber(ARGV[3])
+local allow_debt = ARGV[4] == "1"
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= amount or allow_debt then
+  tokens = tokens - amount
+  allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil((capacity - tokens) / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitStorage(RateLimitStorage):
+    """Token buckets in Redis (or a Redis-compatible server) shared by replicas.
+
+    Requires the optional ``redis`` package. Each take is one round trip running
+    a server-side script.
+    """
+
+    def __init__(self, client: Any = None, url: str = "redis://localhost:6379/0"):
+        if client is None:
+            try:
+                import redis.asyncio
+            except ImportError as e:
+                raise ImportError(
+                    "RATE_LIMIT_BACKEND=redis requires the 'redis' package"
+                ) from e
+            client = redis.asyncio.from_url(url)
+        self._client = client
+        self._script = client.register_script(_TAKE_SCRIPT)
+
+    async def take(
+        self,
+        key: str,
+        capacity: float,
+        refill_per_second: float,
+        amount: float = 1.0,
+        allow_debt: bool = False,
+    ) -> BucketState:
+        allowed, tokens = await self._script(
+            keys=[f"ratelimit:{key}"],
+            args=[capacity, refill_per_second, amount, int(allow_debt)],
+        )
+        return _bucket_state(
+            bool(allowed), float(tokens), capacity, refill_per_second, amount
+        )
@@ -0,0 +1,130 @@
+"""Response cache storage implementations."""
+
+import asyncio
+import contextlib
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class ResponseCacheStorage(ABC):
+    """Abstract key-value storage for serialized responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Get a cached value, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store a value for ttl_seconds."""
+        pass
+
+
+class InMemoryResponseCacheStorage(ResponseCacheStorage):
+    """In-process LRU storage with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class FileResponseCacheStorage(ResponseCacheStorage):
+    """Local-file storage shared by processes on the same volume.
+
+    Each entry is one file whose first line holds the wall-clock expiry. File I/O
+    runs in a worker thread; LRU order is tracked in-process under a lock, since
+    several workers may touch it at once.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 10000):
+        self._directory = directory
+        self._max_entries = max_entries
+        self._index: OrderedDict[str, None] | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    def _load_index(self) -> OrderedDict[str, None]:
+        """Return the LRU index, building it on first use; call with the lock held."""
+        if self._index is None:
+            os.makedirs(self._directory, exist_ok=True)
+            names = sorted(
+                (n for n in os.listdir(self._directory) if not n.endswith(".tmp")),
+                key=lambda name: os.path.getmtime(self._path(name)),
+            )
+            self._index = OrderedDict.fromkeys(names)
+        return self._index
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                expires_at = float(f.readline())
+                value = f.read()
+        except (OSError, ValueError):
+            with self._lock:
+                self._load_index().pop(key, None)
+            return None
+
+        if expires_at <= time.time():
+            self._remove(key)
+            return None
+
+        with self._lock:
+            index = self._load_index()
+            index[key] = None
+            index.move_to_end(key)
+        return value
+
+    def _write(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._load_index()
+        tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(f"{time.time() + ttl_seconds}\n".encode())
+            f.write(value)
+        os.replace(tmp_path, self._path(key))
+
+        evicted = []
+        with self._lock:
+            index = self._load_index()
+            index[key] = None
+            index.move_to_end(key)
+            while len(index) > self._max_entries:
+                evicted.append(index.popitem(last=False)[0])
+        for oldest in evicted:
+            self._remove(oldest)
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._load_index().pop(key, None)
+        with contextlib.suppress(OSError):
+            os.remove(self._path(key))
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl_seconds)
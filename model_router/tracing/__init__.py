@@ -0,0 +1,290 @@
+"""Spans with W3C trace context, exported in batches off the event loop."""
+
+import contextlib
+import contextvars
+import json
+import queue
+import random
+import re
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from model_router.metrics import registry
+
+TRACEPARENT_HEADER = "traceparent"
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+SPANS_DROPPED = registry.counter(
+    "model_router_spans_dropped_total",
+    "Finished spans dropped because the export queue was full",
+)
+SPAN_EXPORT_ERRORS = registry.counter(
+    "model_router_span_export_errors_total",
+    "Span batches the exporter failed to export",
+)
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str, bool] | None:
+    """Trace id, parent span id and sampled flag from a ``traceparent`` header."""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+class Span:
+    """One timed operation in a trace.
+
+    A span that is not recording still carries its trace id, so the trace is
+    propagated upstream even when this process does not export it.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "recording",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "_tracer",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer | None",
+        name: str,
+        trace_id: str,
+        parent_id: str | None,
+        recording: bool,
+        start_ns: int | None = None,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.recording = recording
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes: dict[str, Any] = {}
+        self.status = "ok"
+
+    @property
+    def traceparent(self) -> str:
+        """Header value that makes this span the parent of an upstream call."""
+        flags = "01" if self.recording else "00"
+        return f"00-{self.trace_id}-{self.span_id}-{flags}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.recording:
+            self.attributes[key] = value
+
+    def end(self, end_ns: int | None = None) -> None:
+        """Finish the span and hand it to the exporter; later calls are ignored."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = end_ns or time.time_ns()
+        if self.recording and self._tracer is not None:
+            self._tracer._finish(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": ((self.end_ns or self.start_ns) - self.start_ns) / 1e6,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NonRecordingSpan(Span):
+    """Stand-in used while tracing is disabled, so callers need no checks."""
+
+    def __init__(self):
+        super().__init__(None, "", _INVALID_TRACE_ID, None, False, start_ns=1)
+
+    def end(self, end_ns: int | None = None) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan()
+
+current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class SpanExporter(ABC):
+    """Destination for finished spans, called from the export thread."""
+
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        """Export a batch of finished spans."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps exported spans in a list, for tests."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends spans to a file as JSON lines."""
+
+    def __init__(self, path: str):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: list[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict()) + "\n" for span in spans)
+        with self._path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+class Tracer:
+    """Creates spans and exports finished ones in batches from a worker thread.
+
+    Without an exporter, tracing is disabled: ``start_span`` returns a shared
+    non-recording span and nothing is propagated upstream. Finished spans go on
+    a bounded queue and are dropped, not waited for, when it is full.
+    """
+
+    def __init__(self):
+        self._exporter: SpanExporter | None = None
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self.configure()
+
+    def configure(
+        self,
+        exporter: SpanExporter | None = None,
+        sample_rate: float = 1.0,
+        max_batch_size: int = 512,
+        export_interval_seconds: float = 1.0,
+        max_queue_size: int = 10000,
+    ) -> None:
+        """Set the exporter and batching, flushing spans queued for the old one."""
+        if self._worker is not None:
+            self.force_flush()
+        self._exporter = exporter
+        self._sample_rate = sample_rate
+        self._max_batch_size = max_batch_size
+        self._export_interval_seconds = export_interval_seconds
+        self._queue.maxsize = max_queue_size
+        if exporter is not None and self._worker is None:
+            self._worker = threading.Thread(
+                target=self._export_loop, name="span-exporter", daemon=True
+            )
+            self._worker.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    def start_span(
+        self,
+        name: str,
+        parent: Span | None = None,
+        traceparent: str | None = None,
+        start_ns: int | None = None,
+    ) -> Span:
+        """Start a span under ``parent``, the incoming ``traceparent`` or nothing.
+
+        Without either, the span starts a new trace, sampled at the sample rate.
+        """
+        if self._exporter is None:
+            return NON_RECORDING_SPAN
+        if parent is not None and parent is not NON_RECORDING_SPAN:
+            return Span(
+                self, name, parent.trace_id, parent.span_id, parent.recording, start_ns
+            )
+        if remote := parse_traceparent(traceparent):
+            trace_id, parent_id, sampled = remote
+            return Span(self, name, trace_id, parent_id, sampled, start_ns)
+        sampled = random.random() < self._sample_rate
+        return Span(self, name, secrets.token_hex(16), None, sampled, start_ns)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Run a block in a child of the current span and record its errors."""
+        span = self.start_span(name, parent=current_span.get())
+        for key, value in attributes.items():
+            span.set_attribute(key, value)
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.set_attribute("error.type", type(e).__name__)
+            raise
+        finally:
+            current_span.reset(token)
+            span.end()
+
+    def force_flush(self, timeout: float = 5.0) -> None:
+        """Wait until every span finished so far has been exported."""
+        if self._worker is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _finish(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            SPANS_DROPPED.inc()
+
+    def _export_loop(self) -> None:
+        batch: list[Span] = []
+        export_at = time.monotonic() + self._export_interval_seconds
+        while True:
+            try:
+                item = self._queue.get(timeout=max(export_at - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            if isinstance(item, Span):
+                batch.append(item)
+                if len(batch) < self._max_batch_size and time.monotonic() < export_at:
+                    continue
+            self._export(batch)
+            batch = []
+            export_at = time.monotonic() + self._export_interval_seconds
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _export(self, batch: list[Span]) -> None:
+        exporter = self._exporter
+        if not batch or exporter is None:
+            return
+        try:
+            exporter.export(batch)
+        except Exception:
+            SPAN_EXPORT_ERRORS.inc()
+
+
+tracer = Tracer()
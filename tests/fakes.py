@@ -0,0 +1,52 @@
+"""Scripted provider adapters shared by router tests."""
+
+import asyncio
+import time
+
+from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
+from model_router.services.adapters.base import ProviderAdapter
+
+
+class ScriptedAdapter(ProviderAdapter):
+    """Adapter that waits, then fails with a given error or answers."""
+
+    def __init__(self, prefix: str, error: Exception | None = None, delay: float = 0):
+        self._prefix = prefix
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    @property
+    def provider_name(self) -> str:
+        return self._prefix
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    def is_configured(self) -> bool:
+        return True
+
+    async def get_available_models(self) -> list[str]:
+        return ["model"]
+
+    async def create_chat_completion(
+        self, request: ChatCompletionRequest
+    ) -> ChatCompletionResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return ChatCompletionResponse(
+            id=f"chatcmpl-{self._prefix}",
+            object="chat.completion",
+            created=int(time.time()),
+            model=self.extract_model_name(request.model),
+            choices=[],
+            usage={"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
+        )
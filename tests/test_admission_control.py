@@ -0,0 +1,83 @@
+"""Tests for admission control and load shedding."""
+
+import asyncio
+import time
+
+from model_router.api.middleware import AdmissionMiddleware
+from model_router.services.admission_controller import AdmissionController
+
+CHAT_REQUEST = {
+    "model": "openai/gpt-4o-mini",
+    "messages": [{"role": "user", "content": "Hello"}],
+}
+
+
+def test_blocked_event_loop_sheds_requests():
+    """Test that a blocked loop is seen as lag before the probe even wakes."""
+    async def scenario():
+        controller = AdmissionController(
+            max_event_loop_lag_seconds=0.05, probe_interval_seconds=0.01
+        )
+        controller.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # Block the event loop
+        during = controller.try_admit()
+        await asyncio.sleep(0.05)
+        after = controller.try_admit()
+        await controller.stop()
+        return during, after
+
+    during, after = asyncio.run(scenario())
+
+    assert during == "event_loop_lag"
+    assert after is None
+
+
+def test_in_flight_limit():
+    """Test that released requests make room for new ones."""
+    controller = AdmissionController(max_event_loop_lag_seconds=0, max_in_flight=1)
+
+    assert controller.try_admit() is None
+    assert controller.try_admit() == "in_flight"
+    controller.release()
+    assert controller.try_admit() is None
+
+
+def test_overloaded_pod_answers_503_but_stays_healthy(test_client, monkeypatch):
+    """Test 503 with Retry-After for completions while /health is still served."""
+    monkeypatch.setattr(AdmissionController, "event_loop_lag", 1.0)
+    headers = {"Authorization": "Bearer test-key"}
+
+    shed = test_client.post("/v1/chat/completions", headers=headers, json=CHAT_REQUEST)
+    health = test_client.get("/health")
+    metrics = test_client.get("/metrics").text
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert health.status_code == 200
+    assert 'model_router_requests_shed_total{reason="event_loop_lag"}' in metrics
+
+
+def test_streams_count_as_in_flight_until_finished():
+    """Test that a streamed response holds its admission slot to the end."""
+    controller = AdmissionController(max_event_loop_lag_seconds=0)
+    seen = []
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for chunk in (b"data: 1\n\n", b"data: [DONE]\n\n"):
+            seen.append(controller.in_flight)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    middleware = AdmissionMiddleware(
+        streaming_app, controller, paths=("/v1/chat/completions",)
+    )
+    scope = {"type": "http", "path": "/v1/chat/completions"}
+    asyncio.run(middleware(scope, None, send))
+
+    assert seen == [1, 1]
+    assert controller.in_flight == 0
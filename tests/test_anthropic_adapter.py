@@ -0,0 +1,181 @@
+"""Tests for the Anthropic Messages API adapter."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from model_router.domain.exceptions import ProviderAPIError, ProviderRateLimitError
+from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
+from model_router.services.adapters.anthropic import AnthropicAdapter
+
+MODEL = "claude-3-5-haiku-20241022"
+
+
+def sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+def messages_api(request: httpx.Request) -> httpx.Response:
+    """Stand-in for the Anthropic Messages API."""
+    payload = json.loads(request.content)
+    assert request.url.path == "/v1/messages"
+    assert request.headers["x-api-key"] == "test-key"
+    assert request.headers["anthropic-version"] == "2023-06-01"
+    assert payload["model"] == MODEL
+
+    if payload["messages"][0]["content"] == "fail":
+        return httpx.Response(
+            429,
+            headers={"retry-after": "7"},
+            json={"type": "error", "error": {"type": "rate_limit_error"}},
+        )
+    if payload["messages"][0]["content"] == "overloaded":
+        return httpx.Response(
+            529, json={"type": "error", "error": {"type": "overloaded_error"}}
+        )
+    if payload["messages"][0]["content"] == "malformed":
+        return httpx.Response(
+            200,
+            content=b"data: {not json\n\n" if payload.get("stream") else b"<html>",
+            headers={"content-type": "text/event-stream"},
+        )
+
+    usage = {"input_tokens": 9, "output_tokens": 4}
+    if payload.get("stream"):
+        events = [
+            {"type": "message_start", "message": {
+                "id": "msg_1", "type": "message", "role": "assistant",
+                "content": [], "usage": {"input_tokens": 9, "output_tokens": 1},
+            }},
+            {"type": "content_block_start", "index": 0,
+             "content_block": {"type": "text", "text": ""}},
+            {"type": "ping"},
+            {"type": "content_block_delta", "index": 0,
+             "delta": {"type": "text_delta", "text": "Hi "}},
+            {"type": "content_block_delta", "index": 0,
+             "delta": {"type": "text_delta", "text": "\"there\""}},
+            {"type": "content_block_stop", "index": 0},
+            {"type": "message_delta", "delta": {"stop_reason": "max_tokens"},
+             "usage": {"output_tokens": 4}},
+            {"type": "message_stop"},
+        ]
+        if payload["messages"][0]["content"] == "truncated":
+            events = events[:4]
+        return httpx.Response(
+            200,
+            content="".join(sse(event) for event in events).encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    return httpx.Response(200, json={
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "model": MODEL,
+        "content": [{"type": "text", "text": "Hi there"}],
+        "stop_reason": "end_turn",
+        "usage": usage,
+    })
+
+
+def create_adapter(received: list[dict] | None = None) -> AnthropicAdapter:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if received is not None:
+            received.append(json.loads(request.content))
+        return messages_api(request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AnthropicAdapter("test-key", http_client=http_client)
+
+
+def create_request(content: str = "Hello", **kwargs) -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model=f"anthropic/{MODEL}",
+        messages=[
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": content},
+        ],
+        **kwargs,
+    )
+
+
+def test_completion_is_translated_both_ways():
+    """Test system lifting on the way out and OpenAI shape on the way back."""
+    received = []
+
+    result = asyncio.run(
+        create_adapter(received).create_chat_completion(create_request(temperature=0.2))
+    )
+
+    captured = received[0]
+    assert captured["system"] == "Be brief."
+    assert captured["messages"] == [{"role": "user", "content": "Hello"}]
+    assert captured["max_tokens"] == 4096
+    assert captured["temperature"] == 0.2
+    assert isinstance(result, ChatCompletionResponse)
+    assert result.choices[0]["message"]["content"] == "Hi there"
+    assert result.choices[0]["finish_reason"] == "stop"
+    assert result.usage["total_tokens"] == 13
+
+
+def test_stream_yields_openai_chunks():
+    """Test that Messages API events become OpenAI chat.completion.chunk JSON."""
+    async def collect():
+        stream = await create_adapter().create_chat_completion(
+            create_request(stream=True)
+        )
+        return [json.loads(chunk) async for chunk in stream]
+
+    chunks = asyncio.run(collect())
+
+    assert [chunk["choices"][0]["delta"] for chunk in chunks] == [
+        {"role": "assistant", "content": ""},
+        {"content": "Hi "},
+        {"content": "\"there\""},
+        {},
+    ]
+    assert all(chunk["object"] == "chat.completion.chunk" for chunk in chunks)
+    assert {chunk["id"] for chunk in chunks} == {"msg_1"}
+    assert chunks[-1]["choices"][0]["finish_reason"] == "length"
+    assert chunks[-1]["usage"]["total_tokens"] == 13
+
+
+def test_rate_limit_and_overload_errors():
+    """Test 429 with Retry-After and 529 overloaded mapping."""
+    with pytest.raises(ProviderRateLimitError) as exc_info:
+        asyncio.run(create_adapter().create_chat_completion(create_request("fail")))
+    assert exc_info.value.retry_after == 7
+
+    with pytest.raises(ProviderAPIError) as exc_info:
+        asyncio.run(
+            create_adapter().create_chat_completion(create_request("overloaded"))
+        )
+    assert exc_info.value.status_code == 529
+
+
+def test_malformed_upstream_body_is_a_provider_error():
+    """Test that an undecodable body or event fails over like any upstream error."""
+    async def consume_stream():
+        stream = await create_adapter().create_chat_completion(
+            create_request("malformed", stream=True)
+        )
+        return [chunk async for chunk in stream]
+
+    with pytest.raises(ProviderAPIError, match="malformed response"):
+        asyncio.run(create_adapter().create_chat_completion(create_request("malformed")))
+    with pytest.raises(ProviderAPIError, match="malformed stream event"):
+        asyncio.run(consume_stream())
+
+
+def test_truncated_stream_is_a_provider_error():
+    """Test that a stream cut off before message_stop is not taken as complete."""
+    async def consume_stream():
+        stream = await create_adapter().create_chat_completion(
+            create_request("truncated", stream=True)
+        )
+        return [chunk async for chunk in stream]
+
+    with pytest.raises(ProviderAPIError, match="before message_stop"):
+        asyncio.run(consume_stream())
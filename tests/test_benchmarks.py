@@ -0,0 +1,107 @@
+"""Tests for the benchmark suite's mock upstream and report statistics."""
+
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+from benchmarks.__main__ import compare
+from benchmarks.load import histogram_quantile, parse_histogram, percentile
+from benchmarks.micro import create_benchmarks, report
+from benchmarks.mock_upstream import MockUpstream, Profile, latency_sampler
+
+BODY = {"model": "bench", "messages": [{"role": "user", "content": "Hi"}]}
+
+
+def test_latency_specs():
+    """Test the fixed, uniform and lognormal latency distributions."""
+    assert latency_sampler("fixed:50")() == 0.05
+    assert 0.01 <= latency_sampler("uniform:10:20")() <= 0.02
+    assert latency_sampler("lognormal:50:0.5")() > 0
+    with pytest.raises(ValueError):
+        latency_sampler("gaussian:50")
+
+
+def test_mock_upstream_streams_tokens_and_injects_errors():
+    """Test that the mock answers per its profile, which can be swapped live."""
+    upstream = MockUpstream(
+        Profile(latency="fixed:0", completion_tokens=3, tokens_per_second=1e6)
+    )
+    client = TestClient(upstream.app)
+
+    response = client.post("/v1/chat/completions", json={**BODY, "stream": True})
+    events = [line for line in response.text.splitlines() if line]
+    assert len(events) == 5
+    assert events[-1] == "data: [DONE]"
+    assert '"completion_tokens": 3' in events[-2]
+
+    profile = {"latency": "fixed:0", "error_rate": 1.0, "error_status": 429}
+    client.put("/_profile", json=profile)
+    assert client.post("/v1/chat/completions", json=BODY).status_code == 429
+
+
+def test_router_overhead_quantile_from_histogram_scrapes():
+    """Test quantiles over only the observations made between two scrapes."""
+    before = parse_histogram(
+        'h_bucket{model="a",le="0.001"} 10\n'
+        'h_bucket{model="a",le="0.01"} 10\n'
+        'h_bucket{model="a",le="+Inf"} 10\n',
+        "h",
+    )
+    after = parse_histogram(
+        'h_bucket{model="a",le="0.001"} 15\n'
+        'h_bucket{model="b",le="0.001"} 5\n'
+        'h_bucket{model="a",le="0.01"} 20\n'
+        'h_bucket{model="b",le="0.01"} 10\n'
+        'h_bucket{model="a",le="+Inf"} 20\n'
+        'h_bucket{model="b",le="+Inf"} 10\n',
+        "h",
+    )
+
+    assert histogram_quantile(before, after, 0.5) == pytest.approx(0.001)
+    assert histogram_quantile(before, after, 0.75) == pytest.approx(0.0055)
+    assert histogram_quantile(after, after, 0.5) is None
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) is None
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    """Test that lower throughput and higher overhead are both regressions."""
+    baseline = {"completion": {"rps": 100, "router_overhead_p99_ms": 10}}
+
+    assert compare(
+        {"completion": {"rps": 95, "router_overhead_p99_ms": 10.5}}, baseline, 0.1
+    ) == []
+    regressions = compare(
+        {"completion": {"rps": 80, "router_overhead_p99_ms": 12}}, baseline, 0.1
+    )
+    assert [regression.split(":")[0] for regression in regressions] == [
+        "completion.rps",
+        "completion.router_overhead_p99_ms",
+    ]
+
+
+def test_microbenchmarks_run_and_rank_by_share_of_a_request(initialized_config):
+    """Test that every microbenchmark runs and the report ranks by request share."""
+    benchmarks = create_benchmarks()
+    for benchmark in benchmarks:
+        if benchmark.is_async:
+            asyncio.run(benchmark.run())
+        else:
+            benchmark.run()
+
+    results = {benchmark.name: 100.0 for benchmark in benchmarks}
+    results["call_context"] = 10_000.0
+    lines = report(benchmarks, results, {"call_context": 5_000.0}).splitlines()
+
+    budget = sum(results[b.name] * b.per_request for b in benchmarks)
+    name, cost, share, change = lines[1].split()
+    assert (name, cost, change) == ("call_context", "10000", "+100.0%")
+    assert share == f"{10_000 / budget:.1%}"
+    assert lines[-1].startswith("typical request")
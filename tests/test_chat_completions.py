@@ -89,3 +89,43 @@ def test_chat_completions_with_openai_client(
     assert "mock response from openai adapter" in response.choices[0].message.content.lower()
     assert response.choices[0].message.role == "assistant"
     assert response.usage.total_tokens == 20
+
+
+def test_chat_completions_invalid_body_reports_body_errors(test_client):
+    """Test that body validation errors keep FastAPI's format and status."""
+    headers = {"Authorization": "Bearer test-key"}
+
+    response = test_client.post(
+        "/v1/chat/completions", headers=headers, json={"model": "openai/gpt-4o"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "messages"]
+
+    response = test_client.post(
+        "/v1/chat/completions", headers=headers, content=b'{"model": '
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_chat_completions_checks_auth_before_parsing_the_body(test_client):
+    """Test that unauthenticated requests are rejected without parsing the body."""
+    response = test_client.post("/v1/chat/completions", content=b"not json")
+
+    assert response.status_code == 401
+
+
+def test_chat_completions_long_prompt(test_client):
+    """Test that a multi-message prompt of hundreds of KB is accepted."""
+    messages = [
+        {"role": "user", "content": "word " * 20_000} for _ in range(5)
+    ]
+
+    response = test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key"},
+        json={"model": "openai/gpt-4o-mini", "messages": messages},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["object"] == "chat.completion"
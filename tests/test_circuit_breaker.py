@@ -0,0 +1,124 @@
+"""Tests for per-provider circuit breakers."""
+
+import asyncio
+import gc
+import time
+
+from model_router.domain.exceptions import ProviderAPIError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.metrics import registry
+from model_router.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from model_router.services.model_router import ModelRouterService
+from tests.fakes import ScriptedAdapter
+
+
+def create_breaker(**kwargs) -> CircuitBreaker:
+    settings = {"min_requests": 4, "open_seconds": 0.02, "half_open_max_probes": 1}
+    return CircuitBreaker("test", **{**settings, **kwargs})
+
+
+def test_breaker_opens_on_sustained_failures():
+    """Test that the failure rate over the window opens the breaker."""
+    breaker = create_breaker()
+
+    for _ in range(2):
+        breaker.record_success(0.1)
+        breaker.record_failure(0.1)
+
+    assert breaker.state == OPEN
+    assert breaker.allow_request() is False
+
+
+def test_state_gauge_turns_half_open_at_scrape_time():
+    """Test that the gauge shows half-open once the cooldown passed, unread."""
+    breaker = CircuitBreaker("gauge-test", min_requests=1, open_seconds=0.02)
+    breaker.record_failure(0.1)
+    assert 'model_router_circuit_state{provider="gauge-test"} 2' in registry.render()
+
+    time.sleep(0.03)
+
+    assert 'model_router_circuit_state{provider="gauge-test"} 1' in registry.render()
+
+
+def test_state_gauge_drops_released_breakers():
+    """Test that a breaker no longer in use is not reported at scrape time."""
+    breaker = CircuitBreaker("released-test", min_requests=1)
+    breaker.record_failure(0.1)
+    assert 'model_router_circuit_state{provider="released-test"}' in registry.render()
+
+    del breaker
+    gc.collect()
+
+    assert (
+        'model_router_circuit_state{provider="released-test"}'
+        not in registry.render()
+    )
+
+
+def test_breaker_half_open_probe_closes_or_reopens():
+    """Test that a probe success closes and a probe failure reopens."""
+    breaker = create_breaker()
+    for _ in range(4):
+        breaker.record_failure(0.1)
+    time.sleep(0.03)
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+    breaker.record_failure(0.1)
+    assert breaker.state == OPEN
+
+    time.sleep(0.03)
+    assert breaker.allow_request() is True
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_slow_calls_open_breaker():
+    """Test that sustained slow calls open the breaker when configured."""
+    breaker = create_breaker(slow_call_seconds=1.0, slow_call_rate_threshold=0.5)
+
+    for _ in range(4):
+        breaker.record_success(2.0)
+
+    assert breaker.state == OPEN
+
+
+def test_open_circuit_falls_through_to_fallback():
+    """Test that an open circuit skips the provider without calling it."""
+    primary = ScriptedAdapter("primary", ProviderAPIError("down", 500))
+    service = ModelRouterService(
+        {"primary": primary, "backup": ScriptedAdapter("backup")},
+        model_fallbacks={"primary/model": ["backup/model"]},
+        circuit_breaker_factory=lambda name: create_breaker(open_seconds=60),
+    )
+    request = ChatCompletionRequest(
+        model="primary/model", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    async def scenario():
+        return [await service.create_chat_completion(request) for _ in range(6)]
+
+    responses = asyncio.run(scenario())
+    providers = asyncio.run(service.get_provider_info())
+
+    assert all(response.id == "chatcmpl-backup" for response in responses)
+    assert primary.calls == 4
+    assert {info.prefix: info.circuit_state for info in providers} == {
+        "primary": OPEN, "backup": CLOSED
+    }
+
+
+def test_providers_endpoint_reports_circuit_state(test_client):
+    """Test that /v1/providers shows the breaker state next to configured."""
+    response = test_client.get(
+        "/v1/providers", headers={"Authorization": "Bearer test-key"}
+    )
+
+    assert response.status_code == 200
+    assert all(provider["circuit_state"] == CLOSED for provider in response.json())
@@ -0,0 +1,120 @@
+"""Tests for cost-aware routing and per-request cost accounting."""
+
+import asyncio
+
+import pytest
+
+from model_router.domain.call_context import CallContext
+from model_router.domain.exceptions import ModelNotSupportedError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.domain.providers import ModelPrice
+from model_router.services.model_router import (
+    REQUEST_COST_HEADER,
+    ROUTED_MODEL_HEADER,
+    ModelRouterService,
+)
+from model_router.services.routing_engine import CHEAPEST, RoutingEngine
+from tests.fakes import ScriptedAdapter
+
+PRICES = {
+    "premium/model": ModelPrice(0.01, 0.03),
+    "budget/model": ModelPrice(0.0005, 0.0015),
+}
+
+
+def test_cheapest_target_within_slo_wins():
+    """Test that the cheaper target is chosen only while it meets the SLO."""
+    engine = RoutingEngine(strategy=CHEAPEST, latency_slo_seconds=1.0)
+    engine.record_success("premium/model", 0.2)
+    engine.record_success("budget/model", 0.5)
+    candidates = ["premium/model", "budget/model"]
+
+    assert engine.rank("alias", candidates, prices=PRICES)[0] == "budget/model"
+    assert engine.rank(
+        "alias", candidates, prices=PRICES, latency_slo_seconds=0.3
+    )[0] == "premium/model"
+
+
+def test_fastest_target_when_none_meets_slo():
+    """Test that the fastest target is used when every target misses the SLO."""
+    engine = RoutingEngine(strategy=CHEAPEST, latency_slo_seconds=0.1)
+    engine.record_success("premium/model", 0.2)
+    engine.record_success("budget/model", 0.5)
+
+    ranked = engine.rank("alias", ["budget/model", "premium/model"], prices=PRICES)
+
+    assert ranked == ["premium/model", "budget/model"]
+
+
+def create_service() -> ModelRouterService:
+    return ModelRouterService(
+        {"premium": ScriptedAdapter("premium"), "budget": ScriptedAdapter("budget")},
+        model_aliases={"chat": ["premium/model", "budget/model"]},
+        routing_engine=RoutingEngine(strategy=CHEAPEST),
+        model_prices=PRICES,
+        model_capabilities={"premium/model": ["vision"]},
+    )
+
+
+def create_request(model: str = "chat") -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model=model, messages=[{"role": "user", "content": "Hello"}]
+    )
+
+
+def test_bulk_traffic_goes_to_cheaper_provider_with_cost_header():
+    """Test that an alias shifts to the cheaper target and reports its cost."""
+    call_context = CallContext()
+
+    response = asyncio.run(
+        create_service().create_chat_completion(create_request(), call_context)
+    )
+
+    assert response.id == "chatcmpl-budget"
+    assert call_context.response_headers[ROUTED_MODEL_HEADER] == "budget/model"
+    # 5 prompt and 5 completion tokens at $0.0005 / $0.0015 per 1K
+    assert call_context.response_headers[REQUEST_COST_HEADER] == "0.000010"
+
+
+def test_capability_restricts_alias_targets():
+    """Test that a capability tag excludes targets that lack it."""
+    service = create_service()
+
+    response = asyncio.run(
+        service.create_chat_completion(create_request(), capability="vision")
+    )
+
+    assert response.id == "chatcmpl-premium"
+    with pytest.raises(ModelNotSupportedError):
+        asyncio.run(
+            service.create_chat_completion(create_request(), capability="audio")
+        )
+
+
+def test_cost_header_on_endpoint(test_client):
+    """Test that the endpoint exposes the list-price cost of the completion."""
+    response = test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key"},
+        json={
+            "model": "openai/gpt-4o",
+            "messages": [{"role": "user", "content": "Hello"}]
+        }
+    )
+
+    assert response.status_code == 200
+    assert float(response.headers["x-request-cost"]) > 0
+
+
+def test_invalid_latency_slo_header(test_client):
+    """Test that a malformed SLO header is rejected."""
+    response = test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key", "X-Router-Latency-SLO": "soon"},
+        json={
+            "model": "openai/gpt-4o",
+            "messages": [{"role": "user", "content": "Hello"}]
+        }
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,101 @@
+"""Tests for client deadlines and adaptive upstream timeouts."""
+
+import asyncio
+import time
+
+import pytest
+
+from model_router.domain.call_context import CallContext
+from model_router.domain.exceptions import ProviderTimeoutError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.services.latency_tracker import LatencyTracker
+from model_router.services.model_router import ModelRouterService
+from tests.fakes import ScriptedAdapter
+
+REQUEST = ChatCompletionRequest(
+    model="primary/model", messages=[{"role": "user", "content": "Hello"}]
+)
+
+
+def test_client_deadline_cancels_the_upstream_call():
+    """Test that the upstream call is cancelled as soon as the deadline passes."""
+    primary = ScriptedAdapter("primary", delay=1.0)
+    backup = ScriptedAdapter("backup")
+    service = ModelRouterService(
+        {"primary": primary, "backup": backup},
+        model_fallbacks={"primary/model": ["backup/model"]},
+    )
+
+    async def scenario():
+        deadline = asyncio.get_running_loop().time() + 0.05
+        await service.create_chat_completion(REQUEST, CallContext(deadline=deadline))
+
+    started = time.perf_counter()
+    with pytest.raises(ProviderTimeoutError):
+        asyncio.run(scenario())
+
+    assert time.perf_counter() - started < 0.5
+    assert primary.cancelled == 1
+    assert backup.calls == 0
+
+
+def test_adaptive_timeout_follows_observed_latency():
+    """Test that a call far slower than the model's tail latency is given up on."""
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe("primary/model", 0.01)
+    primary = ScriptedAdapter("primary", delay=1.0)
+    service = ModelRouterService(
+        {"primary": primary, "backup": ScriptedAdapter("backup")},
+        model_fallbacks={"primary/model": ["backup/model"]},
+        latency_tracker=tracker,
+        min_upstream_timeout_seconds=0.05,
+    )
+
+    started = time.perf_counter()
+    response = asyncio.run(service.create_chat_completion(REQUEST))
+
+    assert response.id == "chatcmpl-backup"
+    assert time.perf_counter() - started < 0.5
+    assert primary.cancelled == 1
+
+
+def test_stream_latency_does_not_shorten_completion_timeout():
+    """Test that fast time-to-first-chunk samples leave full completions alone."""
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe("primary/model", 0.01, streaming=True)
+    primary = ScriptedAdapter("primary", delay=0.1)
+    service = ModelRouterService(
+        {"primary": primary, "backup": ScriptedAdapter("backup")},
+        model_fallbacks={"primary/model": ["backup/model"]},
+        latency_tracker=tracker,
+        min_upstream_timeout_seconds=0.05,
+    )
+
+    response = asyncio.run(service.create_chat_completion(REQUEST))
+
+    assert response.id == "chatcmpl-primary"
+    assert primary.cancelled == 0
+    assert tracker.percentile("primary/model", 0.99, streaming=True) == 0.01
+
+
+def test_timeout_is_read_from_header_or_body(test_client):
+    """Test the deadline header and body field, which is never sent upstream."""
+    headers = {"Authorization": "Bearer test-key"}
+    body = {
+        "model": "openai/gpt-4o-mini",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "timeout": 30,
+    }
+
+    ok = test_client.post("/v1/chat/completions", headers=headers, json=body)
+    invalid = test_client.post(
+        "/v1/chat/completions",
+        headers={**headers, "X-Router-Timeout": "soon"},
+        json=body,
+    )
+
+    assert ok.status_code == 200
+    assert invalid.status_code == 400
+    assert "timeout" not in ChatCompletionRequest(**body).model_dump()
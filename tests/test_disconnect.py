@@ -0,0 +1,116 @@
+"""Tests for cancelling upstream calls when the client disconnects."""
+
+import asyncio
+import json
+
+import pytest
+
+from model_router.api import routes
+from model_router.domain.models import ChatCompletionRequest
+from model_router.main import app
+from model_router.metrics import registry
+from model_router.services.model_router import ModelRouterService
+from tests.fakes import ScriptedAdapter
+
+
+class SlowStreamAdapter(ScriptedAdapter):
+    """Adapter that streams one chunk every ``delay`` seconds, forever."""
+
+    def __init__(self, prefix: str, delay: float):
+        super().__init__(prefix, delay=delay)
+        self.chunks_sent = 0
+        self.streams_closed = 0
+
+    async def create_chat_completion(self, request: ChatCompletionRequest):
+        if not request.stream:
+            return await super().create_chat_completion(request)
+        return self._stream()
+
+    async def _stream(self):
+        try:
+            while True:
+                await asyncio.sleep(self.delay)
+                self.chunks_sent += 1
+                yield json.dumps({"choices": [{"delta": {"content": "x"}}]})
+        finally:
+            self.streams_closed += 1
+
+
+async def call_and_disconnect(body: dict, disconnect_after: float) -> list[dict]:
+    """Send a chat completion through the ASGI app and hang up after a while."""
+    request_sent = False
+    messages = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": json.dumps(body).encode()}
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/v1/chat/completions",
+        "raw_path": b"/v1/chat/completions",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"authorization", b"Bearer test-key"),
+            (b"content-type", b"application/json"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=2)
+    return messages
+
+
+@pytest.fixture
+def slow_provider(initialized_config, monkeypatch):
+    provider = SlowStreamAdapter("slow", delay=0.02)
+    service = ModelRouterService({"slow": provider})
+    monkeypatch.setattr(routes, "router_service", service)
+    return provider
+
+
+def test_disconnect_while_waiting_cancels_the_upstream_call(slow_provider):
+    """Test that a client hanging up before the answer cancels the upstream call."""
+    slow_provider.delay = 1.0
+    body = {
+        "model": "slow/model",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "max_tokens": 100,
+    }
+
+    messages = asyncio.run(call_and_disconnect(body, disconnect_after=0.05))
+
+    assert messages[0]["status"] == 499
+    assert slow_provider.cancelled == 1
+    metrics = registry.render()
+    assert 'model_router_client_disconnects_total{phase="waiting"}' in metrics
+    assert 'model_router_disconnect_saved_tokens_total{phase="waiting"}' in metrics
+
+
+def test_disconnect_mid_stream_closes_the_upstream_stream(slow_provider):
+    """Test that a client hanging up mid-stream closes the upstream stream."""
+    body = {
+        "model": "slow/model",
+        "messages": [{"role": "user", "content": "Hello"}],
+        "stream": True,
+    }
+    before = routes.CLIENT_DISCONNECTS.labels("streaming").value
+
+    messages = asyncio.run(call_and_disconnect(body, disconnect_after=0.1))
+
+    assert messages[0]["status"] == 200
+    assert 0 < slow_provider.chunks_sent < 10
+    assert slow_provider.streams_closed == 1
+    assert routes.CLIENT_DISCONNECTS.labels("streaming").value == before + 1
@@ -0,0 +1,64 @@
+"""Tests for cross-provider failover."""
+
+import asyncio
+
+import pytest
+
+from model_router.domain.exceptions import ProviderAPIError, ProviderTimeoutError
+from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
+from model_router.services.model_router import ModelRouterService
+from tests.fakes import ScriptedAdapter
+
+
+def create_service(primary: ScriptedAdapter, **kwargs) -> ModelRouterService:
+    return ModelRouterService(
+        {"primary": primary, "backup": ScriptedAdapter("backup")},
+        model_fallbacks={"primary/model": ["missing/model", "backup/model"]},
+        **kwargs,
+    )
+
+
+def complete(service: ModelRouterService) -> ChatCompletionResponse:
+    request = ChatCompletionRequest(
+        model="primary/model", messages=[{"role": "user", "content": "Hello"}]
+    )
+    return asyncio.run(service.create_chat_completion(request))
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 503, None])
+def test_retryable_error_fails_over(status_code):
+    """Test that 5xx, 429 and connection errors move to the next target."""
+    primary = ScriptedAdapter("primary", ProviderAPIError("down", status_code))
+
+    response = complete(create_service(primary))
+
+    assert response.id == "chatcmpl-backup"
+    assert primary.calls == 1
+
+
+def test_client_error_does_not_fail_over():
+    """Test that a 4xx other than 429 is returned as-is."""
+    primary = ScriptedAdapter("primary", ProviderAPIError("bad request", 400))
+
+    with pytest.raises(ProviderAPIError, match="bad request"):
+        complete(create_service(primary))
+
+
+def test_timeout_fails_over():
+    """Test that a slow primary is abandoned after the upstream timeout."""
+    primary = ScriptedAdapter("primary", delay=1)
+
+    response = complete(create_service(primary, upstream_timeout_seconds=0.01))
+
+    assert response.id == "chatcmpl-backup"
+
+
+def test_request_deadline_stops_the_chain():
+    """Test that no target is tried once the total deadline has passed."""
+    primary = ScriptedAdapter("primary", delay=1)
+    service = create_service(
+        primary, request_deadline_seconds=0.01, upstream_timeout_seconds=1
+    )
+
+    with pytest.raises(ProviderTimeoutError):
+        complete(service)
@@ -0,0 +1,160 @@
+"""Tests for weighted fair queueing of upstream calls."""
+
+import asyncio
+
+import pytest
+
+from model_router.domain.call_context import CallContext
+from model_router.domain.exceptions import ProviderUnavailableError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.services.circuit_breaker import CLOSED, CircuitBreaker
+from model_router.services.fair_queue import FairQueue
+from model_router.services.model_router import ModelRouterService
+from tests.fakes import ScriptedAdapter
+
+REQUEST = ChatCompletionRequest(
+    model="primary/model", messages=[{"role": "user", "content": "Hello"}]
+)
+
+
+async def serve_in_order(queue: FairQueue, arrivals: list[tuple[str, float]]):
+    """Queue the arrivals behind a held slot and record who gets slots, in order."""
+    await queue.acquire("holder")
+    served = []
+
+    async def request(tenant: str, weight: float):
+        await queue.acquire(tenant, weight)
+        served.append(tenant)
+
+    tasks = []
+    for tenant, weight in arrivals:
+        tasks.append(asyncio.create_task(request(tenant, weight)))
+        await asyncio.sleep(0)
+    for _ in arrivals:
+        queue.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return served
+
+
+def test_heavy_tenant_does_not_starve_others():
+    """Test that a tenant arriving behind a backlog is served next."""
+    arrivals = [("batch", 1.0)] * 4 + [("interactive", 1.0)]
+
+    served = asyncio.run(serve_in_order(FairQueue("openai", 1), arrivals))
+
+    assert served == ["batch", "interactive", "batch", "batch", "batch"]
+
+
+def test_slots_are_shared_by_weight():
+    """Test that a tenant with twice the weight gets twice the slots."""
+    arrivals = [("admin", 2.0)] * 4 + [("user", 1.0)] * 2
+
+    served = asyncio.run(serve_in_order(FairQueue("openai", 1), arrivals))
+
+    assert served[:3].count("admin") == 2
+    assert served[:3].count("user") == 1
+
+
+def test_queue_depth_and_timeout_are_bounded():
+    """Test rejection of a full queue and of a wait longer than the timeout."""
+    async def scenario():
+        queue = FairQueue("openai", 1, max_depth=1, timeout_seconds=0.01)
+        await queue.acquire("a")
+        waiter = asyncio.create_task(queue.acquire("b"))
+        await asyncio.sleep(0)
+        with pytest.raises(ProviderUnavailableError, match="full"):
+            await queue.acquire("c")
+        with pytest.raises(ProviderUnavailableError, match="Timed out"):
+            await waiter
+        queue.release()
+        return queue.active, queue.waiting
+
+    assert asyncio.run(scenario()) == (0, 0)
+
+
+def test_router_holds_a_slot_per_upstream_call():
+    """Test that calls beyond the provider's limit wait and all finish."""
+    provider = ScriptedAdapter("primary", delay=0.01)
+    queues = []
+
+    def create_queue(prefix: str) -> FairQueue:
+        queues.append(FairQueue(prefix, max_concurrency=2))
+        return queues[-1]
+
+    service = ModelRouterService(
+        {"primary": provider},
+        fair_queue_factory=create_queue,
+        tenant_weights={"admin": 2},
+    )
+    async def scenario():
+        peak = 0
+
+        async def watch():
+            nonlocal peak
+            while True:
+                peak = max(peak, queues[0].active)
+                await asyncio.sleep(0.001)
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.gather(*(
+            service.create_chat_completion(
+                REQUEST, CallContext(user_id=f"user-{i % 3}", user_role="admin")
+            )
+            for i in range(6)
+        ))
+        watcher.cancel()
+        return peak
+
+    assert asyncio.run(scenario()) == 2
+    assert provider.calls == 6
+    assert queues[0].active == 0
+
+
+def test_queue_wait_is_not_charged_to_the_upstream():
+    """Test that the upstream timeout, breaker and timing start at the slot."""
+    provider = ScriptedAdapter("primary", delay=0.1)
+    breaker = CircuitBreaker("primary", min_requests=1)
+    service = ModelRouterService(
+        {"primary": provider},
+        upstream_timeout_seconds=0.15,
+        adaptive_timeouts_enabled=False,
+        circuit_breaker_factory=lambda prefix: breaker,
+        fair_queue_factory=lambda prefix: FairQueue(prefix, max_concurrency=1),
+    )
+    contexts = [CallContext(), CallContext()]
+
+    async def scenario():
+        return await asyncio.gather(*(
+            service.create_chat_completion(REQUEST, context) for context in contexts
+        ))
+
+    responses = asyncio.run(scenario())
+
+    assert [response.id for response in responses] == ["chatcmpl-primary"] * 2
+    assert breaker.state == CLOSED
+    assert all(context.upstream_seconds < 0.15 for context in contexts)
+
+
+def test_rejected_queue_wait_gives_back_the_probe_slot():
+    """Test that a half-open probe that never got a queue slot can be retried."""
+    breaker = CircuitBreaker(
+        "primary", min_requests=1, open_seconds=0, half_open_max_probes=1
+    )
+    breaker.record_failure(0.0)
+    queue = FairQueue("primary", 1, max_depth=0)
+    service = ModelRouterService(
+        {"primary": ScriptedAdapter("primary")},
+        circuit_breaker_factory=lambda prefix: breaker,
+        fair_queue_factory=lambda prefix: queue,
+    )
+
+    async def scenario():
+        await queue.acquire("holder")
+        with pytest.raises(ProviderUnavailableError, match="full"):
+            await service.create_chat_completion(REQUEST)
+        queue.release()
+        return await service.create_chat_completion(REQUEST)
+
+    assert asyncio.run(scenario()).id == "chatcmpl-primary"
+    assert breaker.state == CLOSED
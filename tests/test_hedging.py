@@ -0,0 +1,120 @@
+"""Tests for hedged upstream requests."""
+
+import asyncio
+
+import pytest
+
+from model_router.domain.exceptions import ProviderAPIError
+from model_router.domain.models import ChatCompletionRequest, ChatCompletionResponse
+from model_router.services.latency_tracker import LatencyTracker
+from model_router.services.model_router import (
+    HEDGE_WASTED_TOKENS,
+    HEDGE_WINS,
+    HEDGES,
+    ModelRouterService,
+)
+from tests.fakes import ScriptedAdapter
+
+
+def create_service(primary: ScriptedAdapter, backup: ScriptedAdapter, **kwargs):
+    settings = {"hedge_default_delay_seconds": 0.02, "hedge_min_delay_seconds": 0.01}
+    return ModelRouterService(
+        {"primary": primary, "backup": backup},
+        model_fallbacks={"primary/model": ["backup/model"]},
+        hedging_enabled=True,
+        **{**settings, **kwargs},
+    )
+
+
+def complete(service: ModelRouterService) -> ChatCompletionResponse:
+    request = ChatCompletionRequest(
+        model="primary/model",
+        messages=[{"role": "user", "content": "Hello there, how are you?"}],
+    )
+    return asyncio.run(service.create_chat_completion(request))
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    """Test that a hedge wins over a slow primary, which is then cancelled."""
+    primary = ScriptedAdapter("primary", delay=1)
+    backup = ScriptedAdapter("backup")
+    hedges = HEDGES.labels("primary/model").value
+    wins = HEDGE_WINS.labels("primary/model").value
+    wasted = HEDGE_WASTED_TOKENS.labels("primary/model").value
+
+    response = complete(create_service(primary, backup))
+
+    assert response.id == "chatcmpl-backup"
+    assert primary.cancelled == 1
+    assert HEDGES.labels("primary/model").value == hedges + 1
+    assert HEDGE_WINS.labels("primary/model").value == wins + 1
+    assert HEDGE_WASTED_TOKENS.labels("primary/model").value > wasted
+
+
+def test_fast_primary_is_not_hedged():
+    """Test that no hedge is launched when the primary answers in time."""
+    primary = ScriptedAdapter("primary")
+    backup = ScriptedAdapter("backup")
+
+    response = complete(create_service(primary, backup))
+
+    assert response.id == "chatcmpl-primary"
+    assert backup.calls == 0
+
+
+def test_primary_wins_when_hedge_is_slower():
+    """Test that the primary still wins after a hedge has been launched."""
+    primary = ScriptedAdapter("primary", delay=0.05)
+    backup = ScriptedAdapter("backup", delay=1)
+
+    response = complete(create_service(primary, backup))
+
+    assert response.id == "chatcmpl-primary"
+    assert backup.calls == 1
+    assert backup.cancelled == 1
+
+
+def test_hedge_delay_ignores_stream_latency():
+    """Test that fast stream first chunks do not make every completion hedged."""
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.observe("primary/model", 0.001, streaming=True)
+    primary = ScriptedAdapter("primary", delay=0.05)
+    backup = ScriptedAdapter("backup")
+
+    response = complete(create_service(
+        primary, backup, latency_tracker=tracker, hedge_default_delay_seconds=1.0
+    ))
+
+    assert response.id == "chatcmpl-primary"
+    assert backup.calls == 0
+
+
+def test_failed_hedge_target_is_not_retried():
+    """Test that a failover after a failed hedged pair skips the hedge target."""
+    primary = ScriptedAdapter("primary", ProviderAPIError("down", 503), delay=0.05)
+    backup = ScriptedAdapter("backup", ProviderAPIError("down", 503))
+
+    with pytest.raises(ProviderAPIError):
+        complete(create_service(primary, backup))
+
+    assert primary.calls == 1
+    assert backup.calls == 1
+
+
+def test_last_target_is_not_hedged():
+    """Test that a target with nothing after it is not duplicated as a hedge."""
+    primary = ScriptedAdapter("primary", delay=0.05)
+    hedges = HEDGES.labels("primary/model").value
+    service = ModelRouterService(
+        {"primary": primary},
+        hedging_enabled=True,
+        hedge_default_delay_seconds=0.01,
+        hedge_min_delay_seconds=0.01,
+    )
+
+    response = complete(service)
+
+    assert response.id == "chatcmpl-primary"
+    assert primary.calls == 1
+    assert HEDGES.labels("primary/model").value == hedges
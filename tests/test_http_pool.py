@@ -0,0 +1,95 @@
+"""Tests for the shared upstream connection pool manager."""
+
+import asyncio
+import ssl
+from unittest.mock import AsyncMock, patch
+
+import httpcore
+import httpx
+
+from model_router.metrics import registry
+from model_router.services.http_pool import (
+    POOL_CONNECTS,
+    CachingDNSBackend,
+    HttpPoolManager,
+    PooledTransport,
+)
+
+
+async def serve_keep_alive(reader, writer):
+    """Minimal HTTP/1.1 upstream that keeps connections open."""
+    try:
+        while head := await reader.readuntil(b"\r\n\r\n"):
+            body = b"" if head.startswith(b"HEAD") else b"ok"
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                b"Connection: keep-alive\r\n\r\n" + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        writer.close()
+
+
+def test_warm_up_opens_connections_that_requests_reuse():
+    """Test pre-warming, connection reuse, pool metrics and shutdown."""
+    async def scenario():
+        server = await asyncio.start_server(serve_keep_alive, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        pool = HttpPoolManager()
+        client = pool.get_client(f"http://127.0.0.1:{port}/v1")
+
+        await pool.warm_up(connections_per_host=2)
+        warmed = POOL_CONNECTS.labels("127.0.0.1").value
+        metrics = registry.render()
+
+        response = await client.get(f"http://127.0.0.1:{port}/v1/models")
+        reused = POOL_CONNECTS.labels("127.0.0.1").value == warmed
+
+        await pool.aclose()
+        server.close()
+        await server.wait_closed()
+        return warmed, metrics, response.status_code, reused, client.is_closed
+
+    connects_before = POOL_CONNECTS.labels("127.0.0.1").value
+    warmed, metrics, status_code, reused, closed = asyncio.run(scenario())
+
+    assert warmed - connects_before == 2
+    idle = 'model_router_upstream_pool_connections{host="127.0.0.1",state="idle"} 2'
+    assert idle in metrics
+    assert 'model_router_upstream_pool_wait_seconds_count{host="127.0.0.1"}' in metrics
+    assert status_code == 200
+    assert reused
+    assert closed
+
+
+def test_dns_results_are_cached():
+    """Test that connecting twice resolves the host once within the TTL."""
+    async def scenario():
+        backend = CachingDNSBackend(
+            ttl_seconds=60, backend=httpcore.AsyncMockBackend([], http2=False)
+        )
+        loop = asyncio.get_running_loop()
+        getaddrinfo = AsyncMock(return_value=[(2, 1, 6, "", ("10.0.0.7", 443))])
+        with patch.object(loop, "getaddrinfo", getaddrinfo):
+            first = await backend.resolve("api.example.com", 443)
+            await backend.connect_tcp("api.example.com", 443)
+        return first, getaddrinfo.await_count
+
+    address, lookups = asyncio.run(scenario())
+
+    assert address == "10.0.0.7"
+    assert lookups == 1
+
+
+def test_pool_on_caching_backend_keeps_the_ssl_context():
+    """Test that rebuilding the pool for DNS caching keeps the TLS settings."""
+    context = ssl.create_default_context()
+
+    transport = PooledTransport(
+        "api.example.com",
+        httpx.Limits(max_connections=10),
+        network_backend=CachingDNSBackend(),
+        verify=context,
+    )
+
+    assert transport._pool._ssl_context is context
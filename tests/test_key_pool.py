@@ -0,0 +1,171 @@
+"""Tests for provider API key pools."""
+
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from model_router.domain.exceptions import ProviderRateLimitError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.domain.providers import UpstreamKey
+from model_router.services.adapters.openai import OpenAIAdapter
+from model_router.services.key_pool import (
+    WEIGHTED_ROUND_ROBIN,
+    KeyPool,
+    parse_rate_limit_headroom,
+)
+
+COMPLETION = {
+    "id": "chatcmpl-pool",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "gpt-4o",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "Hi"},
+        "finish_reason": "stop"
+    }],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+}
+
+
+def create_pool(keys: list[UpstreamKey], strategy: str) -> KeyPool:
+    return KeyPool(keys, "https://upstream", lambda key, url: key, strategy)
+
+
+def test_least_outstanding_prefers_idle_keys():
+    """Test that busy keys are skipped while idle keys exist."""
+    pool = create_pool([UpstreamKey("a"), UpstreamKey("b")], "least_outstanding")
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert {first.api_key, second.api_key} == {"a", "b"}
+
+
+def test_weighted_round_robin_follows_weights():
+    """Test that weighted round robin spreads requests by weight."""
+    pool = create_pool(
+        [UpstreamKey("a", weight=3), UpstreamKey("b", weight=1)], WEIGHTED_ROUND_ROBIN
+    )
+
+    picks = Counter()
+    for _ in range(8):
+        member = pool.acquire()
+        picks[member.api_key] += 1
+        pool.release(member)
+
+    assert picks == {"a": 6, "b": 2}
+
+
+def test_rate_limited_key_is_parked_and_request_retried():
+    """Test that a 429 parks the key and the request moves to another key."""
+    seen_keys = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers["authorization"].removeprefix("Bearer ")
+        seen_keys.append(key)
+        if key == "limited":
+            return httpx.Response(429, headers={"retry-after": "60"}, json={})
+        return httpx.Response(200, json=COMPLETION)
+
+    adapter = OpenAIAdapter(
+        keys=[UpstreamKey("limited"), UpstreamKey("healthy")],
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        key_strategy=WEIGHTED_ROUND_ROBIN,
+    )
+    request = ChatCompletionRequest(
+        model="openai/gpt-4o", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    async def scenario():
+        return [await adapter.create_chat_completion(request) for _ in range(3)]
+
+    responses = asyncio.run(scenario())
+
+    assert all(response.id == "chatcmpl-pool" for response in responses)
+    assert seen_keys == ["limited", "healthy", "healthy", "healthy"]
+
+
+def test_pooled_keys_still_retry_server_errors():
+    """Test that a multi-key pool keeps SDK retries for 5xx on the same key."""
+    seen_keys = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_keys.append(request.headers["authorization"].removeprefix("Bearer "))
+        if len(seen_keys) == 1:
+            return httpx.Response(503, headers={"retry-after-ms": "1"}, json={})
+        return httpx.Response(200, json=COMPLETION)
+
+    adapter = OpenAIAdapter(
+        keys=[UpstreamKey("a"), UpstreamKey("b")],
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        key_strategy=WEIGHTED_ROUND_ROBIN,
+    )
+    request = ChatCompletionRequest(
+        model="openai/gpt-4o", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    response = asyncio.run(adapter.create_chat_completion(request))
+
+    assert response.id == "chatcmpl-pool"
+    assert seen_keys == ["a", "a"]
+
+
+def test_rate_limit_headroom_is_read_from_response_headers():
+    """Test that the tightest remaining share of the rate limits is reported."""
+    headers = {
+        "x-ratelimit-limit-requests": "100",
+        "x-ratelimit-remaining-requests": "40",
+        "x-ratelimit-limit-tokens": "1000",
+        "x-ratelimit-remaining-tokens": "50",
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=headers, json=COMPLETION)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter = OpenAIAdapter("test-key", http_client=http_client)
+    request = ChatCompletionRequest(
+        model="openai/gpt-4o", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    asyncio.run(adapter.create_chat_completion(request))
+
+    assert parse_rate_limit_headroom({}) is None
+    assert adapter.rate_limit_headroom("openai/gpt-4o") == 0.05
+
+
+def test_exhausted_pool_reports_the_earliest_cooldown():
+    """Test that a fully parked pool answers with when its first key is back."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers["authorization"].removeprefix("Bearer ")
+        return httpx.Response(
+            429, headers={"retry-after": "20" if key == "a" else "5"}, json={}
+        )
+
+    adapter = OpenAIAdapter(
+        keys=[UpstreamKey("a"), UpstreamKey("b")],
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    request = ChatCompletionRequest(
+        model="openai/gpt-4o", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    with pytest.raises(ProviderRateLimitError) as error:
+        asyncio.run(adapter.create_chat_completion(request))
+
+    assert error.value.retry_after == 5
+
+
+def test_last_key_is_not_parked_without_retry_after():
+    """Test that a 429 with no Retry-After leaves the only key in rotation."""
+    pool = create_pool([UpstreamKey("a"), UpstreamKey("b")], "least_outstanding")
+    first, second = pool.members
+
+    pool.park(first)
+    pool.park(second)
+
+    assert pool.acquire() is second
+    assert pool.retry_after() == 30
@@ -0,0 +1,129 @@
+"""Tests for the non-blocking logging pipeline."""
+
+import json
+import logging
+import time
+
+import model_router.logger as logger_module
+from model_router.domain.call_context import CallContext
+from model_router.logger import (
+    CallContextFilter,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    current_context,
+    get_logger,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def recording_logger(name: str):
+    logger = get_logger(name)
+    handler = RecordingHandler()
+    logger.logger.handlers[:] = [handler]
+    return logger, handler
+
+
+def test_records_are_queued_without_formatting():
+    """Test that loggers only enqueue records and leave formatting to the listener."""
+    logger = get_logger("test.queue")
+    handler = logger.logger.handlers[0]
+    assert isinstance(handler, NonBlockingQueueHandler)
+
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "%s", ("x",), None)
+    assert handler.prepare(record) is record
+    assert record.msg == "%s"
+
+
+def test_json_formatter_writes_one_compact_line():
+    """Test that JSON output carries the call context and skips prettifying."""
+    token = current_context.set(CallContext(user_id="user-1", request_id="req-1"))
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "Payload %s", ('{"a": 1}',), None
+    )
+    try:
+        CallContextFilter().filter(record)
+    finally:
+        current_context.reset(token)
+
+    line = JsonFormatter().format(record)
+
+    assert "\n" not in line
+    entry = json.loads(line)
+    assert entry["user_id"] == "user-1"
+    assert entry["request_id"] == "req-1"
+    assert entry["message"] == 'Payload {"a": 1}'
+
+
+def test_hot_path_messages_are_gated_and_sampled(monkeypatch):
+    """Test that hot-path messages obey their own level and sample rate."""
+    logger, handler = recording_logger("test.hot_path")
+
+    monkeypatch.setattr(logger_module, "HOT_PATH_SAMPLE_RATE", 0.0)
+    logger.info("dropped", hot_path=True)
+    logger.info("kept")
+    monkeypatch.setattr(logger_module, "HOT_PATH_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(logger_module, "HOT_PATH_LOG_LEVEL", logging.WARNING)
+    logger.info("below hot path level", hot_path=True)
+    logger.warning("at hot path level", hot_path=True)
+
+    assert [r.getMessage() for r in handler.records] == ["kept", "at hot path level"]
+
+
+def test_dropped_message_still_sets_call_context(monkeypatch):
+    """Test that sampling a message out does not lose the caller's context."""
+    logger, _ = recording_logger("test.context")
+    monkeypatch.setattr(logger_module, "HOT_PATH_SAMPLE_RATE", 0.0)
+    call_context = CallContext(user_id="user-2")
+    token = current_context.set(None)
+
+    try:
+        logger.info("dropped", call_context=call_context, hot_path=True)
+        assert current_context.get() is call_context
+    finally:
+        current_context.reset(token)
+
+
+def test_records_name_the_calling_function():
+    """Test that the adapter's own frame is not reported as the caller."""
+    logger, handler = recording_logger("test.caller")
+
+    logger.info("plain")
+    logger.log(logging.WARNING, "direct")
+
+    assert {record.funcName for record in handler.records} == {
+        "test_records_name_the_calling_function"
+    }
+
+
+def test_per_request_logging_overhead_is_microseconds(monkeypatch):
+    """Test the cost of per-request INFO messages at a 1% sample rate."""
+    logger = get_logger("test.overhead")
+    monkeypatch.setattr(logger_module, "HOT_PATH_LOG_LEVEL", logging.INFO)
+    monkeypatch.setattr(logger_module, "HOT_PATH_SAMPLE_RATE", 0.01)
+    call_context = CallContext(user_id="user-3")
+    token = current_context.set(None)
+    calls = 5000
+
+    try:
+        started = time.perf_counter()
+        for _ in range(calls):
+            logger.info(
+                "Routing chat completion for model: %s",
+                "m",
+                call_context=call_context,
+                hot_path=True,
+            )
+        per_call = (time.perf_counter() - started) / calls
+    finally:
+        current_context.reset(token)
+
+    # Generous bound so slow CI machines do not flake; typically around 1µs
+    assert per_call < 5e-6
@@ -0,0 +1,32 @@
+"""Tests for the metrics registry and endpoint."""
+
+from model_router.metrics import MetricsRegistry
+
+
+def test_registry_renders_exposition_format():
+    """Test counters and histograms in the Prometheus text format."""
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests", ("model",))
+    latency = metrics.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+    requests.labels("gpt-4o").inc()
+    requests.labels("gpt-4o").inc(2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+
+    text = metrics.render()
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{model="gpt-4o"} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+
+def test_metrics_endpoint(test_client):
+    """Test that /metrics is served without authentication."""
+    response = test_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "model_router_hedged_requests_total" in response.text
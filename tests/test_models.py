@@ -1,5 +1,35 @@
 """Tests for models endpoint."""
 
+import pytest
+
+from model_router.api import routes
+from model_router.services.circuit_breaker import CircuitBreaker
+from model_router.services.model_router import ModelRouterService
+from tests.fakes import ScriptedAdapter
+
+AUTH = {"Authorization": "Bearer test-key"}
+
+
+class CountingAdapter(ScriptedAdapter):
+    def __init__(self, prefix: str):
+        super().__init__(prefix)
+        self.model_lookups = 0
+
+    async def get_available_models(self) -> list[str]:
+        self.model_lookups += 1
+        return ["model"]
+
+
+@pytest.fixture
+def counting_service(initialized_config, monkeypatch):
+    service = ModelRouterService(
+        {"a": CountingAdapter("a"), "b": CountingAdapter("b")},
+        circuit_breaker_factory=lambda name: CircuitBreaker(
+            name, min_requests=1, open_seconds=60
+        ),
+    )
+    monkeypatch.setattr(routes, "router_service", service)
+    return service
 
 
 def test_models_endpoint_direct(test_client, mock_all_providers_env):
@@ -44,3 +74,50 @@ def test_models_with_openai_client(
     assert hasattr(first_model, "created")
     assert hasattr(first_model, "owned_by")
     assert first_model.object == "model"
+
+
+def test_models_served_from_precomputed_body_with_etag(test_client, counting_service):
+    """Test that models are looked up once and the body kept until invalidated."""
+    first = test_client.get("/v1/models", headers=AUTH)
+    second = test_client.get("/v1/models", headers=AUTH)
+
+    assert first.status_code == second.status_code == 200
+    assert [model["id"] for model in first.json()["data"]] == ["a/model", "b/model"]
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    assert [p.model_lookups for p in counting_service._providers.values()] == [1, 1]
+
+    counting_service.invalidate_catalog()
+    test_client.get("/v1/models", headers=AUTH)
+    assert [p.model_lookups for p in counting_service._providers.values()] == [2, 2]
+
+
+def test_if_none_match_returns_not_modified(test_client, counting_service):
+    """Test that a client holding the current ETag gets an empty 304."""
+    etag = test_client.get("/v1/models", headers=AUTH).headers["etag"]
+
+    for if_none_match in (etag, f'"stale", W/{etag}', "*"):
+        response = test_client.get(
+            "/v1/models", headers={**AUTH, "If-None-Match": if_none_match}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    response = test_client.get(
+        "/v1/models", headers={**AUTH, "If-None-Match": '"stale"'}
+    )
+    assert response.status_code == 200
+
+
+def test_providers_etag_changes_with_circuit_state(test_client, counting_service):
+    """Test that the precomputed provider list is rebuilt when a breaker opens."""
+    first = test_client.get("/v1/providers", headers=AUTH)
+    counting_service._breakers["a"].record_failure(0.0)
+    second = test_client.get(
+        "/v1/providers", headers={**AUTH, "If-None-Match": first.headers["etag"]}
+    )
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert {p["prefix"]: p["circuit_state"] for p in second.json()}["a"] == "open"
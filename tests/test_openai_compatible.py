@@ -0,0 +1,115 @@
+"""Tests for the generic OpenAI-compatible adapter engine."""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from model_router.config import AppConfig
+from model_router.domain.exceptions import ModelNotSupportedError, ProviderAPIError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.domain.providers import (
+    CompatibleProvider,
+    ModelPrice,
+    UpstreamKey,
+)
+from model_router.services.adapters.groq import GROQ_PROVIDER
+from model_router.services.adapters.openai_compatible import OpenAICompatibleAdapter
+
+VENDOR = CompatibleProvider(
+    name="fastvendor",
+    prefix="fast",
+    base_url="https://fast.example.com/v1",
+    models=("llama-3.1-8b",),
+    prices={"llama-3.1-8b": ModelPrice(0.0001, 0.0002)},
+)
+
+
+def vendor_api(request: httpx.Request) -> httpx.Response:
+    """Stand-in for an OpenAI-compatible vendor."""
+    payload = json.loads(request.content)
+    assert request.url == "https://fast.example.com/v1/chat/completions"
+    assert request.headers["authorization"] == "Bearer fast-key"
+    if payload["messages"][0]["content"] == "fail":
+        return httpx.Response(500, json={"error": {"message": "boom"}})
+    return httpx.Response(200, json={
+        "id": "chatcmpl-fast",
+        "object": "chat.completion",
+        "created": 1,
+        "model": payload["model"],
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "hi"},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+    })
+
+
+@pytest.fixture(params=[False, True], ids=["sdk", "passthrough"])
+def adapter(request) -> OpenAICompatibleAdapter:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(vendor_api))
+    return OpenAICompatibleAdapter(
+        VENDOR,
+        [UpstreamKey("fast-key")],
+        passthrough=request.param,
+        http_client=http_client,
+    )
+
+
+def create_request(content: str = "Hello", model: str = "fast/llama-3.1-8b"):
+    return ChatCompletionRequest(
+        model=model, messages=[{"role": "user", "content": content}]
+    )
+
+
+def test_declared_vendor_serves_completions(adapter):
+    """Test that a vendor declared only by config answers completions."""
+    result = asyncio.run(adapter.create_chat_completion(create_request()))
+
+    assert result.usage["total_tokens"] == 4
+    assert adapter.provider_name == "fastvendor"
+    assert asyncio.run(adapter.get_available_models()) == ["llama-3.1-8b"]
+    assert adapter.get_model_prices() == VENDOR.prices
+
+
+def test_vendor_errors_and_unknown_models(adapter):
+    """Test status mapping and the model check against the declared list."""
+    with pytest.raises(ProviderAPIError, match="fastvendor API error") as exc_info:
+        asyncio.run(adapter.create_chat_completion(create_request("fail")))
+    assert exc_info.value.status_code == 500
+
+    with pytest.raises(ModelNotSupportedError):
+        asyncio.run(
+            adapter.create_chat_completion(create_request(model="fast/unknown"))
+        )
+
+
+def test_vendors_are_loaded_from_config():
+    """Test that extra vendors and their key pools come from the environment."""
+    vendors = json.dumps([{
+        "name": "together",
+        "prefix": "together",
+        "base_url": "https://api.together.xyz/v1",
+        "models": ["llama"],
+        "prices": {"llama": [0.001, 0.002]},
+    }])
+    env = {"OPENAI_COMPATIBLE_PROVIDERS": vendors, "TOGETHER_API_KEYS": "k1,k2"}
+    with patch.dict(os.environ, env):
+        app_config = AppConfig()
+
+    [vendor] = app_config.compatible_providers
+    assert vendor.base_url == "https://api.together.xyz/v1"
+    assert vendor.prices == {"llama": ModelPrice(0.001, 0.002)}
+    assert len(app_config.compatible_provider_keys["together"]) == 2
+
+
+def test_groq_is_a_declaration():
+    """Test that built-in vendors are plain declarations on the shared engine."""
+    adapter = OpenAICompatibleAdapter(GROQ_PROVIDER)
+
+    assert adapter.prefix == "groq"
+    assert not adapter.is_configured()
@@ -0,0 +1,98 @@
+"""Tests for raw passthrough mode on OpenAI-compatible adapters."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from model_router.domain.exceptions import ProviderAPIError
+from model_router.domain.models import ChatCompletionRequest, RawChatCompletion
+from model_router.services.adapters.openai import OpenAIAdapter
+
+UPSTREAM_BODY = (
+    b'{"id":"chatcmpl-up","object":"chat.completion","created":1,'
+    b'"model":"gpt-4o-2024-08-06","choices":[{"index":0,"message":{"role":'
+    b'"assistant","content":"say \\"model\\": \\"x\\""},"finish_reason":"stop"}],'
+    b'"usage":{"prompt_tokens":5,"completion_tokens":7,"total_tokens":12}}'
+)
+
+
+def upstream_handler(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    assert request.headers["authorization"] == "Bearer test-key"
+    assert payload["model"] == "gpt-4o"
+
+    if payload["messages"][0]["content"] == "fail":
+        return httpx.Response(429, json={"error": {"message": "rate limited"}})
+
+    if payload.get("stream"):
+        assert payload["stream_options"] == {"include_usage": True}
+        chunk = {"id": "chatcmpl-up", "object": "chat.completion.chunk",
+                 "model": "gpt-4o-2024-08-06", "choices": []}
+        body = f"data: {json.dumps(chunk)}\n\n"
+        if payload["messages"][0]["content"] != "truncated":
+            body += "data: [DONE]\n\n"
+        return httpx.Response(
+            200, content=body.encode(), headers={"content-type": "text/event-stream"}
+        )
+
+    return httpx.Response(200, content=UPSTREAM_BODY)
+
+
+def create_adapter() -> OpenAIAdapter:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(upstream_handler))
+    return OpenAIAdapter("test-key", passthrough=True, http_client=http_client)
+
+
+def create_request(
+    content: str = "Hello", stream: bool = False
+) -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model="openai/gpt-4o",
+        messages=[{"role": "user", "content": content}],
+        stream=stream,
+    )
+
+
+def test_passthrough_forwards_body_with_rewritten_model():
+    """Test that only the top-level model field is rewritten."""
+    result = asyncio.run(create_adapter().create_chat_completion(create_request()))
+
+    assert isinstance(result, RawChatCompletion)
+    assert result.body == UPSTREAM_BODY.replace(b'"gpt-4o-2024-08-06"', b'"gpt-4o"')
+    assert result.usage == {
+        "prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12
+    }
+
+
+def test_passthrough_stream_rewrites_model_per_chunk():
+    """Test that streamed payloads are forwarded with the model rewritten."""
+    async def collect() -> list[str]:
+        chunks = await create_adapter().create_chat_completion(
+            create_request(stream=True)
+        )
+        return [chunk async for chunk in chunks]
+
+    chunks = asyncio.run(collect())
+
+    assert len(chunks) == 1
+    assert json.loads(chunks[0])["model"] == "gpt-4o"
+
+
+def test_passthrough_truncated_stream_is_an_error():
+    """Test that a stream cut off before [DONE] is not taken as complete."""
+    async def collect() -> list[str]:
+        chunks = await create_adapter().create_chat_completion(
+            create_request("truncated", stream=True)
+        )
+        return [chunk async for chunk in chunks]
+
+    with pytest.raises(ProviderAPIError, match="before \\[DONE\\]"):
+        asyncio.run(collect())
+
+
+def test_passthrough_upstream_error():
+    """Test that upstream error statuses surface as ProviderAPIError."""
+    with pytest.raises(ProviderAPIError, match="429"):
+        asyncio.run(create_adapter().create_chat_completion(create_request("fail")))
@@ -0,0 +1,158 @@
+"""Tests for per-user rate limits."""
+
+import asyncio
+
+import pytest
+
+from model_router.api import routes
+from model_router.domain.exceptions import RateLimitExceededError
+from model_router.services.rate_limiter import RateLimiter, RoleLimits
+from model_router.services.user_service import UserService
+from model_router.storages.rate_limit_storage import (
+    InMemoryRateLimitStorage,
+    RedisRateLimitStorage,
+)
+
+
+def test_bucket_refills_and_allows_debt():
+    """Test taking, refusing without taking, and going into debt."""
+    async def scenario():
+        storage = InMemoryRateLimitStorage()
+        first = await storage.take("k", capacity=2, refill_per_second=0.001)
+        second = await storage.take("k", capacity=2, refill_per_second=0.001)
+        refused = await storage.take("k", capacity=2, refill_per_second=0.001)
+        debt = await storage.take(
+            "k", capacity=2, refill_per_second=0.001, amount=3, allow_debt=True
+        )
+        return first, second, refused, debt
+
+    first, second, refused, debt = asyncio.run(scenario())
+
+    assert first.allowed and second.allowed
+    assert round(second.remaining) == 0
+    assert not refused.allowed
+    assert refused.retry_after == pytest.approx(1000, rel=0.01)
+    assert debt.allowed
+    assert debt.remaining == 0
+    assert debt.reset_seconds == pytest.approx(5000, rel=0.01)
+
+
+def test_limits_fall_back_to_default_role():
+    """Test that unknown and missing roles get the default role's limits."""
+    limiter = RateLimiter(
+        InMemoryRateLimitStorage(),
+        {"user": RoleLimits(requests_per_second=1), "admin": RoleLimits(10)},
+    )
+
+    assert limiter.limits_for("admin").requests_per_second == 10
+    assert limiter.limits_for("guest").requests_per_second == 1
+    assert limiter.limits_for(None).requests_per_second == 1
+
+
+def test_tokens_are_settled_from_usage():
+    """Test that usage beyond the estimate holds back the next request."""
+    async def scenario():
+        limiter = RateLimiter(
+            InMemoryRateLimitStorage(), {"user": RoleLimits(tokens_per_minute=100)}
+        )
+        await limiter.check_tokens("u1", "user", 10)
+        headers = await limiter.settle_tokens("u1", "user", 10, {"total_tokens": 150})
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await limiter.check_tokens("u1", "user", 10)
+        return headers, exc_info.value
+
+    headers, error = asyncio.run(scenario())
+
+    assert headers["x-ratelimit-limit-tokens"] == "100"
+    assert headers["x-ratelimit-remaining-tokens"] == "0"
+    assert error.retry_after == pytest.approx(36, rel=0.01)
+
+
+def test_requests_over_the_role_limit_get_429(test_client, monkeypatch):
+    """Test x-ratelimit headers and 429 with Retry-After per user and role."""
+    limiter = RateLimiter(
+        InMemoryRateLimitStorage(),
+        {
+            "user": RoleLimits(requests_per_second=0.01, burst=2),
+            "admin": RoleLimits(requests_per_second=100),
+        },
+    )
+    monkeypatch.setattr(routes, "rate_limiter", limiter)
+    user = {"Authorization": "Bearer user-token-789"}
+
+    first = test_client.get("/v1/providers", headers=user)
+    test_client.get("/v1/providers", headers=user)
+    limited = test_client.get("/v1/providers", headers=user)
+    admin = test_client.get(
+        "/v1/providers", headers={"Authorization": "Bearer admin-token-123"}
+    )
+
+    assert first.status_code == 200
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 99
+    assert limited.headers["x-ratelimit-limit-requests"] == "2"
+    assert limited.headers["x-ratelimit-remaining-requests"] == "0"
+    assert admin.status_code == 200
+
+
+def test_chat_completion_reports_token_headers(test_client, monkeypatch):
+    """Test that chat completions carry request and token quota headers."""
+    limiter = RateLimiter(
+        InMemoryRateLimitStorage(),
+        {"user": RoleLimits(requests_per_second=10, tokens_per_minute=100000)},
+    )
+    monkeypatch.setattr(routes, "rate_limiter", limiter)
+
+    response = test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer user-token-789"},
+        json={
+            "model": "openai/gpt-4o-mini",
+            "messages": [{"role": "user", "content": "Hello"}],
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["x-ratelimit-limit-requests"] == "10"
+    assert response.headers["x-ratelimit-limit-tokens"] == "100000"
+    remaining = int(response.headers["x-ratelimit-remaining-tokens"])
+    assert remaining < 100000
+
+
+def test_user_is_not_looked_up_without_role_based_limits(test_client, monkeypatch):
+    """Test that requests skip the user lookup when nothing needs the role."""
+    lookups = []
+    original = UserService.get_user_by_uid
+
+    async def counting_lookup(self, uid, call_context):
+        lookups.append(uid)
+        return await original(self, uid, call_context)
+
+    monkeypatch.setattr(UserService, "get_user_by_uid", counting_lookup)
+    monkeypatch.setattr(
+        routes, "rate_limiter", RateLimiter(InMemoryRateLimitStorage(), {})
+    )
+    headers = {"Authorization": "Bearer user-token-789"}
+
+    assert test_client.get("/v1/providers", headers=headers).status_code == 200
+    assert lookups == []
+    assert test_client.get("/v1/user/me", headers=headers).status_code == 200
+    assert len(lookups) == 1
+
+
+def test_redis_buckets_are_shared():
+    """Test that two limiters on the same Redis share one bucket."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def scenario():
+        server = fakeredis.FakeServer()
+        replicas = [
+            RedisRateLimitStorage(fakeredis.FakeAsyncRedis(server=server))
+            for _ in range(2)
+        ]
+        return [
+            (await replica.take("k", capacity=2, refill_per_second=0.001)).allowed
+            for replica in replicas * 2
+        ]
+
+    assert asyncio.run(scenario()) == [True, True, False, False]
@@ -0,0 +1,95 @@
+"""Tests for chat completion request metrics."""
+
+import asyncio
+
+import pytest
+
+from model_router.domain.call_context import CallContext
+from model_router.domain.exceptions import ProviderAPIError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.services.model_router import ModelRouterService
+from model_router.services.request_metrics import (
+    ERRORS,
+    REQUESTS,
+    ROUTER_OVERHEAD,
+    TIME_TO_FIRST_TOKEN,
+    TOKENS,
+    UPSTREAM_DURATION,
+    instruments_for,
+)
+from tests.fakes import ScriptedAdapter
+
+HEADERS = {"Authorization": "Bearer test-key"}
+MODEL = "openai/gpt-4o-mini"
+
+
+def chat(test_client, model: str = MODEL, **kwargs):
+    messages = [{"role": "user", "content": "Hi"}]
+    return test_client.post(
+        "/v1/chat/completions",
+        headers=HEADERS,
+        json={"model": model, "messages": messages, **kwargs},
+    )
+
+
+def count(histogram, *labels) -> int:
+    return sum(histogram.labels(*labels).counts)
+
+
+def test_completion_is_counted_with_latency_and_tokens(test_client):
+    """Test request, latency split and token metrics for a routed completion."""
+    requests = REQUESTS.labels("openai", MODEL, "200")
+    input_tokens = TOKENS.labels("openai", MODEL, "input")
+    before = (
+        requests.value,
+        input_tokens.value,
+        count(UPSTREAM_DURATION, "openai", MODEL),
+        count(ROUTER_OVERHEAD, "openai", MODEL),
+    )
+
+    assert chat(test_client).status_code == 200
+
+    assert requests.value == before[0] + 1
+    assert input_tokens.value > before[1]
+    assert count(UPSTREAM_DURATION, "openai", MODEL) == before[2] + 1
+    assert count(ROUTER_OVERHEAD, "openai", MODEL) == before[3] + 1
+    metrics = test_client.get("/metrics").text
+    assert "model_router_request_duration_seconds_bucket" in metrics
+
+
+def test_stream_records_time_to_first_token(test_client):
+    """Test that streamed completions report time to first token."""
+    before = count(TIME_TO_FIRST_TOKEN, "openai", MODEL)
+
+    chat(test_client, stream=True)
+
+    assert count(TIME_TO_FIRST_TOKEN, "openai", MODEL) == before + 1
+
+
+def test_errors_are_counted_by_exception_class(test_client):
+    """Test that unroutable models are counted without their name as a label."""
+    errors = ERRORS.labels("unknown", "unknown", "ModelNotSupportedError")
+    not_found = REQUESTS.labels("unknown", "unknown", "404")
+    before = errors.value, not_found.value
+
+    response = chat(test_client, model="nonexistent/model")
+
+    assert response.status_code == 404
+    assert errors.value == before[0] + 1
+    assert not_found.value == before[1] + 1
+
+
+def test_unanswered_models_share_the_unknown_label():
+    """Test that client-chosen model names never become metric labels."""
+    service = ModelRouterService(
+        {"primary": ScriptedAdapter("primary", ProviderAPIError("No model", 404))}
+    )
+    request = ChatCompletionRequest(
+        model="primary/no-such-model", messages=[{"role": "user", "content": "Hi"}]
+    )
+    call_context = CallContext()
+
+    with pytest.raises(ProviderAPIError):
+        asyncio.run(service.create_chat_completion(request, call_context))
+
+    assert instruments_for(call_context).model == "unknown"
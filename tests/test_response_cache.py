@@ -0,0 +1,121 @@
+"""Tests for the exact-match response cache."""
+
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model_router.api import routes
+from model_router.config import config
+from model_router.services.request_metrics import TOKENS
+from model_router.storages.response_cache_storage import (
+    FileResponseCacheStorage,
+    InMemoryResponseCacheStorage,
+)
+
+
+@pytest.fixture
+def cached_client(test_client, monkeypatch):
+    """Test client in front of a router with the response cache enabled."""
+    monkeypatch.setattr(config, "response_cache_enabled", True)
+    monkeypatch.setattr(routes, "router_service", routes.create_router_service())
+    return test_client
+
+
+def post_completion(test_client, content: str, temperature: float, headers=None):
+    return test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key", **(headers or {})},
+        json={
+            "model": "openai/gpt-3.5-turbo",
+            "messages": [{"role": "user", "content": content}],
+            "temperature": temperature
+        }
+    )
+
+
+def test_deterministic_request_is_cached(cached_client):
+    """Test that temperature=0 requests miss once and then hit."""
+    content = f"cache me {uuid.uuid4()}"
+
+    first = post_completion(cached_client, content, 0)
+    second = post_completion(cached_client, content, 0)
+
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    assert second.status_code == 200
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_cache_hit_is_not_metered(cached_client):
+    """Test that a cache hit adds no token usage, since no upstream answered."""
+    content = f"metered once {uuid.uuid4()}"
+    input_tokens = TOKENS.labels("openai", "openai/gpt-3.5-turbo", "input")
+
+    post_completion(cached_client, content, 0)
+    after_miss = input_tokens.value
+    hit = post_completion(cached_client, content, 0)
+
+    assert hit.headers["x-cache"] == "HIT"
+    assert input_tokens.value == after_miss
+
+
+def test_non_deterministic_request_is_not_cached(cached_client):
+    """Test that sampled requests bypass the cache."""
+    response = post_completion(cached_client, f"sampled {uuid.uuid4()}", 0.7)
+
+    assert response.status_code == 200
+    assert "x-cache" not in response.headers
+
+
+def test_opt_in_header_caches_request(cached_client):
+    """Test that the opt-in header caches non-deterministic requests."""
+    content = f"opt in {uuid.uuid4()}"
+    headers = {"X-Router-Cache": "force"}
+
+    post_completion(cached_client, content, 0.7, headers)
+    response = post_completion(cached_client, content, 0.7, headers)
+
+    assert response.headers["x-cache"] == "HIT"
+
+
+def test_in_memory_storage_evicts_lru_and_expired():
+    """Test LRU eviction and TTL expiry of the in-memory storage."""
+    async def scenario():
+        storage = InMemoryResponseCacheStorage(max_entries=2)
+        await storage.set("a", b"1", 60)
+        await storage.set("b", b"2", 60)
+        await storage.get("a")
+        await storage.set("c", b"3", 60)
+        assert await storage.get("b") is None
+        await storage.set("expired", b"4", -1)
+        return [await storage.get(key) for key in ("a", "b", "c", "expired")]
+
+    assert asyncio.run(scenario()) == [None, None, b"3", None]
+
+
+def test_file_storage_round_trip(tmp_path):
+    """Test that the file storage persists values across instances."""
+    async def scenario():
+        await FileResponseCacheStorage(str(tmp_path)).set("key", b"{}", 60)
+        return await FileResponseCacheStorage(str(tmp_path)).get("key")
+
+    assert asyncio.run(scenario()) == b"{}"
+
+
+def test_file_storage_index_survives_concurrent_workers(tmp_path):
+    """Test that worker threads sharing the storage keep the LRU index bounded."""
+    storage = FileResponseCacheStorage(str(tmp_path), max_entries=8)
+
+    def work(worker: int) -> None:
+        for i in range(50):
+            storage._write(f"{worker}-{i}", b"{}", 60)
+            storage._read(f"{worker}-{i // 2}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+
+    assert len(storage._index) == 8
+    assert len(list(tmp_path.iterdir())) == 8
@@ -0,0 +1,118 @@
+"""Tests for latency- and health-aware routing between alias targets."""
+
+import asyncio
+
+import pytest
+
+from model_router.domain.exceptions import ProviderRateLimitError
+from model_router.domain.models import ChatCompletionRequest
+from model_router.services.model_router import ModelRouterService
+from model_router.services.routing_engine import (
+    LEAST_LATENCY,
+    POWER_OF_TWO,
+    RoutingEngine,
+)
+from tests.fakes import ScriptedAdapter
+
+
+def test_least_latency_prefers_fastest_target():
+    """Test that the target with the lowest expected latency goes first."""
+    engine = RoutingEngine(strategy=LEAST_LATENCY)
+    engine.record_success("fast/model", 0.1)
+    engine.record_success("slow/model", 0.5)
+
+    assert engine.rank("llama", ["slow/model", "fast/model"]) == [
+        "fast/model", "slow/model"
+    ]
+
+
+def test_errors_and_throttling_lower_the_score():
+    """Test that error rate inflates the score and a 429 removes headroom."""
+    engine = RoutingEngine(strategy=LEAST_LATENCY, alpha=0.5)
+    engine.record_success("flaky/model", 0.1)
+    engine.record_failure("flaky/model")
+    engine.record_success("steady/model", 0.15)
+
+    assert engine.score("flaky/model") == 0.2
+    assert engine.rank("llama", ["flaky/model", "steady/model"])[0] == "steady/model"
+
+    engine.record_throttled("steady/model", retry_after=60)
+    assert engine.score("steady/model") == float("inf")
+
+
+def test_low_rate_limit_headroom_lowers_the_score():
+    """Test that a target close to its rate limit loses first choice."""
+    engine = RoutingEngine(strategy=LEAST_LATENCY, low_headroom=0.1)
+    engine.record_success("busy/model", 0.1, headroom=0.02)
+    engine.record_success("idle/model", 0.3, headroom=0.8)
+
+    assert engine.score("busy/model") == pytest.approx(0.5)
+    assert engine.score("idle/model") == 0.3
+    assert engine.rank("llama", ["busy/model", "idle/model"])[0] == "idle/model"
+
+
+def test_streaming_ranks_by_time_to_first_token():
+    """Test that streams are routed on TTFT rather than full latency."""
+    engine = RoutingEngine(strategy=LEAST_LATENCY)
+    engine.record_success("a/model", 2.0)
+    engine.record_success("a/model", 0.1, streaming=True)
+    engine.record_success("b/model", 1.0)
+    engine.record_success("b/model", 0.5, streaming=True)
+
+    assert engine.rank("llama", ["a/model", "b/model"])[0] == "b/model"
+    assert engine.rank("llama", ["a/model", "b/model"], streaming=True)[0] == "a/model"
+
+
+def test_power_of_two_choices_picks_better_of_pair():
+    """Test that p2c never chooses the worst of three targets."""
+    engine = RoutingEngine(strategy=POWER_OF_TWO)
+    for model, latency in [("a/model", 0.1), ("b/model", 0.2), ("c/model", 0.9)]:
+        engine.record_success(model, latency)
+
+    picks = {engine.rank("llama", ["a/model", "b/model", "c/model"])[0]
+             for _ in range(50)}
+
+    assert "c/model" not in picks
+
+
+def test_alias_routes_to_learned_fastest_provider():
+    """Test that an alias spreads to both vendors, then settles on the fast one."""
+    fast = ScriptedAdapter("fast")
+    slow = ScriptedAdapter("slow", delay=0.05)
+    service = ModelRouterService(
+        {"fast": fast, "slow": slow},
+        model_aliases={"llama": ["slow/model", "fast/model"]},
+        routing_engine=RoutingEngine(strategy=LEAST_LATENCY),
+    )
+    request = ChatCompletionRequest(
+        model="llama", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    async def scenario():
+        return [await service.create_chat_completion(request) for _ in range(5)]
+
+    responses = asyncio.run(scenario())
+
+    assert slow.calls == 1
+    assert [response.id for response in responses[-3:]] == ["chatcmpl-fast"] * 3
+
+
+def test_rate_limited_alias_target_fails_over():
+    """Test that a 429 from one vendor moves the alias to the other."""
+    limited = ScriptedAdapter("limited", ProviderRateLimitError("slow down", 30))
+    service = ModelRouterService(
+        {"limited": limited, "other": ScriptedAdapter("other")},
+        model_aliases={"llama": ["limited/model", "other/model"]},
+        routing_engine=RoutingEngine(strategy=LEAST_LATENCY),
+    )
+    request = ChatCompletionRequest(
+        model="llama", messages=[{"role": "user", "content": "Hello"}]
+    )
+
+    async def scenario():
+        return [await service.create_chat_completion(request) for _ in range(3)]
+
+    responses = asyncio.run(scenario())
+
+    assert all(response.id == "chatcmpl-other" for response in responses)
+    assert limited.calls == 1
@@ -0,0 +1,68 @@
+"""Tests for in-flight request coalescing."""
+
+import asyncio
+
+from model_router.domain.models import ChatCompletionRequest
+from model_router.services.model_router import ModelRouterService
+from model_router.services.single_flight import SingleFlight
+from tests.fakes import ScriptedAdapter
+
+
+def create_request() -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model="slow/model",
+        messages=[{"role": "user", "content": "Hello"}],
+        temperature=0,
+    )
+
+
+def test_identical_requests_share_one_upstream_call():
+    """Test that concurrent identical requests are coalesced."""
+    adapter = ScriptedAdapter("slow", delay=0.05)
+    service = ModelRouterService({"slow": adapter}, single_flight=SingleFlight())
+
+    async def scenario():
+        return await asyncio.gather(
+            *(service.create_chat_completion(create_request()) for _ in range(5))
+        )
+
+    responses = asyncio.run(scenario())
+
+    assert adapter.calls == 1
+    assert all(response is responses[0] for response in responses)
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Test that one waiter going away leaves the others served."""
+    adapter = ScriptedAdapter("slow", delay=0.05)
+    single_flight = SingleFlight()
+    service = ModelRouterService({"slow": adapter}, single_flight=single_flight)
+
+    async def scenario():
+        first = asyncio.create_task(service.create_chat_completion(create_request()))
+        second = asyncio.create_task(service.create_chat_completion(create_request()))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()).id == "chatcmpl-slow"
+    assert adapter.calls == 1
+    assert adapter.cancelled == 0
+
+
+def test_last_waiter_cancellation_cancels_upstream_call():
+    """Test that the upstream call is cancelled once nobody is waiting."""
+    adapter = ScriptedAdapter("slow", delay=0.05)
+    single_flight = SingleFlight()
+    service = ModelRouterService({"slow": adapter}, single_flight=single_flight)
+
+    async def scenario():
+        task = asyncio.create_task(service.create_chat_completion(create_request()))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    assert adapter.cancelled == 1
+    assert single_flight.in_flight() == 0
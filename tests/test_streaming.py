@@ -0,0 +1,157 @@
+"""Tests for streaming chat completions."""
+
+import json
+
+import pytest
+
+from model_router.api import routes
+from model_router.services.model_router import UPSTREAM_COST, ModelRouterService
+from model_router.services.request_metrics import TOKENS
+from tests.fakes import ScriptedAdapter
+
+HEADERS = {"Authorization": "Bearer test-key"}
+
+
+def stream_events(test_client, **body) -> list[str]:
+    with test_client.stream(
+        "POST",
+        "/v1/chat/completions",
+        headers=HEADERS,
+        json={
+            "model": "openai/gpt-3.5-turbo",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True,
+            **body,
+        },
+    ) as response:
+        assert response.status_code == 200
+        return [line for line in response.iter_lines() if line]
+
+
+class BrokenStreamAdapter(ScriptedAdapter):
+    async def create_chat_completion(self, request):
+        async def chunks():
+            yield '{"choices":[{"index":0,"delta":{"content":"Hi"}}]}'
+            raise RuntimeError("boom")
+
+        return chunks()
+
+
+class SpacedUsageAdapter(ScriptedAdapter):
+    async def create_chat_completion(self, request):
+        async def chunks():
+            yield '{"choices": [{"index": 0, "delta": {"content": "Hi"}}]}'
+            yield '{"choices": [], "usage": {"prompt_tokens": 3, "total_tokens": 4}}'
+
+        return chunks()
+
+
+def test_chat_completions_stream_sse(test_client):
+    """Test that stream=True returns server-sent events chunk by chunk."""
+    with test_client.stream(
+        "POST",
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key"},
+        json={
+            "model": "openai/gpt-3.5-turbo",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True
+        }
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line for line in response.iter_lines() if line]
+
+    assert events[-1] == "data: [DONE]"
+    chunks = [json.loads(event.removeprefix("data: ")) for event in events[:-1]]
+    assert all(chunk["object"] == "chat.completion.chunk" for chunk in chunks)
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+
+    content = "".join(
+        chunk["choices"][0]["delta"].get("content", "") for chunk in chunks
+    )
+    assert "mock response from openai adapter" in content.lower()
+
+
+def test_chat_completions_stream_with_openai_client(openai_client_with_test_transport):
+    """Test streaming chat completion using OpenAI client with TestClient transport."""
+    stream = openai_client_with_test_transport.chat.completions.create(
+        model="openai/gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "How are you?"}],
+        stream=True
+    )
+
+    content = "".join(chunk.choices[0].delta.content or "" for chunk in stream)
+    assert "mock response from openai adapter" in content.lower()
+
+
+def test_chat_completions_stream_invalid_model(test_client):
+    """Test that routing errors are reported before the stream starts."""
+    response = test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key"},
+        json={
+            "model": "invalid-model",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True
+        }
+    )
+
+    assert response.status_code == 404
+
+
+def test_stream_usage_is_counted_and_sent_only_when_asked(test_client):
+    """Test that upstream usage is always read but forwarded only on request."""
+    input_tokens = TOKENS.labels("openai", "openai/gpt-3.5-turbo", "input")
+    before = input_tokens.value
+
+    default = stream_events(test_client)
+    asked = stream_events(test_client, stream_options={"include_usage": True})
+
+    assert input_tokens.value == before + 20
+    assert all('"usage":{' not in event for event in default)
+    usage_chunk = json.loads(asked[-2].removeprefix("data: "))
+    assert usage_chunk["choices"] == []
+    assert usage_chunk["usage"]["total_tokens"] == 20
+
+
+def test_stream_cost_is_counted_from_its_usage(test_client):
+    """Test that a stream's list-price cost is read from its final usage chunk."""
+    cost = UPSTREAM_COST.labels("openai/gpt-3.5-turbo")
+    before = cost.value
+
+    stream_events(test_client)
+
+    assert cost.value > before
+
+
+@pytest.fixture
+def broken_stream(initialized_config, monkeypatch):
+    service = ModelRouterService({"broken": BrokenStreamAdapter("broken")})
+    monkeypatch.setattr(routes, "router_service", service)
+
+
+def test_unexpected_mid_stream_error_is_reported(test_client, broken_stream):
+    """Test that any failure mid-stream ends it with an error event."""
+    events = stream_events(test_client, model="broken/model")
+
+    assert json.loads(events[0].removeprefix("data: "))["choices"]
+    assert json.loads(events[-1].removeprefix("data: "))["error"]["type"] == (
+        "server_error"
+    )
+
+
+@pytest.fixture
+def spaced_usage(initialized_config, monkeypatch):
+    service = ModelRouterService({"spaced": SpacedUsageAdapter("spaced")})
+    monkeypatch.setattr(routes, "router_service", service)
+
+
+def test_spaced_usage_chunk_is_not_forwarded(test_client, spaced_usage):
+    """Test that a usage-only chunk is spotted however the upstream spaces it."""
+    events = stream_events(test_client, model="spaced/model")
+
+    assert events == [
+        'data: {"choices": [{"index": 0, "delta": {"content": "Hi"}}]}',
+        "data: [DONE]",
+    ]
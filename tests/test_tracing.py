@@ -0,0 +1,106 @@
+"""Tests for spans and W3C trace context propagation."""
+
+import json
+import threading
+
+import pytest
+
+from model_router.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    SpanExporter,
+    Tracer,
+    parse_traceparent,
+    tracer,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+TRACEPARENT = f"00-{TRACE_ID}-{PARENT_ID}-01"
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter, export_interval_seconds=0.05)
+    yield exporter
+    tracer.configure(None)
+
+
+def chat(test_client, **headers):
+    return test_client.post(
+        "/v1/chat/completions",
+        headers={"Authorization": "Bearer test-key", **headers},
+        json={
+            "model": "openai/gpt-4o-mini",
+            "messages": [{"role": "user", "content": "Hi"}],
+        },
+    )
+
+
+def test_parse_traceparent():
+    """Test that only well-formed, valid traceparent headers are accepted."""
+    assert parse_traceparent(TRACEPARENT) == (TRACE_ID, PARENT_ID, True)
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00")[2] is False
+    assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def test_request_spans_join_the_incoming_trace(test_client, exporter):
+    """Test that a traced request records its phases under the caller's trace."""
+    assert chat(test_client, traceparent=TRACEPARENT).status_code == 200
+    tracer.force_flush()
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["POST /v1/chat/completions"]
+    assert root.parent_id == PARENT_ID
+    assert root.attributes["status_code"] == 200
+    assert root.attributes["model"] == "openai/gpt-4o-mini"
+    for name in ("auth", "route", "upstream", "serialize"):
+        assert spans[name].trace_id == TRACE_ID
+        assert spans[name].parent_id == root.span_id
+        assert spans[name].end_ns >= spans[name].start_ns
+
+
+def test_unsampled_caller_is_not_recorded(test_client, exporter):
+    """Test that a caller's decision not to sample is respected."""
+    chat(test_client, traceparent=f"00-{TRACE_ID}-{PARENT_ID}-00")
+    tracer.force_flush()
+
+    assert exporter.spans == []
+
+
+def test_spans_are_exported_in_batches_off_the_event_loop():
+    """Test that the exporter runs on the worker thread, a batch at a time."""
+    batches = []
+
+    class RecordingExporter(SpanExporter):
+        def export(self, spans):
+            batches.append((threading.current_thread().name, len(spans)))
+
+    local_tracer = Tracer()
+    local_tracer.configure(RecordingExporter(), max_batch_size=2)
+    for _ in range(5):
+        with local_tracer.span("work"):
+            pass
+    local_tracer.force_flush()
+
+    assert {thread for thread, _ in batches} == {"span-exporter"}
+    assert [size for _, size in batches] == [2, 2, 1]
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    """Test that spans are appended to the file one JSON object per line."""
+    path = tmp_path / "spans.jsonl"
+    local_tracer = Tracer()
+    local_tracer.configure(FileSpanExporter(str(path)))
+
+    with pytest.raises(ValueError), local_tracer.span("failing", model="m"):
+        raise ValueError("boom")
+    local_tracer.force_flush()
+
+    entry = json.loads(path.read_text().strip())
+    assert entry["name"] == "failing"
+    assert entry["status"] == "error"
+    assert entry["attributes"] == {"model": "m", "error.type": "ValueError"}